@@ -2,11 +2,13 @@
 # Android System Monitor - Raw Data Streaming + SQLite Storage
 # Outputs RAW data only - all calculations done on host side
 # Also stores data in local SQLite database for accurate export
-# Usage: adb shell /data/local/tmp/android_monitor_stream.sh [interval] [enable_tier1]
+# Usage: adb shell /data/local/tmp/android_monitor_stream.sh [interval] [enable_tier1] [per_core_format]
 
 INTERVAL=${1:-1}
 ENABLE_TIER1=${2:-0}  # 0=disabled, 1=enabled (Tier 1 metrics: ctxt, load, procs, irq%)
+PER_CORE_FORMAT=${3:-keyed}  # Streamed per_core_raw rows: keyed={"user":x,...}, flat=[user,nice,...]
 DB_PATH="/data/local/tmp/monitor.db"
+PID_FILE="/data/local/tmp/android_monitor.pid"
 
 # Initialize database (recreate to ensure schema is up to date)
 init_database() {
@@ -74,6 +76,20 @@ get_per_core_raw() {
     }' /proc/stat | sed 's/,$//'
 }
 
+# Get raw per-core CPU stats in both formats from one /proc/stat read
+# Returns: keyed objects (as get_per_core_raw) and flat rows [[user,nice,...], ...], separated by "|"
+get_per_core_raw_flat() {
+    awk '/^cpu[0-9]/ {
+        keyed = keyed sprintf("{\"user\":%s,\"nice\":%s,\"sys\":%s,\"idle\":%s,\"iowait\":%s,\"irq\":%s,\"softirq\":%s,\"steal\":%s},", $2,$3,$4,$5,$6,$7,$8,$9)
+        flat = flat sprintf("[%s,%s,%s,%s,%s,%s,%s,%s],", $2,$3,$4,$5,$6,$7,$8,$9)
+    }
+    END {
+        sub(/,$/, "", keyed)
+        sub(/,$/, "", flat)
+        print keyed "|" flat
+    }' /proc/stat
+}
+
 # Get CPU frequency per-core (kHz)
 get_per_core_freq() {
     result=""
@@ -487,6 +503,9 @@ get_disk_raw() {
 main() {
     echo "Starting raw data stream (interval: ${INTERVAL}s)" >&2
     
+    # Record our PID so the host can stop us without a pkill process scan
+    echo $$ > "$PID_FILE"
+    
     # Initialize database
     init_database
     
@@ -499,7 +518,13 @@ main() {
         
         # CPU data
         read cpu_user cpu_nice cpu_sys cpu_idle cpu_iowait cpu_irq cpu_softirq cpu_steal <<< $(get_cpu_raw)
-        per_core_stats=$(get_per_core_raw)
+        # Keyed per-core stats go to the database; the stream may use flat rows
+        if [ "$PER_CORE_FORMAT" = "flat" ]; then
+            IFS='|' read per_core_stats per_core_stream <<< "$(get_per_core_raw_flat)"
+        else
+            per_core_stats=$(get_per_core_raw)
+            per_core_stream=$per_core_stats
+        fi
         per_core_freq=$(get_per_core_freq)
         cpu_temp=$(get_cpu_temp_raw)
         cpu_power_uj=$(get_cpu_power_uj)
@@ -558,7 +583,7 @@ main() {
         printf '{"timestamp_ms":%s,"cpu_raw":{"user":%d,"nice":%d,"sys":%d,"idle":%d,"iowait":%d,"irq":%d,"softirq":%d,"steal":%d},"per_core_raw":[%s],"per_core_freq_khz":[%s],"cpu_temp_millideg":%d,"cpu_power_uj":%d,"mem_total_kb":%d,"mem_free_kb":%d,"mem_available_kb":%d,"gpu_driver":"%s","gpu_freq_mhz":%d,"gpu_runtime_ms":%d,"gpu_memory_used_bytes":%d,"gpu_memory_total_bytes":%d,"npu_info":"%s","net_rx_bytes":%d,"net_tx_bytes":%d,"disk_read_sectors":%d,"disk_write_sectors":%d,"ctxt":%s,"load_avg_1m":%s,"load_avg_5m":%s,"load_avg_15m":%s,"procs_running":%s,"procs_blocked":%s,"per_core_irq_pct":%s,"per_core_softirq_pct":%s,"interrupt_data":%s,"monitor_cpu_utime":%d,"monitor_cpu_stime":%d}\n' \
             "$TIMESTAMP_MS" \
             "$cpu_user" "$cpu_nice" "$cpu_sys" "$cpu_idle" "$cpu_iowait" "$cpu_irq" "$cpu_softirq" "$cpu_steal" \
-            "$per_core_stats" "$per_core_freq" "$cpu_temp" "$cpu_power_uj" \
+            "$per_core_stream" "$per_core_freq" "$cpu_temp" "$cpu_power_uj" \
             "$mem_total" "$mem_free" "$mem_available" \
             "$GPU_DRIVER" \
             "$gpu_freq" "$gpu_runtime" "$gpu_mem_used" "$gpu_mem_total" \
@@ -1524,7 +1524,7 @@ Note: Logging is always enabled. Use --export-format to auto-export when you qui
         print(f"📱 Device: {args.ip}:{args.port}")
         data_source = AndroidDataSource(args.ip, args.port, enable_tier1=enable_tier1)
     else:
-        data_source = LocalDataSource(enable_tier1=enable_tier1)
+        data_source = LocalDataSource(enable_tier1=enable_tier1, update_interval=args.interval)
     
     # Create monitor instance (logging always enabled)
     monitor = CLIMonitor(data_source=data_source, update_interval=args.interval)
@@ -1564,6 +1564,8 @@ Note: Logging is always enabled. Use --export-format to auto-export when you qui
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        data_source.disconnect()
         
     return 0
 
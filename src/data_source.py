@@ -10,10 +10,15 @@ The proxy pattern allows the UI to remain unchanged regardless of data source.
 """
 
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from typing import Dict, Optional
 import time
 
 
+# Sort key for interrupt lists; every entry has its rate set before sorting
+_IRQ_RATE_KEY = itemgetter('rate')
+
+
 class MonitorDataSource(ABC):
     """Abstract base class for monitoring data sources."""
     
@@ -107,18 +112,21 @@ class MonitorDataSource(ABC):
 class LocalDataSource(MonitorDataSource):
     """Local system data source using psutil."""
     
-    def __init__(self, enable_tier1: bool = False):
+    def __init__(self, enable_tier1: bool = False, update_interval: float = 1.0):
         """Initialize local data source.
         
         Args:
             enable_tier1: Enable Tier 1 metrics (context switches, load avg, process counts)
+            update_interval: Seconds between the caller's samples; the GPU
+                refresh thread reads the GPUs at the same rate
         """
         from monitors import (CPUMonitor, MemoryMonitor, GPUMonitor, 
                             NPUMonitor, NetworkMonitor, DiskMonitor)
         
         self.cpu_monitor = CPUMonitor()
         self.memory_monitor = MemoryMonitor()
-        self.gpu_monitor = GPUMonitor()
+        self.update_interval = update_interval
+        self.gpu_monitor = GPUMonitor(poll_interval=update_interval, background=True)
         self.npu_monitor = NPUMonitor()
         self.network_monitor = NetworkMonitor()
         self.disk_monitor = DiskMonitor()
@@ -127,11 +135,17 @@ class LocalDataSource(MonitorDataSource):
     
     def connect(self) -> bool:
         """Connect to local system (always successful)."""
+        if not self._connected:
+            # disconnect() closed the GPU monitor and its refresh thread
+            from monitors import GPUMonitor
+            self.gpu_monitor = GPUMonitor(poll_interval=self.update_interval, background=True)
         self._connected = True
         return True
     
     def disconnect(self):
-        """Disconnect from local system (no-op)."""
+        """Disconnect from local system and stop the GPU refresh thread."""
+        if self._connected:
+            self.gpu_monitor.close()
         self._connected = False
     
     def is_connected(self) -> bool:
@@ -352,7 +366,7 @@ class LocalDataSource(MonitorDataSource):
                     self._prev_interrupts_time_ms = current_time_ms
                     
                     # Sort by RATE (current activity) not total (cumulative since boot)
-                    interrupt_data.sort(key=lambda x: x.get('rate', 0), reverse=True)
+                    interrupt_data.sort(key=_IRQ_RATE_KEY, reverse=True)
                     top_interrupts = interrupt_data[:10]
                     
                     # Format as JSON with structure matching SSH format
@@ -443,7 +457,9 @@ class AndroidDataSource(MonitorDataSource):
         if not self.is_connected():
             return self._empty_cpu_info()
         
-        cpu_info = self.adb_monitor.get_cpu_info()
+        # Shallow copy: the monitor's results are frozen, and monitor_cpu_usage
+        # is added below (nested sections stay shared and read-only)
+        cpu_info = dict(self.adb_monitor.get_cpu_info())
         
         # Calculate monitor CPU usage from Android script data
         raw_data = self.adb_monitor.get_latest_data()
@@ -644,7 +660,7 @@ class AndroidDataSource(MonitorDataSource):
                 self._prev_android_interrupts[irq_key] = curr_total
             
             # Sort by RATE (current activity) not total (cumulative)
-            irq_list.sort(key=lambda x: x.get('rate', 0), reverse=True)
+            irq_list.sort(key=_IRQ_RATE_KEY, reverse=True)
             
             # Update the interrupt data with sorted list
             interrupt_data['interrupts'] = irq_list
@@ -1278,7 +1294,7 @@ class RemoteLinuxDataSource(MonitorDataSource):
                 self._prev_ssh_interrupts[irq_key] = curr_total
             
             # Sort by RATE (current activity) not total (cumulative)
-            irq_list.sort(key=lambda x: x.get('rate', 0), reverse=True)
+            irq_list.sort(key=_IRQ_RATE_KEY, reverse=True)
             
             # Update the interrupt data with sorted list
             interrupt_data['interrupts'] = irq_list
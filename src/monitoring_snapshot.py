@@ -6,9 +6,23 @@ populate, making UI and export code source-agnostic.
 """
 
 import time
+from collections.abc import Mapping
 from typing import Dict, Optional, Any
 
 
+def _plain(value: Any) -> Any:
+    """Recursively copy read-only results into plain dicts and lists.
+    
+    Some sources publish frozen results (MappingProxyType, tuples) that
+    json.dumps and the exporter's isinstance(dict/list) checks do not accept.
+    """
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
 class MonitoringSnapshot:
     """Unified snapshot of monitoring data across all source types.
     
@@ -70,23 +84,27 @@ class MonitoringSnapshot:
     def to_dict(self) -> Dict[str, Any]:
         """Convert snapshot to dictionary for export/logging.
         
+        Metric sections are copied into plain dicts and lists, so the result
+        can be serialized and modified even when a source publishes frozen
+        results.
+        
         Returns:
             Dictionary with all monitoring data
         """
         result = {
             'timestamp': self.timestamp,
             'time_seconds': self.time_seconds,
-            'cpu': self.cpu,
-            'memory': self.memory,
-            'gpu': self.gpu,
-            'npu': self.npu,
-            'network': self.network,
-            'disk': self.disk
+            'cpu': _plain(self.cpu),
+            'memory': _plain(self.memory),
+            'gpu': _plain(self.gpu),
+            'npu': _plain(self.npu),
+            'network': _plain(self.network),
+            'disk': _plain(self.disk)
         }
         
         # Only include tier1 if present
         if self.tier1 is not None:
-            result['tier1'] = self.tier1
+            result['tier1'] = _plain(self.tier1)
         
         return result
     
@@ -2,11 +2,176 @@
 Receives raw data from Android and performs all calculations on host side.
 """
 
+import os
+import re
+import selectors
+import socket
 import subprocess
 import json
 import threading
 import time
-from typing import Dict, Optional
+from queue import Queue, Full, Empty
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+
+# Optional faster JSON decoders for the sample stream (msgspec, then orjson,
+# then the stdlib). All accept bytes. Samples are decoded untyped so
+# raw_data stays a plain dict for get_latest_data() consumers (tier1 fields
+# vary by device and are read by key downstream).
+try:
+    import msgspec
+    _decode_json = msgspec.json.Decoder().decode
+    _JSON_DECODE_ERRORS = (msgspec.DecodeError, ValueError)
+except ImportError:
+    try:
+        import orjson
+        _decode_json = orjson.loads
+        _JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+    except ImportError:
+        _decode_json = json.loads
+        _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# Column order of the /proc/stat counters when stacked into a matrix
+_CPU_FIELDS = ('user', 'nice', 'sys', 'idle', 'iowait', 'irq', 'softirq', 'steal')
+
+
+def _stack_cpu_raw(cpu_raw: Dict, per_core_raw: list) -> np.ndarray:
+    """Stack /proc/stat counters into an (N + 1, 8) int64 matrix.
+    
+    Row 0 is the aggregate "cpu" line (a dict keyed by _CPU_FIELDS), rows
+    1..N the cores. Per-core rows may be flat ``[user, nice, ...]`` lists
+    (the streaming format) or keyed dicts (older scripts and the device DB).
+    """
+    rows = np.empty((len(per_core_raw) + 1, len(_CPU_FIELDS)), dtype=np.int64)
+    rows[0] = [cpu_raw[field] for field in _CPU_FIELDS]
+    if per_core_raw and isinstance(per_core_raw[0], dict):
+        rows[1:] = np.fromiter(
+            (core[field] for core in per_core_raw for field in _CPU_FIELDS),
+            dtype=np.int64,
+            count=len(per_core_raw) * len(_CPU_FIELDS)
+        ).reshape(-1, len(_CPU_FIELDS))
+    elif per_core_raw:
+        rows[1:] = per_core_raw
+    return rows
+
+
+def _cpu_usage_from_deltas(deltas: np.ndarray) -> np.ndarray:
+    """Usage percentage per row of an (N, 8) matrix of /proc/stat deltas."""
+    d_total = deltas.sum(axis=1)
+    d_active = d_total - deltas[:, 3] - deltas[:, 4]  # minus idle, iowait
+    return np.where(d_total > 0, d_active * 100.0 / np.maximum(d_total, 1), 0.0)
+
+
+# Unit conversions as multiplications (reciprocals computed once)
+_KB_TO_GB = 1.0 / (1024 * 1024)
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+_MS_TO_SEC = 1.0 / 1000
+
+
+# Intel NPU info string: intel-npu:freq_mhz:max_freq_mhz:mem_mb:util
+_NPU_RE = re.compile(r'intel-npu:(\d+):(\d+):(\d+):(\d+)')
+
+
+# Positions of each result in the published snapshot tuple
+_SNAP_CPU, _SNAP_MEMORY, _SNAP_GPU, _SNAP_NPU, _SNAP_NETWORK, _SNAP_DISK, _SNAP_RAW = range(7)
+
+# android_monitor_raw.sh writes its PID here on startup; stopping it by PID
+# avoids a pkill scan of every process on the device
+_DEVICE_PID_FILE = "/data/local/tmp/android_monitor.pid"
+_KILL_MONITOR_CMD = f"kill $(cat {_DEVICE_PID_FILE}) 2>/dev/null; rm -f {_DEVICE_PID_FILE}"
+
+# Local adb server; control commands talk to it directly instead of
+# spawning an adb client process per command. Like the adb client, honor
+# ANDROID_ADB_SERVER_PORT for servers not on the default port.
+_ADB_SERVER_HOST = '127.0.0.1'
+_ADB_DEFAULT_SERVER_PORT = 5037
+
+
+def _adb_server_request(service: str, serial: Optional[str] = None,
+                        timeout: float = 5.0) -> Optional[str]:
+    """Run one service on the local adb server (adb smart-socket protocol).
+    
+    Host services (``host:...``) return their length-prefixed reply;
+    device services (e.g. ``shell:...``) are routed to ``serial`` first and
+    return everything the device writes until it closes the stream.
+    
+    Returns None only if the server is unreachable or rejects the request,
+    so callers can fall back to the adb command line. Once the request is
+    accepted it may already be running on the device, so a later error or
+    timeout returns whatever was received instead of None.
+    """
+    def send(sock, request: str):
+        data = request.encode()
+        sock.sendall(b'%04x' % len(data) + data)
+        return sock.recv(4) == b'OKAY'
+    
+    try:
+        port = int(os.environ.get('ANDROID_ADB_SERVER_PORT', _ADB_DEFAULT_SERVER_PORT))
+        sock = socket.create_connection((_ADB_SERVER_HOST, port), timeout=timeout)
+    except (OSError, ValueError):
+        return None
+    
+    chunks = []
+    with sock:
+        try:
+            if serial and not send(sock, f"host:transport:{serial}"):
+                return None
+            if not send(sock, service):
+                return None
+            
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError as e:
+            print(f"⚠️  adb server request '{service}' incomplete: {e}")
+    
+    reply = b''.join(chunks)
+    if service.startswith('host:'):
+        reply = reply[4:]  # Strip the 4-hex-digit length prefix
+    return reply.decode(errors='replace')
+
+
+# Defaults published until the first sample arrives (and for GPU/NPU when
+# none is reported). Frozen all the way down like every published result,
+# so they are handed out as-is.
+_EMPTY_CPU_INFO = MappingProxyType({
+    'cpu_count': 0,
+    'physical_count': 0,
+    'usage': MappingProxyType({'total': 0, 'per_core': ()}),
+    'frequency': MappingProxyType({'average': 0, 'per_core': ()}),
+    'temperature': MappingProxyType({})
+})
+
+_EMPTY_MEMORY_INFO = MappingProxyType({
+    'memory': MappingProxyType({'total': 0, 'used': 0, 'free': 0, 'available': 0, 'percent': 0, 'speed': 0}),
+    'swap': MappingProxyType({'total': 0, 'used': 0, 'free': 0, 'percent': 0})
+})
+
+_EMPTY_GPU_INFO = MappingProxyType({'available': False, 'gpus': ()})
+
+_EMPTY_NPU_INFO = MappingProxyType({'available': False})
+
+_EMPTY_NETWORK_INFO = MappingProxyType({
+    'upload_speed': 0,
+    'download_speed': 0,
+    'connections': MappingProxyType({'total': 0, 'tcp_established': 0}),
+    'interfaces': (),
+    'interface_stats': MappingProxyType({}),
+    'io_stats': MappingProxyType({})
+})
+
+_EMPTY_DISK_INFO = MappingProxyType({
+    'read_speed_mb': 0,
+    'write_speed_mb': 0,
+    'partitions': MappingProxyType({}),
+    'disks': (),
+    'io_stats': MappingProxyType({}),
+    'partition_usage': ()
+})
 
 
 class ADBMonitorRaw:
@@ -25,24 +190,44 @@ class ADBMonitorRaw:
         self.device_id = f"{device_ip}:{port}"
         self.enable_tier1 = enable_tier1
         
-        # Latest data from Android (thread-safe)
-        self._data_lock = threading.Lock()
-        self._latest_raw_data = {}
+        # Previous sample, for delta calculations (processing thread only)
         self._previous_raw_data = {}
+        self._previous_cpu_rows = None  # Stacked counters of that sample
         
-        # Calculated results
-        self._cpu_info = self._empty_cpu_info()
-        self._memory_info = self._empty_memory_info()
-        self._gpu_info = self._empty_gpu_info()
-        self._npu_info = self._empty_npu_info()
-        self._network_info = self._empty_network_info()
-        self._disk_info = self._empty_disk_info()
+        # Frozen sections reused while their raw inputs stay the same, each
+        # with the inputs it was built from (processing thread only)
+        self._published_temperature = (None, _EMPTY_CPU_INFO['temperature'])
+        self._published_memory = (None, _EMPTY_MEMORY_INFO)
+        
+        # Set once the first sample has been processed
+        self._first_data = threading.Event()
+        
+        # Calculated results plus the latest raw sample, published together
+        # as one tuple. The processing thread builds a new tuple per sample
+        # and rebinds it in a single assignment, so getters read it without
+        # a lock and always see results from the same sample.
+        self._snapshot = (
+            self._empty_cpu_info(),
+            self._empty_memory_info(),
+            self._empty_gpu_info(),
+            self._empty_npu_info(),
+            self._empty_network_info(),
+            self._empty_disk_info(),
+            {}
+        )
         
         # ADB streaming process
         self._stream_process = None
         self._stream_thread = None
+        self._process_thread = None
         self._running = False
         
+        # Raw JSON lines handed from the reader thread to the processing
+        # thread, which decodes them; small so a stalled consumer drops old
+        # samples instead of letting the adb pipe back up
+        self._sample_queue: Queue = Queue(maxsize=4)
+        self._dropped_samples = 0
+        
         # Connect to device and start streaming
         self._connect()
         self.start_streaming()
@@ -51,162 +236,197 @@ class ADBMonitorRaw:
         """Connect to Android device via ADB."""
         print(f"🔌 Connecting to Android device {self.device_id}...")
         
-        result = subprocess.run(
-            ["adb", "connect", self.device_id],
-            capture_output=True,
-            text=True
-        )
+        output = _adb_server_request(f"host:connect:{self.device_id}")
+        if output is None:
+            # adb server not running yet: the adb client starts it
+            output = subprocess.run(
+                ["adb", "connect", self.device_id],
+                capture_output=True,
+                text=True
+            ).stdout
         
-        if "connected" in result.stdout.lower() or "already connected" in result.stdout.lower():
+        if "connected" in output.lower() or "already connected" in output.lower():
             print(f"✅ Connected to {self.device_id}")
         else:
-            raise ConnectionError(f"Failed to connect to {self.device_id}: {result.stdout}")
+            raise ConnectionError(f"Failed to connect to {self.device_id}: {output}")
     
     def _push_script(self):
-        """Push monitoring and frequency control scripts to Android device."""
-        scripts = [
-            ("scripts/android_monitor_raw.sh", "/data/local/tmp/android_monitor_raw.sh"),
-            ("scripts/android_freq_controller.sh", "/data/local/tmp/android_freq_controller.sh")
-        ]
+        """Push monitoring and frequency control scripts to Android device.
+        
+        Also kills any leftover monitor processes from a previous session.
+        Both scripts go to the same device directory, so a single
+        ``adb push`` uploads them; the cleanup and chmod steps share a
+        single ``adb shell`` round-trip.
+        """
+        device_dir = "/data/local/tmp"
+        local_paths = ["scripts/android_monitor_raw.sh", "scripts/android_freq_controller.sh"]
         
         print(f"📤 Pushing scripts to device...")
         
-        for local_path, device_path in scripts:
-            subprocess.run(
-                ["adb", "-s", self.device_id, "push", local_path, device_path],
-                capture_output=True
-            )
-            
-            subprocess.run(
-                ["adb", "-s", self.device_id, "shell", f"chmod 755 {device_path}"],
-                capture_output=True
-            )
+        subprocess.run(
+            ["adb", "-s", self.device_id, "push", *local_paths, device_dir + "/"],
+            capture_output=True
+        )
+        
+        # Make the scripts executable and kill any existing monitor process
+        # (cleanup zombies) in one shell session
+        device_paths = " ".join(f"{device_dir}/{os.path.basename(path)}" for path in local_paths)
+        try:
+            self._adb_shell(f"chmod 755 {device_paths}; {_KILL_MONITOR_CMD}", timeout=5)
+        except Exception as e:
+            print(f"⚠️  Failed to prepare scripts on device: {e}")
         
         print(f"✅ Monitor and frequency control scripts ready")
-
     
-    def _calculate_cpu_usage(self, curr, prev):
-        """Calculate CPU usage from raw /proc/stat values."""
-        if not prev:
-            return 0.0
-        
-        # Calculate deltas
-        d_user = curr['user'] - prev['user']
-        d_nice = curr['nice'] - prev['nice']
-        d_sys = curr['sys'] - prev['sys']
-        d_idle = curr['idle'] - prev['idle']
-        d_iowait = curr['iowait'] - prev['iowait']
-        d_irq = curr['irq'] - prev['irq']
-        d_softirq = curr['softirq'] - prev['softirq']
-        d_steal = curr['steal'] - prev['steal']
-        
-        d_total = d_user + d_nice + d_sys + d_idle + d_iowait + d_irq + d_softirq + d_steal
-        d_active = d_total - d_idle - d_iowait
-        
-        return (d_active * 100.0 / d_total) if d_total > 0 else 0.0
+    def _adb_shell(self, command: str, timeout: float) -> None:
+        """Run a short shell command on the device, via the adb server if possible.
+        
+        The adb client is only used when the server did not take the request,
+        so a command is never run twice.
+        """
+        if _adb_server_request(f"shell:{command}", serial=self.device_id,
+                               timeout=timeout) is None:
+            subprocess.run(
+                ["adb", "-s", self.device_id, "shell", command],
+                capture_output=True,
+                timeout=timeout
+            )
     
     def _process_raw_data(self, raw_data):
-        """Process raw data and calculate metrics."""
-        with self._data_lock:
-            prev = self._previous_raw_data.copy()
-            
-            # CPU info
-            cpu_usage = self._calculate_cpu_usage(raw_data['cpu_raw'], prev.get('cpu_raw', {}))
-            
-            # Per-core usage and freq
-            per_core_usage = []
-            per_core_freq = []
-            cpu_count = len(raw_data['per_core_raw'])
-            
-            for i, core in enumerate(raw_data['per_core_raw']):
-                prev_core = prev.get('per_core_raw', [{}])[i] if i < len(prev.get('per_core_raw', [])) else {}
-                core_usage = self._calculate_cpu_usage(core, prev_core)
-                per_core_usage.append(core_usage)
-                
-                # Frequency in MHz
-                core_freq_mhz = raw_data['per_core_freq_khz'][i] / 1000
-                per_core_freq.append(core_freq_mhz)
-            
-            avg_freq = sum(per_core_freq) / len(per_core_freq) if per_core_freq else 0
-            
-            # CPU power (Intel RAPL - calculate from energy delta)
-            cpu_power_uj = raw_data.get('cpu_power_uj', 0)
-            prev_cpu_power_uj = prev.get('cpu_power_uj', cpu_power_uj)
-            timestamp_ms = raw_data.get('timestamp_ms', 0)
+        """Process raw data and calculate metrics.
+        
+        Called only from the processing thread, which is also the only writer
+        of ``_previous_raw_data`` and ``_snapshot``, so no lock is needed.
+        """
+        # Read-only view of the previous sample; it is replaced wholesale
+        # (never mutated) when this sample is published below
+        prev = self._previous_raw_data
+        
+        # Local aliases for the lookups repeated throughout this function
+        rget = raw_data.get
+        pget = prev.get
+        
+        # CPU usage (total and per core)
+        cpu_rows = _stack_cpu_raw(raw_data['cpu_raw'], raw_data['per_core_raw'])
+        prev_rows = self._previous_cpu_rows
+        cpu_count = len(cpu_rows) - 1
+        
+        if prev_rows is None:
+            # First sample: no deltas yet, so every usage value is zero
+            cpu_usage = 0.0
+            per_core_usage = (0.0,) * cpu_count
+        else:
+            # Row 0 is the aggregate "cpu" line, rows 1..N the cores; one
+            # vectorized pass computes every delta and usage percentage.
+            # If the core count changed (hotplug), new cores read as zero.
+            common = min(len(cpu_rows), len(prev_rows))
+            usage = np.zeros(len(cpu_rows))
+            usage[:common] = _cpu_usage_from_deltas(cpu_rows[:common] - prev_rows[:common])
+            cpu_usage = usage[0].item()
+            per_core_usage = tuple(usage[1:].tolist())
+        
+        # Per-core frequency in MHz
+        freqs_mhz = np.asarray(raw_data['per_core_freq_khz'], dtype=np.float64) / 1000
+        per_core_freq = tuple(freqs_mhz.tolist())
+        avg_freq = freqs_mhz.mean().item() if freqs_mhz.size else 0
+        
+        # CPU power (Intel RAPL - calculate from energy delta)
+        cpu_power_uj = rget('cpu_power_uj', 0)
+        prev_cpu_power_uj = pget('cpu_power_uj', cpu_power_uj)
+        timestamp_ms = rget('timestamp_ms', 0)
+        
+        cpu_power_watts = 0.0
+        if cpu_power_uj > 0 and timestamp_ms > 0:
+            # Calculate energy delta (handle counter wrap-around)
+            energy_delta_uj = cpu_power_uj - prev_cpu_power_uj
+            if energy_delta_uj < 0:
+                # Counter wrapped around (assume 32-bit counter)
+                energy_delta_uj += (1 << 32)
             
-            cpu_power_watts = 0.0
-            if cpu_power_uj > 0 and timestamp_ms > 0:
-                # Calculate energy delta (handle counter wrap-around)
-                energy_delta_uj = cpu_power_uj - prev_cpu_power_uj
-                if energy_delta_uj < 0:
-                    # Counter wrapped around (assume 32-bit counter)
-                    energy_delta_uj += (1 << 32)
-                
-                # Calculate time delta in seconds
-                time_delta_ms = timestamp_ms - prev.get('timestamp_ms', timestamp_ms)
-                time_delta_sec = time_delta_ms / 1000.0 if time_delta_ms > 0 else 1.0
-                
-                # Power (Watts) = Energy (J) / Time (s)
-                # Energy (J) = energy_uj / 1,000,000
-                cpu_power_watts = (energy_delta_uj / 1_000_000.0) / time_delta_sec
+            # Calculate time delta in seconds
+            time_delta_ms = timestamp_ms - pget('timestamp_ms', timestamp_ms)
+            time_delta_sec = time_delta_ms * _MS_TO_SEC if time_delta_ms > 0 else 1.0
             
-            self._cpu_info = {
-                'cpu_count': cpu_count,
-                'physical_count': cpu_count,
-                'usage': {
-                    'total': cpu_usage,
-                    'per_core': per_core_usage
-                },
-                'frequency': {
-                    'average': avg_freq,
-                    'per_core': per_core_freq
-                },
-                'temperature': {
-                    'Thermal': [{
+            # Power (Watts) = Energy (J) / Time (s)
+            # Energy (J) = energy_uj / 1,000,000
+            cpu_power_watts = (energy_delta_uj / 1_000_000.0) / time_delta_sec
+        
+        # Temperature and memory rarely change between samples; reuse the
+        # frozen section built for the same raw inputs instead of a new one
+        cpu_temp_millideg = raw_data['cpu_temp_millideg']
+        published_temp_millideg, temperature = self._published_temperature
+        if cpu_temp_millideg != published_temp_millideg:
+            if cpu_temp_millideg > 0:
+                temperature = MappingProxyType({
+                    'Thermal': (MappingProxyType({
                         'label': 'CPU',
-                        'current': raw_data['cpu_temp_millideg'] / 1000.0,
+                        'current': cpu_temp_millideg / 1000.0,
                         'high': 100.0,
                         'critical': 105.0
-                    }]
-                } if raw_data['cpu_temp_millideg'] > 0 else {},
-                'power_watts': cpu_power_watts
-            }
-            
-            # Memory info
-            mem_total_gb = raw_data['mem_total_kb'] / 1024 / 1024
-            mem_available_gb = raw_data['mem_available_kb'] / 1024 / 1024
-            mem_free_gb = raw_data['mem_free_kb'] / 1024 / 1024
+                    }),)
+                })
+            else:
+                temperature = _EMPTY_CPU_INFO['temperature']
+            self._published_temperature = (cpu_temp_millideg, temperature)
+        
+        cpu_info = MappingProxyType({
+            'cpu_count': cpu_count,
+            'physical_count': cpu_count,
+            'usage': MappingProxyType({
+                'total': cpu_usage,
+                'per_core': per_core_usage
+            }),
+            'frequency': MappingProxyType({
+                'average': avg_freq,
+                'per_core': per_core_freq
+            }),
+            'temperature': temperature,
+            'power_watts': cpu_power_watts
+        })
+        
+        # Memory info
+        mem_kb = (raw_data['mem_total_kb'], raw_data['mem_available_kb'], raw_data['mem_free_kb'])
+        published_mem_kb, memory_info = self._published_memory
+        if mem_kb != published_mem_kb:
+            mem_total_kb, mem_available_kb, mem_free_kb = mem_kb
+            mem_total_gb = mem_total_kb * _KB_TO_GB
+            mem_available_gb = mem_available_kb * _KB_TO_GB
+            mem_free_gb = mem_free_kb * _KB_TO_GB
             mem_used_gb = mem_total_gb - mem_available_gb
             mem_percent = (mem_used_gb * 100.0 / mem_total_gb) if mem_total_gb > 0 else 0
             
-            self._memory_info = {
-                'memory': {
+            memory_info = MappingProxyType({
+                'memory': MappingProxyType({
                     'total': mem_total_gb,
                     'used': mem_used_gb,
                     'free': mem_free_gb,
                     'available': mem_available_gb,
                     'percent': mem_percent,
                     'speed': 0
-                },
-                'swap': {
+                }),
+                'swap': MappingProxyType({
                     'total': 0,
                     'used': 0,
                     'free': 0,
                     'percent': 0
-                }
-            }
-            
-            # GPU info
+                })
+            })
+            self._published_memory = (mem_kb, memory_info)
+        
+        # GPU info
+        gpu_freq_mhz = raw_data['gpu_freq_mhz']
+        has_gpu = gpu_freq_mhz > 0
+        if has_gpu:
             # Calculate GPU utilization from raw runtime/idle delta (host-side calculation)
             # Use ACTUAL time delta between samples, not assumed 1000ms
             # Support both i915 (runtime) and Xe (idle_residency) drivers
-            gpu_driver = raw_data.get('gpu_driver', 'i915')  # Default to i915 for backward compatibility
-            gpu_runtime_ms = raw_data.get('gpu_runtime_ms', 0)
-            prev_gpu_runtime_ms = prev.get('gpu_runtime_ms', gpu_runtime_ms)
-            prev_timestamp_ms = prev.get('timestamp_ms', timestamp_ms)
+            gpu_driver = rget('gpu_driver', 'i915')  # Default to i915 for backward compatibility
+            gpu_runtime_ms = rget('gpu_runtime_ms', 0)
+            prev_gpu_runtime_ms = pget('gpu_runtime_ms', gpu_runtime_ms)
+            prev_timestamp_ms = pget('timestamp_ms', timestamp_ms)
             
             gpu_util = 0
-            if all([gpu_runtime_ms, prev_gpu_runtime_ms, timestamp_ms, prev_timestamp_ms]):
+            if gpu_runtime_ms and prev_gpu_runtime_ms and timestamp_ms and prev_timestamp_ms:
                 runtime_delta = gpu_runtime_ms - prev_gpu_runtime_ms
                 time_delta = timestamp_ms - prev_timestamp_ms
                 
@@ -223,8 +443,8 @@ class ADBMonitorRaw:
                         gpu_util = max(0, min(100, gpu_util))
             
             # GPU memory from i915_gem_objects or xe fdinfo
-            gpu_mem_used_bytes = raw_data.get('gpu_memory_used_bytes', 0)
-            gpu_mem_total_bytes = raw_data.get('gpu_memory_total_bytes', 0)
+            gpu_mem_used_bytes = rget('gpu_memory_used_bytes', 0)
+            gpu_mem_total_bytes = rget('gpu_memory_total_bytes', 0)
             gpu_mem_used_mb = gpu_mem_used_bytes // (1024 * 1024)
             gpu_mem_total_mb = gpu_mem_total_bytes // (1024 * 1024)
             gpu_mem_util = 0.0
@@ -232,214 +452,279 @@ class ADBMonitorRaw:
                 # Keep one decimal place for low percentages (integrated GPU uses system RAM)
                 gpu_mem_util = round((gpu_mem_used_bytes / gpu_mem_total_bytes) * 100, 1)
             
-            self._gpu_info = {
-                'available': raw_data['gpu_freq_mhz'] > 0,
-                'gpus': [{
+            gpu_info = MappingProxyType({
+                'available': True,
+                'gpus': (MappingProxyType({
                     'name': 'Android GPU',
-                    'gpu_clock': raw_data['gpu_freq_mhz'],
-                    'clock_graphics': raw_data['gpu_freq_mhz'],
+                    'gpu_clock': gpu_freq_mhz,
+                    'clock_graphics': gpu_freq_mhz,
                     'gpu_util': gpu_util,  # Calculated on host from runtime delta
                     'memory_used': gpu_mem_used_mb,  # From i915_gem_objects
                     'memory_total': gpu_mem_total_mb,  # From i915_gem_objects
                     'memory_util': gpu_mem_util,  # Calculated from used/total
                     'temperature': 0
-                }] if raw_data['gpu_freq_mhz'] > 0 else []
-            }
-            
-            # Network info (calculate delta from previous sample)
-            # raw_data contains cumulative bytes, need to calculate speed
-            prev_net_rx = prev.get('net_rx_bytes', raw_data['net_rx_bytes'])
-            prev_net_tx = prev.get('net_tx_bytes', raw_data['net_tx_bytes'])
-            prev_timestamp_ms_net = prev.get('timestamp_ms', timestamp_ms)
-            
-            # Delta in bytes
-            delta_rx = max(0, raw_data['net_rx_bytes'] - prev_net_rx)
-            delta_tx = max(0, raw_data['net_tx_bytes'] - prev_net_tx)
-            
-            # Calculate actual time delta (in seconds)
-            time_delta_ms = timestamp_ms - prev_timestamp_ms_net
-            time_delta_sec = time_delta_ms / 1000.0 if time_delta_ms > 0 else 1.0
-            
-            # Calculate speed (bytes/sec) using actual time delta
-            upload_speed = delta_tx / time_delta_sec
-            download_speed = delta_rx / time_delta_sec
-            
-            # Match local monitor format - provide both top-level AND io_stats
-            self._network_info = {
-                'upload_speed': upload_speed,      # bytes/sec (top-level for DataSource)
-                'download_speed': download_speed,  # bytes/sec (top-level for DataSource)
-                'interfaces': [],
-                'interface_stats': {},
-                'io_stats': {
-                    'upload_speed': upload_speed,      # bytes/sec
-                    'download_speed': download_speed,  # bytes/sec
-                    'packets_sent': 0,
-                    'packets_recv': 0
-                },
-                'connections': {'total': 0, 'tcp_established': 0}
-            }
-            
-            # Disk info (calculate delta from previous sample)
-            # raw_data contains cumulative sectors
-            SECTOR_SIZE = 512
-            prev_read_sectors = prev.get('disk_read_sectors', raw_data['disk_read_sectors'])
-            prev_write_sectors = prev.get('disk_write_sectors', raw_data['disk_write_sectors'])
-            
-            # Delta in sectors
-            delta_read_sectors = max(0, raw_data['disk_read_sectors'] - prev_read_sectors)
-            delta_write_sectors = max(0, raw_data['disk_write_sectors'] - prev_write_sectors)
-            
-            # Convert to bytes/sec using actual time delta
-            read_bytes_per_sec = (delta_read_sectors * SECTOR_SIZE) / time_delta_sec
-            write_bytes_per_sec = (delta_write_sectors * SECTOR_SIZE) / time_delta_sec
-            
-            # Convert to MB/s
-            read_mb_s = read_bytes_per_sec / (1024 * 1024)
-            write_mb_s = write_bytes_per_sec / (1024 * 1024)
-            
-            # Also calculate IOPS (operations per second)
-            read_iops = delta_read_sectors / time_delta_sec
-            write_iops = delta_write_sectors / time_delta_sec
-            
-            self._disk_info = {
+                }),)
+            })
+        else:
+            # No tracked GPU: publish the shared read-only default
+            gpu_info = _EMPTY_GPU_INFO
+        
+        # Network info (calculate delta from previous sample)
+        # raw_data contains cumulative bytes, need to calculate speed
+        net_rx_bytes = raw_data['net_rx_bytes']
+        net_tx_bytes = raw_data['net_tx_bytes']
+        prev_net_rx = pget('net_rx_bytes', net_rx_bytes)
+        prev_net_tx = pget('net_tx_bytes', net_tx_bytes)
+        prev_timestamp_ms_net = pget('timestamp_ms', timestamp_ms)
+        
+        # Delta in bytes
+        delta_rx = max(0, net_rx_bytes - prev_net_rx)
+        delta_tx = max(0, net_tx_bytes - prev_net_tx)
+        
+        # Calculate actual time delta (in seconds)
+        time_delta_ms = timestamp_ms - prev_timestamp_ms_net
+        time_delta_sec = time_delta_ms * _MS_TO_SEC if time_delta_ms > 0 else 1.0
+        
+        # Calculate speed (bytes/sec) using actual time delta
+        upload_speed = delta_tx / time_delta_sec
+        download_speed = delta_rx / time_delta_sec
+        
+        # Match local monitor format - provide both top-level AND io_stats
+        network_info = MappingProxyType({
+            'upload_speed': upload_speed,      # bytes/sec (top-level for DataSource)
+            'download_speed': download_speed,  # bytes/sec (top-level for DataSource)
+            'interfaces': (),
+            'interface_stats': MappingProxyType({}),
+            'io_stats': MappingProxyType({
+                'upload_speed': upload_speed,      # bytes/sec
+                'download_speed': download_speed,  # bytes/sec
+                'packets_sent': 0,
+                'packets_recv': 0
+            }),
+            'connections': MappingProxyType({'total': 0, 'tcp_established': 0})
+        })
+        
+        # Disk info (calculate delta from previous sample)
+        # raw_data contains cumulative sectors
+        SECTOR_SIZE = 512
+        disk_read_sectors = raw_data['disk_read_sectors']
+        disk_write_sectors = raw_data['disk_write_sectors']
+        prev_read_sectors = pget('disk_read_sectors', disk_read_sectors)
+        prev_write_sectors = pget('disk_write_sectors', disk_write_sectors)
+        
+        # Delta in sectors
+        delta_read_sectors = max(0, disk_read_sectors - prev_read_sectors)
+        delta_write_sectors = max(0, disk_write_sectors - prev_write_sectors)
+        
+        # Convert to bytes/sec using actual time delta
+        read_bytes_per_sec = (delta_read_sectors * SECTOR_SIZE) / time_delta_sec
+        write_bytes_per_sec = (delta_write_sectors * SECTOR_SIZE) / time_delta_sec
+        
+        # Convert to MB/s
+        read_mb_s = read_bytes_per_sec * _BYTES_TO_MB
+        write_mb_s = write_bytes_per_sec * _BYTES_TO_MB
+        
+        # Also calculate IOPS (operations per second)
+        read_iops = delta_read_sectors / time_delta_sec
+        write_iops = delta_write_sectors / time_delta_sec
+        
+        disk_info = MappingProxyType({
+            'read_speed_mb': read_mb_s,
+            'write_speed_mb': write_mb_s,
+            'partitions': MappingProxyType({}),
+            'disks': (),
+            'io_stats': MappingProxyType({
+                'read_speed': read_bytes_per_sec,  # bytes/sec
+                'write_speed': write_bytes_per_sec,  # bytes/sec
                 'read_speed_mb': read_mb_s,
                 'write_speed_mb': write_mb_s,
-                'partitions': {},
-                'disks': [],
-                'io_stats': {
-                    'read_speed': read_bytes_per_sec,  # bytes/sec
-                    'write_speed': write_bytes_per_sec,  # bytes/sec
-                    'read_speed_mb': read_mb_s,
-                    'write_speed_mb': write_mb_s,
-                    'read_iops': read_iops,
-                    'write_iops': write_iops
-                },
-                'partition_usage': []
-            }
-            
-            # Save for next delta calculation
-            self._latest_raw_data = raw_data
-            self._previous_raw_data = raw_data
-            
-            # NPU info (parse from npu_info field, similar to SSH monitor)
-            npu_info_str = raw_data.get('npu_info', 'none')
-            if npu_info_str and npu_info_str != 'none':
-                # Parse Intel NPU info (format: intel-npu:freq_mhz:max_freq_mhz:mem_mb:util)
-                if npu_info_str.startswith('intel-npu:'):
-                    parts = npu_info_str.split(':')
-                    if len(parts) >= 5:
-                        self._npu_info = {
-                            'available': True,
-                            'platform': 'Intel NPU',
-                            'utilization': int(parts[4]),
-                            'frequency': int(parts[1]),
-                            'max_frequency': int(parts[2]),
-                            'memory_used': int(parts[3]),
-                            'power': 0
-                        }
-                else:
-                    self._npu_info = self._empty_npu_info()
-            else:
-                self._npu_info = self._empty_npu_info()
+                'read_iops': read_iops,
+                'write_iops': write_iops
+            }),
+            'partition_usage': ()
+        })
+        
+        # NPU info (parse from npu_info field, similar to SSH monitor)
+        npu_info_str = rget('npu_info', 'none')
+        npu_match = _NPU_RE.match(npu_info_str) if npu_info_str else None
+        if npu_match:
+            freq, max_freq, mem_used, util = map(int, npu_match.groups())
+            npu_info = MappingProxyType({
+                'available': True,
+                'platform': 'Intel NPU',
+                'utilization': util,
+                'frequency': freq,
+                'max_frequency': max_freq,
+                'memory_used': mem_used,
+                'power': 0
+            })
+        else:
+            # No NPU: publish the shared read-only default (no allocation)
+            npu_info = _EMPTY_NPU_INFO
+        
+        # Publish all results with a single reference rebind (atomic in
+        # CPython); getters never wait on the calculations above
+        self._snapshot = (cpu_info, memory_info, gpu_info, npu_info,
+                          network_info, disk_info, raw_data)
+        
+        # Save for next delta calculation
+        self._previous_raw_data = raw_data
+        self._previous_cpu_rows = cpu_rows
+        
+        self._first_data.set()
     
     def _stream_worker(self):
         """Background thread that reads streaming data from ADB."""
         device_script = "/data/local/tmp/android_monitor_raw.sh"
         
         # Start ADB shell command that streams JSON data
-        # Second parameter enables Tier 1 metrics (ctxt, load avg, proc counts, irq%)
+        # Second parameter enables Tier 1 metrics (ctxt, load avg, proc counts, irq%);
+        # the third asks for per-core counters as flat rows instead of keyed objects
         tier1_param = "1" if self.enable_tier1 else "0"
         self._stream_process = subprocess.Popen(
-            ["adb", "-s", self.device_id, "shell", "sh", device_script, "1", tier1_param],
+            ["adb", "-s", self.device_id, "shell", "sh", device_script, "1", tier1_param, "flat"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             stdin=subprocess.DEVNULL,  # Prevent adb from stealing stdin from curses
-            text=True,
-            bufsize=1
+            bufsize=0  # stdout is drained with os.read() below
         )
         
         print(f"🚀 Streaming started from Android device (raw data mode)")
         
-        # Skip "Starting" message
-        self._stream_process.stdout.readline()
+        fd = self._stream_process.stdout.fileno()
+        
+        # Wait for data with a timeout so a stop request is noticed within
+        # 200 ms instead of only when the next sample arrives
+        os.set_blocking(fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
         
-        # Buffer for incomplete JSON lines
-        json_buffer = ""
+        # Bytes read from the pipe but not yet split into lines
+        pending = bytearray()
+        
+        # Buffer for incomplete JSON lines. The script emits ASCII JSON, so
+        # bytes go straight to the decoder without a text decoding layer.
+        json_buffer = bytearray()
         
         while self._running:
             try:
-                # Read character by character to handle line wrapping
-                char = self._stream_process.stdout.read(1)
+                if not selector.select(timeout=0.2):
+                    continue
+                
+                # Pull whatever is available (up to 64 KB) in one syscall
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
                 
-                if not char:
+                if not chunk:
                     break
                 
-                # Add to buffer
-                json_buffer += char
+                pending.extend(chunk)
+                start = 0
                 
-                # Check if we have a complete JSON (ends with }\n)
-                if char == '\n' and json_buffer.strip().endswith('}'):
-                    # Remove any newlines within the JSON (from terminal wrapping)
-                    json_str = json_buffer.replace('\n', '').replace('\r', '').strip()
-                    
-                    # Parse JSON data
-                    try:
-                        raw_data = json.loads(json_str)
+                with memoryview(pending) as view:
+                    while True:
+                        nl = pending.find(b'\n', start)
+                        if nl < 0:
+                            break
+                        line_start, start = start, nl + 1
                         
-                        # Process raw data and calculate metrics
-                        self._process_raw_data(raw_data)
-                            
-                    except json.JSONDecodeError as e:
-                        # Skip invalid JSON
-                        print(f"⚠️  JSON parse error: {e}")
-                    
-                    # Reset buffer
-                    json_buffer = ""
+                        # Outside a sample, skip anything that is not JSON
+                        # (e.g. the "Starting" message)
+                        if not json_buffer and not pending.startswith(b'{', line_start):
+                            continue
+                        
+                        # Add to buffer (a sample may be split across lines by terminal wrapping)
+                        json_buffer += view[line_start:start]
+                        
+                        # Check if we have a complete JSON (ends with }\n)
+                        if not json_buffer.strip().endswith(b'}'):
+                            continue
+                        
+                        # Remove any newlines within the JSON (from terminal wrapping)
+                        json_bytes = json_buffer.replace(b'\n', b'').replace(b'\r', b'').strip()
+                        
+                        # Hand off to the processing thread (non-blocking);
+                        # decoding happens there so this loop only drains the pipe
+                        self._enqueue_sample(json_bytes)
+                        
+                        # Reset buffer
+                        json_buffer.clear()
+                
+                # Keep only the trailing partial line
+                del pending[:start]
                     
             except Exception as e:
                 print(f"⚠️  Stream error: {e}")
                 break
         
         # Cleanup
+        selector.close()
         if self._stream_process:
             self._stream_process.terminate()
             self._stream_process.wait()
     
+    def _enqueue_sample(self, json_bytes):
+        """Queue a raw sample for processing, dropping the oldest if full."""
+        try:
+            self._sample_queue.put_nowait(json_bytes)
+        except Full:
+            self._dropped_samples += 1
+            try:
+                self._sample_queue.get_nowait()  # Remove oldest
+            except Empty:
+                pass  # Consumer emptied it in the meantime
+            try:
+                self._sample_queue.put_nowait(json_bytes)
+            except Full:
+                pass  # If still fails, just drop this sample
+    
+    def _process_worker(self):
+        """Background thread that decodes queued samples and calculates metrics."""
+        while self._running:
+            try:
+                json_bytes = self._sample_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            
+            try:
+                raw_data = _decode_json(json_bytes)
+            except _JSON_DECODE_ERRORS as e:
+                # Skip invalid JSON
+                print(f"⚠️  JSON parse error: {e}")
+                continue
+            
+            try:
+                # Process raw data and calculate metrics
+                self._process_raw_data(raw_data)
+            except Exception as e:
+                print(f"⚠️  Processing error: {e}")
+    
     def start_streaming(self):
         """Start receiving data from Android device."""
         if self._running:
             return
         
-        # Kill any existing monitor processes on device (cleanup zombies)
+        # Push scripts to device (also cleans up existing monitor processes)
         print("🧹 Cleaning up any existing monitor processes...")
-        try:
-            subprocess.run(
-                ["adb", "-s", self.device_id, "shell", "pkill -f android_monitor"],
-                capture_output=True,
-                timeout=2
-            )
-            time.sleep(0.5)  # Give it time to cleanup
-        except Exception:
-            pass  # Ignore errors if no processes exist
-        
-        # Push script to device
         self._push_script()
+        time.sleep(0.5)  # Give it time to cleanup
         
-        # Start streaming thread
+        # Start processing and streaming threads
         self._running = True
+        self._first_data.clear()
+        self._process_thread = threading.Thread(target=self._process_worker, daemon=True)
+        self._process_thread.start()
         self._stream_thread = threading.Thread(target=self._stream_worker, daemon=True)
         self._stream_thread.start()
         
-        # Wait for first data
+        # Wait for first data (5 seconds timeout)
         print("⏳ Waiting for first data...")
-        for _ in range(50):  # 5 seconds timeout
-            with self._data_lock:
-                if self._cpu_info['cpu_count'] > 0:
-                    print("✅ Receiving and processing data from Android")
-                    return
-            time.sleep(0.1)
-        
-        print("⚠️  No data received yet, continuing anyway...")
+        if self._first_data.wait(timeout=5.0):
+            print("✅ Receiving and processing data from Android")
+        else:
+            print("⚠️  No data received yet, continuing anyway...")
     
     def stop_streaming(self):
         """Stop receiving data from Android device."""
@@ -448,6 +733,9 @@ class ADBMonitorRaw:
         if self._stream_thread:
             self._stream_thread.join(timeout=2.0)
         
+        if self._process_thread:
+            self._process_thread.join(timeout=2.0)
+        
         if self._stream_process:
             self._stream_process.terminate()
             self._stream_process.wait()
@@ -456,91 +744,61 @@ class ADBMonitorRaw:
         # This prevents zombie processes from accumulating
         print("🧹 Cleaning up Android monitor process...")
         try:
-            subprocess.run(
-                ["adb", "-s", self.device_id, "shell", "pkill -f android_monitor_raw.sh"],
-                capture_output=True,
-                timeout=2
-            )
+            self._adb_shell(_KILL_MONITOR_CMD, timeout=2)
         except Exception as e:
             print(f"⚠️  Failed to cleanup Android process: {e}")
     
-    def get_cpu_info(self) -> Dict:
+    # Getters hand out the published results as-is, without a lock or a
+    # copy. Every result is frozen (MappingProxyType, lists as tuples) and
+    # replaced rather than mutated, so callers can neither change what other
+    # readers see nor results that later samples reuse.
+    
+    def get_cpu_info(self) -> Mapping:
         """Get CPU information."""
-        with self._data_lock:
-            return self._cpu_info.copy()
+        return self._snapshot[_SNAP_CPU]
     
-    def get_memory_info(self) -> Dict:
+    def get_memory_info(self) -> Mapping:
         """Get memory information."""
-        with self._data_lock:
-            return self._memory_info.copy()
+        return self._snapshot[_SNAP_MEMORY]
     
-    def get_gpu_info(self) -> Dict:
+    def get_gpu_info(self) -> Mapping:
         """Get GPU information."""
-        with self._data_lock:
-            return self._gpu_info.copy()
+        return self._snapshot[_SNAP_GPU]
     
-    def get_npu_info(self) -> Dict:
+    def get_npu_info(self) -> Mapping:
         """Get NPU information."""
-        with self._data_lock:
-            return self._npu_info.copy()
+        return self._snapshot[_SNAP_NPU]
     
-    def get_network_info(self) -> Dict:
+    def get_network_info(self) -> Mapping:
         """Get network information."""
-        with self._data_lock:
-            return self._network_info.copy()
+        return self._snapshot[_SNAP_NETWORK]
     
-    def get_disk_info(self) -> Dict:
+    def get_disk_info(self) -> Mapping:
         """Get disk information."""
-        with self._data_lock:
-            return self._disk_info.copy()
+        return self._snapshot[_SNAP_DISK]
     
     def get_timestamp_ms(self) -> int:
         """Get Android device timestamp in milliseconds."""
-        with self._data_lock:
-            return self._latest_raw_data.get('timestamp_ms', 0)
+        return self._snapshot[_SNAP_RAW].get('timestamp_ms', 0)
     
     def get_latest_data(self) -> Dict:
         """Get latest raw data from Android device (for tier1 metrics access)."""
-        with self._data_lock:
-            return self._latest_raw_data.copy()
+        return self._snapshot[_SNAP_RAW].copy()
     
-    def _empty_cpu_info(self) -> Dict:
-        return {
-            'cpu_count': 0,
-            'physical_count': 0,
-            'usage': {'total': 0, 'per_core': []},
-            'frequency': {'average': 0, 'per_core': []},
-            'temperature': {}
-        }
+    def _empty_cpu_info(self) -> Mapping:
+        return _EMPTY_CPU_INFO
     
-    def _empty_memory_info(self) -> Dict:
-        return {
-            'memory': {'total': 0, 'used': 0, 'free': 0, 'available': 0, 'percent': 0, 'speed': 0},
-            'swap': {'total': 0, 'used': 0, 'free': 0, 'percent': 0}
-        }
+    def _empty_memory_info(self) -> Mapping:
+        return _EMPTY_MEMORY_INFO
     
-    def _empty_gpu_info(self) -> Dict:
-        return {'available': False, 'gpus': []}
+    def _empty_gpu_info(self) -> Mapping:
+        return _EMPTY_GPU_INFO
     
-    def _empty_npu_info(self) -> Dict:
-        return {'available': False}
+    def _empty_npu_info(self) -> Mapping:
+        return _EMPTY_NPU_INFO
     
-    def _empty_network_info(self) -> Dict:
-        return {
-            'upload_speed': 0,
-            'download_speed': 0,
-            'connections': {'total': 0, 'tcp_established': 0},
-            'interfaces': [],
-            'interface_stats': {},
-            'io_stats': {}
-        }
+    def _empty_network_info(self) -> Mapping:
+        return _EMPTY_NETWORK_INFO
     
-    def _empty_disk_info(self) -> Dict:
-        return {
-            'read_speed_mb': 0,
-            'write_speed_mb': 0,
-            'partitions': {},
-            'disks': [],
-            'io_stats': {},
-            'partition_usage': []
-        }
+    def _empty_disk_info(self) -> Mapping:
+        return _EMPTY_DISK_INFO
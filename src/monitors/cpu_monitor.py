@@ -4,7 +4,87 @@
 import psutil
 import os
 import glob
-from typing import Dict, List, Optional
+import ctypes
+import operator
+import platform
+import struct
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Intel RAPL package-0 energy counter (and its wrap-around range)
+_RAPL_ENERGY_PATH = '/sys/class/powercap/intel-rapl/intel-rapl:0/energy_uj'
+_RAPL_MAX_RANGE_PATH = '/sys/class/powercap/intel-rapl/intel-rapl:0/max_energy_range_uj'
+
+# perf RAPL PMU; its energy-pkg event is the package energy counter
+_PERF_POWER_DIR = '/sys/bus/event_source/devices/power'
+_PERF_ENERGY_EVENT = 'energy-pkg'
+_NR_PERF_EVENT_OPEN = {'x86_64': 298, 'i386': 336, 'i686': 336}
+_PERF_ATTR_SIZE = 64  # PERF_ATTR_SIZE_VER0; all later fields left zero
+
+
+def _open_rapl_perf_counter() -> Optional[Tuple[int, float]]:
+    """Open the perf power/energy-pkg counter.
+    
+    Returns (fd, microjoules per count), or None if the PMU or event is
+    missing or perf_event_open is not permitted (needs CAP_PERFMON or a
+    permissive perf_event_paranoid).
+    """
+    nr = _NR_PERF_EVENT_OPEN.get(platform.machine())
+    if nr is None:
+        return None
+    try:
+        with open(f'{_PERF_POWER_DIR}/type') as f:
+            pmu_type = int(f.read())
+        with open(f'{_PERF_POWER_DIR}/events/{_PERF_ENERGY_EVENT}') as f:
+            config = int(f.read().strip().split('=')[1], 0)  # "event=0x02"
+        with open(f'{_PERF_POWER_DIR}/events/{_PERF_ENERGY_EVENT}.scale') as f:
+            scale_uj = float(f.read()) * 1e6  # Joules per count -> uJ
+        with open(f'{_PERF_POWER_DIR}/cpumask') as f:
+            cpu = int(f.read().split(',')[0].split('-')[0])
+        
+        attr = ctypes.create_string_buffer(
+            struct.pack('IIQ', pmu_type, _PERF_ATTR_SIZE, config), _PERF_ATTR_SIZE)
+        libc = ctypes.CDLL(None, use_errno=True)
+        # perf_event_open(attr, pid=-1 (all), cpu, group_fd=-1, flags=0)
+        fd = libc.syscall(nr, attr, ctypes.c_long(-1), ctypes.c_long(cpu),
+                          ctypes.c_long(-1), ctypes.c_ulong(0))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return (fd, scale_uj) if fd >= 0 else None
+
+
+# Known CPU temperature sensor names, in order of preference
+_CPU_TEMP_SENSORS = ('coretemp', 'k10temp', 'cpu_thermal', 'soc_thermal')
+
+# The kernel recomputes load averages every 5 seconds
+_LOADAVG_TTL_SEC = 5.0
+
+# Per-core frequencies come from /proc/cpuinfo instead of cpufreq sysfs when
+# sysfs is missing, or when _SLOW_FREQ_SWEEPS sweeps in a row average over
+# _SLOW_FREQ_READ_SEC per scaling_cur_freq read (seconds) and cpuinfo has
+# "cpu MHz" lines; on some AMD systems each read can take a millisecond or more
+_CPUINFO_PATH = '/proc/cpuinfo'
+_SLOW_FREQ_READ_SEC = 500e-6
+_SLOW_FREQ_SWEEPS = 3
+
+# CPU time fields reported per core by get_per_core_details()
+_PER_CORE_TIME_FIELDS = ('user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq', 'steal')
+
+# get_all_info() refreshes temperature only every Nth call (it changes slowly)
+_TEMPERATURE_EVERY = 4
+
+# hwmon devices; each has a "name" file and tempN_input/tempN_label files
+_HWMON_DIR = '/sys/class/hwmon'
+
+
+def _total_and_idle(times) -> tuple:
+    """(total, idle) seconds of one cpu_times() entry, as psutil.cpu_percent counts them.
+    
+    guest/guest_nice are already included in user/nice on Linux, and
+    iowait counts as idle.
+    """
+    total = sum(times) - getattr(times, 'guest', 0) - getattr(times, 'guest_nice', 0)
+    return total, times.idle + getattr(times, 'iowait', 0)
 
 
 class CPUMonitor:
@@ -13,59 +93,205 @@ class CPUMonitor:
     def __init__(self):
         self.cpu_count = psutil.cpu_count(logical=True)
         self.physical_count = psutil.cpu_count(logical=False)
-        # Track the monitor process itself
+        # Track the monitor process itself; the first cpu_percent() call only
+        # starts the measurement
         self.monitor_process = psutil.Process()
+        self._monitor_cpu_initialized = False
+        try:
+            self.monitor_process.cpu_percent()
+            self._monitor_cpu_initialized = True
+        except Exception:
+            pass
+        # psutil reports process CPU summed over cores; scale to a per-core share
+        self._inv_cpu_count = 1.0 / self.cpu_count if self.cpu_count and self.cpu_count > 0 else 1.0
         
         # Intel RAPL power monitoring
         self._prev_energy_uj = None
         self._prev_energy_time = None
+        self._rapl_fd = None
+        self._rapl_max_range = 0
+        self._rapl_wrap_mask = 0  # max_range - 1 when the range is a power of two
+        self._rapl_perf_scale = 0.0  # uJ per count when _rapl_fd is a perf counter
         self._rapl_available = self._check_rapl_available()
+        
+        # sysfs frequency file descriptors, opened on first use and kept open
+        self._freq_fds = None
+        self._freq_use_cpuinfo = False
+        self._slow_freq_sweeps = 0  # Consecutive slow sysfs sweeps
+        self._freq_timed = True  # False once cpuinfo proved to be no alternative
+        
+        # Temperature sensor name and its open hwmon tempN_input files, as
+        # (label, fd) pairs. Without them get_temperature uses psutil.
+        self._temp_sensor = None
+        self._temp_fds = self._open_temp_inputs()
+        
+        # (monotonic time, value) of the last os.getloadavg() read
+        self._loadavg_cache = (float('-inf'), (0, 0, 0))
+        
+        # get_all_info() call counter and last values of throttled metrics
+        self._tick = 0
+        self._cached = {}
+        
+        # Per-core (total, idle) times of the previous sample; usage is the
+        # delta against it. Primed here so the first get_usage() has a baseline.
+        per_core_times = psutil.cpu_times(percpu=True)
+        self._prev_times = [_total_and_idle(t) for t in per_core_times]
+        
+        # Which per-core time fields this platform reports, fetched with one
+        # attrgetter call per core; the rest are reported as 0
+        available = getattr(per_core_times[0], '_fields', ()) if per_core_times else ()
+        self._time_fields = tuple(f for f in _PER_CORE_TIME_FIELDS if f in available)
+        if len(self._time_fields) < 2:
+            self._time_fields = ()  # Unknown layout (attrgetter needs 2+ fields to return a tuple)
+        self._missing_time_fields = {f: 0 for f in _PER_CORE_TIME_FIELDS if f not in self._time_fields}
+        self._times_getter = operator.attrgetter(*self._time_fields) if self._time_fields else (lambda times: ())
+        
+        # Whether psutil.cpu_stats() reports syscalls on this platform, probed once
+        try:
+            self._has_syscalls = hasattr(psutil.cpu_stats(), 'syscalls')
+        except Exception:
+            self._has_syscalls = False
     
     def _check_rapl_available(self) -> bool:
-        """Check if Intel RAPL is available for power monitoring."""
-        try:
-            rapl_path = '/sys/class/powercap/intel-rapl/intel-rapl:0/energy_uj'
-            with open(rapl_path, 'r') as f:
-                f.read()
+        """Check if Intel RAPL is available for power monitoring.
+        
+        Prefers the perf energy-pkg counter (a binary 64-bit read per sample);
+        otherwise keeps the powercap energy_uj file open and reads its
+        (constant) wrap-around range once.
+        """
+        perf_counter = _open_rapl_perf_counter()
+        if perf_counter is not None:
+            self._rapl_fd, self._rapl_perf_scale = perf_counter
             return True
-        except (FileNotFoundError, PermissionError):
+        
+        try:
+            fd = os.open(_RAPL_ENERGY_PATH, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            int(os.pread(fd, 32, 0))
+            with open(_RAPL_MAX_RANGE_PATH, 'r') as f:
+                self._rapl_max_range = int(f.read().strip())
+            max_range = self._rapl_max_range
+            if max_range > 0 and max_range & (max_range - 1) == 0:
+                self._rapl_wrap_mask = max_range - 1
+        except (OSError, ValueError):
+            os.close(fd)
             return False
+        self._rapl_fd = fd
+        return True
         
-    def get_usage(self) -> Dict:
-        """Get CPU usage statistics."""
+    def get_usage(self, per_core_times: Optional[List] = None) -> Dict:
+        """Get CPU usage statistics.
+        
+        Args:
+            per_core_times: psutil.cpu_times(percpu=True) result to reuse;
+                sampled here if not given
+        
+        Usage is the busy share of each core's times since the previous
+        call; the total is the mean across cores.
+        """
+        if per_core_times is None:
+            per_core_times = psutil.cpu_times(percpu=True)
+        per_core = self._usage_from_times(per_core_times)
         return {
-            'total': psutil.cpu_percent(interval=None),
-            'per_core': psutil.cpu_percent(interval=None, percpu=True),
-            'load_avg': os.getloadavg() if hasattr(os, 'getloadavg') else (0, 0, 0)
+            'total': sum(per_core) / len(per_core) if per_core else 0.0,
+            'per_core': per_core,
+            'load_avg': self._get_loadavg()
         }
     
+    def _get_loadavg(self) -> tuple:
+        """Load averages, re-read at most once per kernel update interval."""
+        now = time.monotonic()
+        read_at, load_avg = self._loadavg_cache
+        if now - read_at >= _LOADAVG_TTL_SEC and hasattr(os, 'getloadavg'):
+            load_avg = os.getloadavg()
+            self._loadavg_cache = (now, load_avg)
+        return load_avg
+    
+    def _usage_from_times(self, per_core_times) -> List[float]:
+        """Per-core usage percentages since the previous sample."""
+        curr = [_total_and_idle(t) for t in per_core_times]
+        prev, self._prev_times = self._prev_times, curr
+        if len(prev) != len(curr):
+            # Core count changed (hotplug): no baseline yet
+            return [0.0] * len(curr)
+        
+        usage = []
+        for (total, idle), (prev_total, prev_idle) in zip(curr, prev):
+            d_total = total - prev_total
+            if d_total <= 0:
+                usage.append(0.0)
+                continue
+            d_busy = d_total - (idle - prev_idle)
+            usage.append(round(min(100.0, max(0.0, d_busy * 100.0 / d_total)), 1))
+        return usage
+    
     def get_frequency(self) -> Dict:
-        """Get current CPU frequency for all cores."""
+        """Get current CPU frequency for all cores.
+        
+        Reads scaling_cur_freq through cached descriptors. /proc/cpuinfo is
+        used from then on if no cpufreq files exist, or if several sweeps in
+        a row are slow and cpuinfo reports per-core MHz.
+        """
         try:
-            freq_info = psutil.cpu_freq(percpu=True)
-            if freq_info:
-                # Return per_core as number array (MHz) to match Android format
-                return {
-                    'per_core': [f.current for f in freq_info],
-                    'average': sum(f.current for f in freq_info) / len(freq_info)
-                }
-            else:
-                # Fallback: read from sysfs
+            if self._freq_use_cpuinfo:
+                return self._get_frequency_from_cpuinfo()
+            
+            if self._freq_fds is None:
+                self._freq_fds = self._open_freq_fds()
+            if not self._freq_fds:
+                # No cpufreq sysfs at all
+                self._freq_use_cpuinfo = True
+                return self._get_frequency_from_cpuinfo()
+            if not self._freq_timed:
                 return self._get_frequency_from_sysfs()
+            
+            start = time.perf_counter()
+            freq = self._get_frequency_from_sysfs()
+            elapsed = time.perf_counter() - start
+            if elapsed <= _SLOW_FREQ_READ_SEC * len(self._freq_fds):
+                self._slow_freq_sweeps = 0
+                return freq
+            
+            # One slow sweep may be preemption or a cold cache; wait for a streak
+            self._slow_freq_sweeps += 1
+            if self._slow_freq_sweeps < _SLOW_FREQ_SWEEPS:
+                return freq
+            cpuinfo = self._get_frequency_from_cpuinfo()
+            if cpuinfo['per_core']:
+                self._freq_use_cpuinfo = True
+                return cpuinfo
+            # No "cpu MHz" lines (e.g. ARM): slow sysfs is the only source
+            self._freq_timed = False
+            return freq
         except Exception as e:
             print(f"Error getting CPU frequency: {e}")
             return {'per_core': [], 'average': 0}
     
+    def _open_freq_fds(self) -> List[int]:
+        """Open each core's scaling_cur_freq file once."""
+        fds = []
+        for cpu_id in range(self.cpu_count):
+            freq_path = f'/sys/devices/system/cpu/cpu{cpu_id}/cpufreq/scaling_cur_freq'
+            try:
+                fds.append(os.open(freq_path, os.O_RDONLY))
+            except OSError:
+                continue
+        return fds
+    
     def _get_frequency_from_sysfs(self) -> Dict:
         """Read CPU frequency directly from sysfs."""
+        if self._freq_fds is None:
+            self._freq_fds = self._open_freq_fds()
+        
         frequencies = []
-        for cpu_id in range(self.cpu_count):
-            freq_path = f'/sys/devices/system/cpu/cpu{cpu_id}/cpufreq/scaling_cur_freq'
+        for fd in self._freq_fds:
             try:
-                with open(freq_path, 'r') as f:
-                    freq_khz = int(f.read().strip())
-                    frequencies.append(freq_khz / 1000)  # Convert to MHz (number, not dict)
-            except (FileNotFoundError, PermissionError):
+                # Read from offset 0: sysfs regenerates the value on each read
+                freq_khz = int(os.pread(fd, 32, 0))
+                frequencies.append(freq_khz / 1000)  # Convert to MHz (number, not dict)
+            except (OSError, ValueError):
                 continue
         
         if frequencies:
@@ -73,22 +299,103 @@ class CPUMonitor:
             return {'per_core': frequencies, 'average': avg}
         return {'per_core': [], 'average': 0}
     
+    def _open_temp_inputs(self) -> List[Tuple[str, int]]:
+        """Find the preferred CPU hwmon devices and open their tempN_input files.
+        
+        Multi-socket hosts have one device per package under the same name
+        (e.g. two "coretemp"); all of them are opened. Entries follow
+        psutil's order and labelling, so readings look the same as
+        psutil.sensors_temperatures() output.
+        """
+        devices = {}
+        for hwmon in sorted(glob.glob(f'{_HWMON_DIR}/hwmon*')):
+            try:
+                with open(f'{hwmon}/name') as f:
+                    devices.setdefault(f.read().strip(), []).append(hwmon)
+            except OSError:
+                continue
+        
+        for name in _CPU_TEMP_SENSORS:
+            if name not in devices:
+                continue
+            input_paths = sorted(path for hwmon in devices[name]
+                                 for path in glob.glob(f'{hwmon}/temp*_input'))
+            temp_fds = []
+            for i, input_path in enumerate(input_paths):
+                try:
+                    with open(input_path[:-len('input')] + 'label') as f:
+                        label = f.read().strip()
+                except OSError:
+                    label = ''
+                try:
+                    temp_fds.append((label or f'Core {i}', os.open(input_path, os.O_RDONLY)))
+                except OSError:
+                    continue
+            if temp_fds:
+                self._temp_sensor = name
+                return temp_fds
+        return []
+    
+    def _close_temp_inputs(self):
+        """Close the cached hwmon temperature files."""
+        temp_fds, self._temp_fds = getattr(self, '_temp_fds', None) or [], []
+        for _, fd in temp_fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def _get_frequency_from_cpuinfo(self) -> Dict:
+        """Read per-core frequency from the "cpu MHz" lines of /proc/cpuinfo."""
+        frequencies = []
+        try:
+            with open(_CPUINFO_PATH, 'rb') as f:
+                for line in f:
+                    if line.startswith(b'cpu MHz'):
+                        frequencies.append(float(line.split(b':', 1)[1]))
+        except (OSError, ValueError, IndexError):
+            pass
+        
+        if frequencies:
+            return {'per_core': frequencies, 'average': sum(frequencies) / len(frequencies)}
+        return {'per_core': [], 'average': 0}
+    
     def get_temperature(self) -> Dict:
         """Get CPU temperature from sensors."""
+        if self._temp_fds:
+            try:
+                # tempN_input is in millidegrees Celsius
+                return {self._temp_sensor: [
+                    {'label': label, 'current': int(os.pread(fd, 16, 0)) / 1000.0}
+                    for label, fd in self._temp_fds
+                ]}
+            except (OSError, ValueError):
+                # Sensor went away (driver reload, hwmon renumbered after
+                # suspend): use psutil now and look the sensor up again
+                self._close_temp_inputs()
+                self._temp_sensor = None
+                self._temp_fds = self._open_temp_inputs()
+        
         temps = {}
         try:
             # Try psutil sensors
             if hasattr(psutil, 'sensors_temperatures'):
                 sensors = psutil.sensors_temperatures()
                 if sensors:
-                    # Look for common CPU temperature sensors
-                    for name in ['coretemp', 'k10temp', 'cpu_thermal', 'soc_thermal']:
-                        if name in sensors:
-                            temps[name] = [
-                                {'label': entry.label or f'Core {i}', 'current': entry.current}
-                                for i, entry in enumerate(sensors[name])
-                            ]
-                            break
+                    if self._temp_sensor not in sensors:
+                        # Look for common CPU temperature sensors (once, or
+                        # again after the cached one disappeared)
+                        for name in _CPU_TEMP_SENSORS:
+                            if name in sensors:
+                                self._temp_sensor = name
+                                break
+                    name = self._temp_sensor
+                    entries = sensors.get(name) if name else None
+                    if entries:
+                        temps[name] = [
+                            {'label': entry.label or f'Core {i}', 'current': entry.current}
+                            for i, entry in enumerate(entries)
+                        ]
         except Exception as e:
             print(f"Error reading temperature: {e}")
         
@@ -101,35 +408,30 @@ class CPUMonitor:
             'ctx_switches': stats.ctx_switches,
             'interrupts': stats.interrupts,
             'soft_interrupts': stats.soft_interrupts,
-            'syscalls': stats.syscalls if hasattr(stats, 'syscalls') else 0
+            'syscalls': stats.syscalls if self._has_syscalls else 0
         }
     
-    def get_per_core_details(self) -> List[Dict]:
+    def get_per_core_details(self, per_core_times: Optional[List] = None) -> List[Dict]:
         """Get per-core detailed CPU times including IRQ and SoftIRQ.
         
+        Args:
+            per_core_times: psutil.cpu_times(percpu=True) result to reuse;
+                sampled here if not given
+        
         Returns:
             List of dictionaries with per-core CPU time details
         """
         per_core_details = []
         try:
             # psutil.cpu_times(percpu=True) gives us per-core times including irq and softirq
-            per_core_times = psutil.cpu_times(percpu=True)
+            if per_core_times is None:
+                per_core_times = psutil.cpu_times(percpu=True)
             
-            for core_idx, times in enumerate(per_core_times):
-                core_data = {
-                    'core': core_idx,
-                    'times': {
-                        'user': getattr(times, 'user', 0),
-                        'nice': getattr(times, 'nice', 0),
-                        'system': getattr(times, 'system', 0),
-                        'idle': getattr(times, 'idle', 0),
-                        'iowait': getattr(times, 'iowait', 0),
-                        'irq': getattr(times, 'irq', 0),
-                        'softirq': getattr(times, 'softirq', 0),
-                        'steal': getattr(times, 'steal', 0) if hasattr(times, 'steal') else 0
-                    }
-                }
-                per_core_details.append(core_data)
+            fields, getter, missing = self._time_fields, self._times_getter, self._missing_time_fields
+            per_core_details = [
+                {'core': core_idx, 'times': {**dict(zip(fields, getter(times))), **missing}}
+                for core_idx, times in enumerate(per_core_times)
+            ]
         except Exception as e:
             print(f"Error getting per-core details: {e}")
         
@@ -141,21 +443,21 @@ class CPUMonitor:
             return None
         
         try:
-            import time
-            rapl_path = '/sys/class/powercap/intel-rapl/intel-rapl:0/energy_uj'
-            
-            with open(rapl_path, 'r') as f:
-                current_energy_uj = int(f.read().strip())
+            if self._rapl_perf_scale:
+                # 64-bit perf counter: never wraps in practice
+                count, = struct.unpack('Q', os.read(self._rapl_fd, 8))
+                current_energy_uj = count * self._rapl_perf_scale
+            else:
+                current_energy_uj = int(os.pread(self._rapl_fd, 32, 0))
             
             current_time = time.time()
             
             if self._prev_energy_uj is not None and self._prev_energy_time is not None:
-                with open('/sys/class/powercap/intel-rapl/intel-rapl:0/max_energy_range_uj', 'r') as f:
-                    max_range = int(f.read().strip())
-                
                 energy_delta_uj = current_energy_uj - self._prev_energy_uj
-                if energy_delta_uj < 0:  # Counter wrapped
-                    energy_delta_uj += max_range
+                if self._rapl_wrap_mask:
+                    energy_delta_uj &= self._rapl_wrap_mask  # Modular delta handles wrap
+                elif energy_delta_uj < 0:  # Counter wrapped
+                    energy_delta_uj += self._rapl_max_range
                 
                 time_delta_sec = current_time - self._prev_energy_time
                 
@@ -182,13 +484,24 @@ class CPUMonitor:
         except Exception as e:
             return None
     
+    def _throttled(self, key: str, every: int, getter):
+        """Return getter() on every Nth get_all_info() call, else the cached value."""
+        if self._tick % every == 0 or key not in self._cached:
+            self._cached[key] = getter()
+        return self._cached[key]
+    
     def get_all_info(self) -> Dict:
-        """Get all CPU monitoring information."""
+        """Get all CPU monitoring information.
+        
+        Temperature is refreshed every _TEMPERATURE_EVERY calls, so it can
+        be up to that many samples old. Counters (stats, per-core times) are
+        read on every call since callers derive rates from them.
+        """
         # Get monitor process CPU usage (percentage across all cores)
         # psutil returns cumulative CPU across all cores, so divide by cpu_count for per-core average
         try:
-            # First call initializes the measurement
-            if not hasattr(self, '_monitor_cpu_initialized'):
+            # Normally started in __init__; otherwise the first call starts it
+            if not self._monitor_cpu_initialized:
                 self.monitor_process.cpu_percent()
                 self._monitor_cpu_initialized = True
                 monitor_cpu_usage = 0.0
@@ -196,7 +509,7 @@ class CPUMonitor:
                 # Subsequent calls return actual usage
                 # Divide by cpu_count to get per-core percentage (same as system CPU usage display)
                 raw_usage = self.monitor_process.cpu_percent()
-                monitor_cpu_usage = raw_usage / self.cpu_count if self.cpu_count > 0 else raw_usage
+                monitor_cpu_usage = raw_usage * self._inv_cpu_count
         except Exception as e:
             monitor_cpu_usage = 0.0
         
@@ -208,18 +521,43 @@ class CPUMonitor:
             cpu_power = getattr(self, '_last_valid_power', None)
         else:
             self._last_valid_power = cpu_power  # Save for next iteration
+        
+        # One /proc/stat read feeds both usage and per-core details
+        per_core_times = psutil.cpu_times(percpu=True)
+                
+        temperature = self._throttled('temperature', _TEMPERATURE_EVERY, self.get_temperature)
+        self._tick += 1
                 
         return {
-            'usage': self.get_usage(),
+            'usage': self.get_usage(per_core_times),
             'frequency': self.get_frequency(),
-            'temperature': self.get_temperature(),
+            'temperature': temperature,
             'stats': self.get_stats(),
-            'per_core': self.get_per_core_details(),
+            'per_core': self.get_per_core_details(per_core_times),
             'cpu_count': self.cpu_count,
             'physical_count': self.physical_count,
             'monitor_cpu_usage': monitor_cpu_usage,
             'power_watts': cpu_power  # CPU package power in Watts (Intel RAPL)
         }
+    
+    def close(self):
+        """Close cached sysfs file descriptors."""
+        self._close_temp_inputs()
+        fds = list(getattr(self, '_freq_fds', None) or [])
+        if getattr(self, '_rapl_fd', None) is not None:
+            fds.append(self._rapl_fd)
+        self._freq_fds = None
+        self._rapl_fd = None
+        self._rapl_available = False
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def __del__(self):
+        """Release file descriptors when the monitor is garbage collected."""
+        self.close()
 
 
 if __name__ == '__main__':
@@ -2,8 +2,47 @@
 """Disk monitoring module for tracking I/O statistics and usage."""
 
 import psutil
+import operator
+import os
+import re
+import select
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# get_all_info() refreshes partitions and their usage, and the disk list,
+# only every Nth call
+_PARTITION_USAGE_EVERY = 10
+_DISKS_EVERY = 10
+
+# Per-disk counters read within this window (seconds) are shared between
+# get_disks() and per-disk get_io_stats() calls of the same tick
+_COUNTERS_MAX_AGE_SEC = 0.05
+
+# Byte unit conversions as multiplications
+_INV_GIB = 1.0 / (1 << 30)
+_INV_MIB = 1.0 / (1 << 20)
+
+# Per-disk counters diffed by get_io_stats(), kept as one tuple per disk
+_IO_FIELDS = ('read_bytes', 'write_bytes', 'read_count', 'write_count')
+_io_values = operator.attrgetter(*_IO_FIELDS)
+
+# Virtual/loopback device name prefixes, excluded by get_disks()
+_VIRTUAL_DISK_PREFIXES = ('loop', 'ram', 'dm-', 'sr', 'zram')
+
+# Mount table and kernel filesystem list (Linux), read directly by _scan_partitions
+_MOUNTS_PATH = '/proc/self/mounts'
+_FILESYSTEMS_PATH = '/proc/filesystems'
+
+# Octal escapes (e.g. \040 for a space) in mount table paths
+_MOUNT_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+def _physical_fstypes() -> frozenset:
+    """Filesystem types backed by a device, as psutil.disk_partitions(all=False) counts them."""
+    with open(_FILESYSTEMS_PATH) as f:
+        fstypes = {line.split()[-1] for line in f if line.strip() and not line.startswith('nodev')}
+    fstypes.add('zfs')
+    return frozenset(fstypes)
 
 
 class DiskMonitor:
@@ -13,26 +52,64 @@ class DiskMonitor:
         """Initialize disk monitor."""
         self.last_counters = {}
         self.last_time = time.time()
+        
+        # Previous busy_time (ms, Linux only) per disk, and the last get_io_stats()
+        # result per disk for get_io_utilization()
+        self._last_busy_time = {}
+        self._last_io_stats = {}
+        
+        # get_all_info() call counter and last values of throttled metrics
+        self._tick = 0
+        self._cached = {}
+        
+        # get_disks() results keyed by (device names, exclude_virtual)
+        self._disks_cache = {}
+        
+        # Latest psutil.disk_io_counters(perdisk=True) snapshot and when it was taken
+        self._cur_counters = None
+        self._cur_counters_ts = 0.0
+        
+        try:
+            self._fstypes = _physical_fstypes()
+        except OSError:
+            self._fstypes = None  # No /proc: _scan_partitions uses psutil
+        
+        # Parsed mount table entries, re-read by _scan_partitions only after the
+        # kernel flags a mount change (POLLPRI on the open mounts file)
+        self._mount_entries = None
+        self._mounts_fd = None
+        self._mounts_poll = None
+        if self._fstypes is not None:
+            try:
+                self._mounts_fd = os.open(_MOUNTS_PATH, os.O_RDONLY)
+                self._mounts_poll = select.poll()
+                self._mounts_poll.register(self._mounts_fd, select.POLLPRI)
+            except (OSError, AttributeError):  # AttributeError: no poll() on this platform
+                self.close()
+        
         self._initialize_counters()
     
     def _initialize_counters(self):
         """Initialize counters for speed calculation."""
         try:
             counters = psutil.disk_io_counters(perdisk=True)
-            self.last_counters = {
-                disk: {
-                    'read_bytes': stats.read_bytes,
-                    'write_bytes': stats.write_bytes,
-                    'read_count': stats.read_count,
-                    'write_count': stats.write_count,
-                }
-                for disk, stats in counters.items()
+            self.last_counters = {disk: _io_values(stats) for disk, stats in counters.items()}
+            self._last_busy_time = {
+                disk: stats.busy_time for disk, stats in counters.items() if hasattr(stats, 'busy_time')
             }
             self.last_time = time.time()
         except Exception as e:
             print(f"Error initializing disk counters: {e}")
             self.last_counters = {}
     
+    def _perdisk_counters(self) -> Dict:
+        """Per-disk I/O counters, re-read only if the last snapshot is stale."""
+        now = time.monotonic()
+        if self._cur_counters is None or now - self._cur_counters_ts > _COUNTERS_MAX_AGE_SEC:
+            self._cur_counters = psutil.disk_io_counters(perdisk=True)
+            self._cur_counters_ts = now
+        return self._cur_counters
+    
     def get_disks(self, exclude_virtual: bool = True) -> List[str]:
         """Get list of available disk devices.
         
@@ -43,15 +120,23 @@ class DiskMonitor:
             List of disk names (e.g., ['sda', 'nvme0n1'])
         """
         try:
-            counters = psutil.disk_io_counters(perdisk=True)
-            disks = list(counters.keys())
+            counters = self._perdisk_counters()
             
-            if exclude_virtual:
-                # Filter out virtual/loopback devices
-                virtual_prefixes = ('loop', 'ram', 'dm-', 'sr', 'zram')
-                disks = [d for d in disks if not d.startswith(virtual_prefixes)]
+            # The device set rarely changes: filter and sort once per set
+            key = (tuple(counters), exclude_virtual)
+            disks = self._disks_cache.get(key)
+            if disks is None:
+                disks = list(counters.keys())
+                
+                if exclude_virtual:
+                    # Filter out virtual/loopback devices
+                    disks = [d for d in disks if not d.startswith(_VIRTUAL_DISK_PREFIXES)]
+                
+                if len(self._disks_cache) >= 8:
+                    self._disks_cache.clear()  # Bound growth under device churn
+                disks = self._disks_cache[key] = sorted(disks)
             
-            return sorted(disks)
+            return list(disks)
         except Exception as e:
             print(f"Error getting disk list: {e}")
             return []
@@ -89,9 +174,9 @@ class DiskMonitor:
         try:
             usage = psutil.disk_usage(path)
             return {
-                'total': usage.total / (1024**3),  # GB
-                'used': usage.used / (1024**3),
-                'free': usage.free / (1024**3),
+                'total': usage.total * _INV_GIB,  # GB
+                'used': usage.used * _INV_GIB,
+                'free': usage.free * _INV_GIB,
                 'percent': usage.percent,
                 'path': path,
             }
@@ -118,6 +203,83 @@ class DiskMonitor:
         
         return usage_list
     
+    def _mounts_changed(self) -> bool:
+        """Whether the mount table must be re-read since the last _scan_partitions."""
+        if self._mount_entries is None or self._mounts_poll is None:
+            return True
+        try:
+            return bool(self._mounts_poll.poll(0))
+        except OSError:
+            return True
+    
+    def _read_mount_entries(self) -> List[Tuple[str, str, str, str]]:
+        """Parse device-backed (device, mountpoint, fstype, opts) entries from the mount table."""
+        with open(_MOUNTS_PATH) as f:
+            lines = f.read().splitlines()
+        
+        fstypes = self._fstypes
+        entries = []
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            device, mountpoint, fstype, opts = fields[:4]
+            if device == 'none' or fstype not in fstypes:
+                continue
+            mountpoint = _MOUNT_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), mountpoint)
+            entries.append((device, mountpoint, fstype, opts))
+        return entries
+    
+    def _scan_partitions(self) -> Tuple[List[Dict], List[Dict]]:
+        """Get the partition list and per-partition usage in one pass.
+        
+        Reads the mount table once and calls os.statvfs per mount, instead of
+        psutil.disk_partitions() plus one psutil.disk_usage() per partition.
+        The parsed mount table is reused until the kernel reports a mount
+        change. Entries match get_partitions() and get_all_partition_usage().
+        
+        Returns:
+            Tuple of (partitions, partition usage list)
+        """
+        try:
+            if self._fstypes is None:
+                raise OSError
+            if self._mounts_changed():
+                self._mount_entries = self._read_mount_entries()
+        except OSError:
+            return self.get_partitions(), self.get_all_partition_usage()
+        
+        partitions = []
+        usage_list = []
+        for device, mountpoint, fstype, opts in self._mount_entries:
+            partitions.append({
+                'device': device,
+                'mountpoint': mountpoint,
+                'fstype': fstype,
+                'opts': opts,
+            })
+            
+            try:
+                st = os.statvfs(mountpoint)
+            except OSError:
+                continue
+            # Same accounting as psutil.disk_usage()
+            total = st.f_blocks * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            total_user = used + free
+            usage_list.append({
+                'total': total * _INV_GIB,  # GB
+                'used': used * _INV_GIB,
+                'free': free * _INV_GIB,
+                'percent': round(used * 100 / total_user, 1) if total_user else 0.0,
+                'path': mountpoint,
+                'device': device,
+                'fstype': fstype,
+            })
+        
+        return partitions, usage_list
+    
     def get_io_stats(self, disk: Optional[str] = None) -> Dict:
         """Get I/O statistics and calculate speeds.
         
@@ -136,7 +298,7 @@ class DiskMonitor:
             
             if disk:
                 # Get specific disk
-                counters = psutil.disk_io_counters(perdisk=True)
+                counters = self._perdisk_counters()
                 if disk not in counters:
                     return {}
                 current = counters[disk]
@@ -145,32 +307,16 @@ class DiskMonitor:
                 current = psutil.disk_io_counters(perdisk=False)
                 disk = 'total'
             
-            # Calculate speeds
-            last = self.last_counters.get(disk, {
-                'read_bytes': current.read_bytes,
-                'write_bytes': current.write_bytes,
-                'read_count': current.read_count,
-                'write_count': current.write_count,
-            })
-            
-            read_bytes_delta = current.read_bytes - last.get('read_bytes', current.read_bytes)
-            write_bytes_delta = current.write_bytes - last.get('write_bytes', current.write_bytes)
-            read_count_delta = current.read_count - last.get('read_count', current.read_count)
-            write_count_delta = current.write_count - last.get('write_count', current.write_count)
-            
-            # Calculate speeds
-            read_speed = read_bytes_delta / time_delta  # bytes/sec
-            write_speed = write_bytes_delta / time_delta  # bytes/sec
-            read_iops = read_count_delta / time_delta  # operations/sec
-            write_iops = write_count_delta / time_delta  # operations/sec
+            # Calculate speeds (bytes/sec and operations/sec) in one pass over _IO_FIELDS
+            values = _io_values(current)
+            last = self.last_counters.get(disk, values)
+            inv_delta = 1.0 / time_delta
+            read_speed, write_speed, read_iops, write_iops = [
+                (cur - prev) * inv_delta for cur, prev in zip(values, last)
+            ]
             
             # Update last counters
-            self.last_counters[disk] = {
-                'read_bytes': current.read_bytes,
-                'write_bytes': current.write_bytes,
-                'read_count': current.read_count,
-                'write_count': current.write_count,
-            }
+            self.last_counters[disk] = values
             self.last_time = current_time
             
             result = {
@@ -180,8 +326,8 @@ class DiskMonitor:
                 'write_count': current.write_count,
                 'read_speed': read_speed,  # bytes/sec
                 'write_speed': write_speed,  # bytes/sec
-                'read_speed_mb': read_speed / (1024 * 1024),  # MB/s
-                'write_speed_mb': write_speed / (1024 * 1024),  # MB/s
+                'read_speed_mb': read_speed * _INV_MIB,  # MB/s
+                'write_speed_mb': write_speed * _INV_MIB,  # MB/s
                 'read_iops': read_iops,
                 'write_iops': write_iops,
             }
@@ -192,8 +338,14 @@ class DiskMonitor:
                 result['write_time'] = current.write_time
             
             if hasattr(current, 'busy_time'):
-                result['busy_time'] = current.busy_time
+                # busy_time is cumulative ms: busy ms per elapsed second / 10 is percent
+                busy_time = current.busy_time
+                busy_delta = busy_time - self._last_busy_time.get(disk, busy_time)
+                self._last_busy_time[disk] = busy_time
+                result['busy_time'] = busy_time
+                result['utilization'] = min(100.0, max(0.0, busy_delta * inv_delta * 0.1))
             
+            self._last_io_stats[disk] = result
             return result
             
         except Exception as e:
@@ -201,7 +353,11 @@ class DiskMonitor:
             return {}
     
     def get_io_utilization(self, disk: Optional[str] = None) -> float:
-        """Calculate I/O utilization percentage.
+        """Get I/O utilization percentage.
+        
+        Returns the 'utilization' of the latest get_io_stats() result for the
+        disk, so it does not re-read counters and reset the speed baseline.
+        Counters are only sampled here if get_io_stats() was never called.
         
         Args:
             disk: Specific disk or None for total
@@ -210,35 +366,58 @@ class DiskMonitor:
             I/O utilization percentage (0-100)
         """
         try:
-            stats = self.get_io_stats(disk)
-            if not stats or 'busy_time' not in stats:
-                return 0.0
-            
-            # Calculate utilization based on busy time
-            # This is a simplified calculation
-            busy_time = stats.get('busy_time', 0)
-            if busy_time > 0:
-                # Estimate utilization (this varies by system)
-                return min(100.0, (busy_time / 1000.0) % 100)
-            return 0.0
+            stats = self._last_io_stats.get(disk or 'total')
+            if stats is None:
+                stats = self.get_io_stats(disk)
+            return stats.get('utilization', 0.0)
         except Exception:
             return 0.0
     
+    def _throttled(self, key: str, every: int, getter):
+        """Return getter() on every Nth get_all_info() call, else the cached value."""
+        if self._tick % every == 0 or key not in self._cached:
+            self._cached[key] = getter()
+        return self._cached[key]
+    
     def get_all_info(self, disk: Optional[str] = None) -> Dict:
         """Get comprehensive disk information.
         
+        The partition list and usage are refreshed every
+        _PARTITION_USAGE_EVERY calls and the disk list every _DISKS_EVERY
+        calls, so they can be up to that many samples old (a hot-plugged
+        disk shows up within that bound). I/O stats are read on every call.
+        
         Args:
             disk: Specific disk or None for total
             
         Returns:
             Dict with all disk information
         """
-        return {
-            'disks': self.get_disks(),
-            'partitions': self.get_partitions(),
-            'partition_usage': self.get_all_partition_usage(),
+        partitions, partition_usage = self._throttled(
+            'partitions', _PARTITION_USAGE_EVERY, self._scan_partitions)
+        info = {
+            'disks': self._throttled('disks', _DISKS_EVERY, self.get_disks),
+            'partitions': partitions,
+            'partition_usage': partition_usage,
             'io_stats': self.get_io_stats(disk),
         }
+        self._tick += 1
+        return info
+    
+    def close(self):
+        """Close the watched mount table descriptor."""
+        fd = getattr(self, '_mounts_fd', None)
+        self._mounts_fd = None
+        self._mounts_poll = None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def __del__(self):
+        """Release the mount table descriptor when the monitor is garbage collected."""
+        self.close()
 
 
 if __name__ == '__main__':
@@ -2,22 +2,183 @@
 """GPU monitoring module supporting NVIDIA, AMD, and Intel GPUs."""
 
 import subprocess
+import concurrent.futures
+import ctypes
+import errno
+import functools
 import re
 import os
+import shutil
+import sys
 import json
-from typing import Dict, List, Optional
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+# DRM card directories and the PCI vendor IDs GPUMonitor recognizes
+_DRM_DIR = '/sys/class/drm'
+_INTEL_VENDOR, _NVIDIA_VENDOR, _AMD_VENDOR = 0x8086, 0x10de, 0x1002
+_VENDOR_GPU_TYPES = {_INTEL_VENDOR: 'intel', _NVIDIA_VENDOR: 'nvidia', _AMD_VENDOR: 'amd'}
+
+# DRM debugfs directory names tried for the Intel GPU, in order
+_DEBUGFS_DRI_VARIANTS = ('0000:00:02.0', '1', '128', '0')
+
+# Per-process fd and fdinfo directories scanned for DRM client memory
+_PROC_DIR = '/proc'
+
+# MemTotal is the first line of /proc/meminfo; integrated GPUs share system RAM
+_MEMINFO_PATH = '/proc/meminfo'
+
+# Xe client fdinfo: driver name and GTT/system memory totals. The kernel prints
+# sizes as bytes, KiB or MiB, e.g. "drm-total-gtt:\t25984 KiB"
+_FDINFO_XE_DRIVER_RE = re.compile(rb'^drm-driver:\s*xe\b', re.MULTILINE)
+_FDINFO_XE_MEM_RE = re.compile(rb'^drm-total-(?:gtt|system):[ \t]*(\d+)(?:[ \t]+(KiB|MiB))?[ \t]*$',
+                               re.MULTILINE)
+_FDINFO_UNIT_BYTES = {b'': 1, b'KiB': 1024, b'MiB': 1024 * 1024}
+
+# Seconds the /proc fdinfo walk is skipped after it found no Xe clients
+_XE_NO_CLIENTS_RESCAN_SEC = 30.0
+
+# rcs0 (Render/3D engine) busy time in i915_engine_info: the first
+# "Runtime: <n>ms" within 20 lines of the "rcs0" header line
+_RCS0_RUNTIME_RE = re.compile(r'^[ \t]*rcs0[ \t]*\n(?:[^\n]*\n){0,18}?[^\n]*?Runtime:[ \t]*(\d+)ms',
+                              re.MULTILINE)
+
+# i915_gem_objects: bytes in use at the end of the first line
+# ("3787 shrinkable [0 free] objects, 4150968320 bytes") and the system
+# memory region size ("system: total:0x0000000f9effa000 bytes")
+_I915_GEM_USED_RE = re.compile(r',\s*(\d+)\s*bytes')
+_I915_SYSTEM_TOTAL_RE = re.compile(r'system: total:(0x[0-9a-fA-F]+)')
+
+# Results of get_*_info() younger than this (seconds) are returned again
+# instead of re-reading the GPU; GPU_POLL_INTERVAL_SECONDS overrides it
+_DEFAULT_POLL_INTERVAL = 0.5
+
+
+def _clamp_percent(value: int) -> int:
+    """Clamp an integer percentage to 0-100."""
+    return 0 if value < 0 else 100 if value > 100 else value
+
+
+def _scan_drm_cards() -> List[Tuple[int, int]]:
+    """List (card number, PCI vendor ID) for each DRM card, in card order.
+    
+    One directory read of /sys/class/drm; connector nodes (card0-DP-1, ...)
+    and cards without a readable vendor file are skipped.
+    """
+    try:
+        with os.scandir(_DRM_DIR) as entries:
+            names = [e.name for e in entries if e.name.startswith('card') and e.name[4:].isdigit()]
+    except OSError:
+        return []
+    
+    cards = []
+    for name in names:
+        try:
+            with open(f'{_DRM_DIR}/{name}/device/vendor', 'r') as f:
+                vendor = int(f.read().strip(), 16)  # '0x8086' or '8086'
+        except (OSError, ValueError):
+            continue
+        cards.append((int(name[4:]), vendor))
+    cards.sort()
+    return cards
+
+
+def _read_pci_slot_name(uevent_path: str) -> Optional[str]:
+    """PCI address (PCI_SLOT_NAME) from a device uevent file, or None."""
+    with open(uevent_path, 'r') as f:
+        content = f.read()
+    start = content.find('PCI_SLOT_NAME=')
+    if start < 0:
+        return None
+    start += len('PCI_SLOT_NAME=')
+    end = content.find('\n', start)
+    return content[start:end if end >= 0 else len(content)].strip()
+
+
+@functools.lru_cache(maxsize=8)
+def _lspci(pci_addr: str) -> Optional[str]:
+    """'lspci -s <addr>' output, run once per address; None if it fails."""
+    try:
+        result = subprocess.run(['lspci', '-s', pci_addr], capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _read_mem_total() -> int:
+    """Return MemTotal in bytes from the first line of /proc/meminfo, or 0."""
+    try:
+        fd = os.open(_MEMINFO_PATH, os.O_RDONLY)
+        try:
+            first_line = os.pread(fd, 64, 0).split(b'\n', 1)[0]
+        finally:
+            os.close(fd)
+        label, total_kb = first_line.split()[:2]
+        return int(total_kb) * 1024 if label == b'MemTotal:' else 0
+    except (OSError, ValueError):
+        return 0
+
+
+def _nvml_loadable() -> bool:
+    """Whether the NVIDIA driver's NVML library loads, checked without importing pynvml."""
+    if not sys.platform.startswith('linux'):
+        return True  # pynvml locates nvml.dll itself on other platforms
+    try:
+        ctypes.CDLL('libnvidia-ml.so.1')
+    except OSError:
+        return False
+    return True
 
 
 class GPUMonitor:
     """Monitor GPU usage, frequency, temperature, and memory."""
     
-    def __init__(self):
+    def __init__(self, poll_interval: Optional[float] = None, background: bool = False):
+        """Initialize GPU monitor.
+        
+        Args:
+            poll_interval: Minimum seconds between GPU reads; calls within it
+                return the previous result. Defaults to the
+                GPU_POLL_INTERVAL_SECONDS environment variable, else 0.5.
+            background: Read the GPUs in a daemon thread every poll_interval;
+                get_*_info() then returns the latest snapshot without blocking
+                on debugfs/fdinfo/NVML reads. Pass the caller's sampling
+                period as poll_interval, and call close() when done
+        """
+        if poll_interval is None:
+            try:
+                poll_interval = float(os.environ.get('GPU_POLL_INTERVAL_SECONDS', _DEFAULT_POLL_INTERVAL))
+            except ValueError:
+                poll_interval = _DEFAULT_POLL_INTERVAL
+        self.poll_interval = poll_interval
+        
+        # Last get_*_info() result per GPU: key -> (monotonic time, info)
+        self._info_cache = {}
+        
+        # DRM cards and vendors, shared by detection and the sysfs readers
+        self._drm_cards = _scan_drm_cards()
+        
+        # Background refresh: collectors and snapshot are replaced, never
+        # mutated, so readers need no lock; writers serialize on _publish_lock
+        self.background = background
+        self._collectors = {}
+        self._snapshot = {}
+        self._publish_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._worker = None
+        
+        # Pool reading several GPUs at once in get_all_info(), created on first use
+        self._executor = None
+        
         self.gpu_type = self._detect_gpu_type()
         self.nvidia_available = self.gpu_type == 'nvidia'
         self.amd_available = self.gpu_type == 'amd'
         self.intel_available = self.gpu_type == 'intel'
         
-        # Previous sample for delta calculation (Intel i915 GPU)
+        # Previous sample for delta calculation (Intel i915 GPU);
+        # timestamps are time.monotonic_ns()
         self._prev_intel_runtime_ms = None
         self._prev_intel_timestamp = None
         
@@ -25,12 +186,72 @@ class GPUMonitor:
         self._prev_xe_idle_ms = None
         self._prev_xe_timestamp = None
         
+        # System RAM reported as Xe memory total; read on first use, it never changes
+        self._mem_total_bytes = None
+        
+        # Monotonic time before which an idle Xe GPU (no clients) is not rescanned
+        self._xe_rescan_after = 0.0
+        
+        # Intel card discovered once; get_intel_info() only reads these paths
+        self._intel_card_num = None
+        self._intel_name = 'Intel GPU'
+        self._intel_driver = None  # 'xe' or 'i915'
+        self._intel_freq_path = None
+        self._intel_xe_card_num = None
+        self._intel_xe_idle_path = None
+        
+        # Descriptors of the frequency and Xe idle files, re-read with os.pread
+        self._intel_freq_fd = None
+        self._intel_xe_idle_fd = None
+        
+        # i915 debugfs files and whether they open directly (root or
+        # CAP_DAC_READ_SEARCH) or need the 'sudo -n cat' fallback
+        self._i915_engine_path = None
+        self._i915_engine_direct = False
+        self._i915_gem_path = None
+        self._i915_gem_direct = False
+        
+        # i915 system memory region size, parsed from the first GEM sample
+        self._i915_total_bytes = None
+        
+        # Intel collector for the detected driver, chosen by _discover_intel()
+        self._collect_intel = self._collect_intel_info
+        if self.intel_available:
+            self._discover_intel()
+        
+        # amdgpu sysfs counters: key -> path, found by _discover_amd()
+        self._amd_sysfs_paths = {}
+        self._rocm_smi = None
+        if self.amd_available:
+            self._discover_amd()
+        
+        # Identity of a driverless NVIDIA card, read on the first sysfs fallback
+        self._nv_sysfs_name = None
+        
+        if self.nvidia_available and not _nvml_loadable():
+            # NVIDIA card without the proprietary driver (e.g. nouveau): sysfs only
+            self.nvidia_available = False
+        
         if self.nvidia_available:
             try:
                 import pynvml
                 self.pynvml = pynvml
                 self.pynvml.nvmlInit()
                 self.device_count = self.pynvml.nvmlDeviceGetCount()
+                
+                # Device handles and names never change while NVML is initialized
+                self._nv_handles = [self.pynvml.nvmlDeviceGetHandleByIndex(i)
+                                    for i in range(self.device_count)]
+                self._nv_names = []
+                for handle in self._nv_handles:
+                    name = self.pynvml.nvmlDeviceGetName(handle)
+                    if isinstance(name, bytes):
+                        name = name.decode('utf-8')
+                    self._nv_names.append(name)
+                
+                # (device_id, query) pairs that returned NVML_ERROR_NOT_SUPPORTED;
+                # they are not retried on later polls
+                self._nv_unsupported = set()
             except Exception as e:
                 print(f"NVIDIA GPU detected but pynvml failed: {e}")
                 self.nvidia_available = False
@@ -43,17 +264,13 @@ class GPUMonitor:
             if gpu_info:
                 return gpu_info
             
-            # Fallback to command-line tools
+            # Fallback to command-line tools (PATH lookup, no fork)
             # Check for NVIDIA
-            result = subprocess.run(['which', 'nvidia-smi'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            if shutil.which('nvidia-smi'):
                 return 'nvidia'
             
             # Check for AMD
-            result = subprocess.run(['which', 'rocm-smi'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            if shutil.which('rocm-smi'):
                 return 'amd'
             
             # Check for Mali/other ARM GPUs
@@ -65,47 +282,31 @@ class GPUMonitor:
         
         return None
     
+    def _first_card(self, vendor: int) -> Optional[int]:
+        """Number of the first DRM card with the given PCI vendor ID, or None."""
+        for card_num, card_vendor in self._drm_cards:
+            if card_vendor == vendor:
+                return card_num
+        return None
+    
     def _detect_gpu_via_sysfs(self) -> Optional[str]:
         """Detect GPU type by reading sysfs vendor IDs."""
-        try:
-            # Check all DRM cards
-            for card_num in range(10):
-                vendor_path = f'/sys/class/drm/card{card_num}/device/vendor'
-                if os.path.exists(vendor_path):
-                    with open(vendor_path, 'r') as f:
-                        vendor_id = f.read().strip()
-                        # Intel: 0x8086, NVIDIA: 0x10de, AMD: 0x1002
-                        if vendor_id in ['0x8086', '8086']:
-                            return 'intel'
-                        elif vendor_id in ['0x10de', '10de']:
-                            return 'nvidia'
-                        elif vendor_id in ['0x1002', '1002']:
-                            return 'amd'
-        except Exception:
-            pass
+        # First DRM card with a known vendor (Intel: 0x8086, NVIDIA: 0x10de, AMD: 0x1002)
+        for _card_num, vendor in self._drm_cards:
+            gpu_type = _VENDOR_GPU_TYPES.get(vendor)
+            if gpu_type:
+                return gpu_type
         return None
     
     def _check_intel_gpu(self) -> bool:
         """Check if Intel GPU is present."""
         try:
             # Check for Intel GPU via sysfs
-            intel_gpu_paths = [
-                '/sys/class/drm/card0/device/vendor',
-                '/sys/class/drm/card1/device/vendor',
-            ]
-            
-            for path in intel_gpu_paths:
-                if os.path.exists(path):
-                    with open(path, 'r') as f:
-                        vendor_id = f.read().strip()
-                        # Intel vendor ID is 0x8086
-                        if vendor_id in ['0x8086', '8086']:
-                            return True
+            if self._first_card(_INTEL_VENDOR) is not None:
+                return True
             
             # Check for intel_gpu_top command
-            result = subprocess.run(['which', 'intel_gpu_top'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            if shutil.which('intel_gpu_top'):
                 return True
                 
         except Exception:
@@ -124,67 +325,187 @@ class GPUMonitor:
             pass
         return False
     
+    def _discover_intel(self):
+        """Locate the Intel card and cache its name, driver and sysfs counter paths."""
+        try:
+            card_num = self._first_card(_INTEL_VENDOR)
+            if card_num is not None:
+                # Found Intel GPU, get name from lspci
+                self._intel_card_num = card_num
+                uevent_path = f'/sys/class/drm/card{card_num}/device/uevent'
+                if os.path.exists(uevent_path):
+                    pci_addr = _read_pci_slot_name(uevent_path)
+                    lspci_out = _lspci(pci_addr) if pci_addr else None
+                    if lspci_out:
+                        # Extract GPU name
+                        match = re.search(r'VGA.*?:\s+Intel.*?Device\s+(\w+)', lspci_out)
+                        if match:
+                            self._intel_name = f'Intel GPU (Device {match.group(1)})'
+                
+                # Xe driver (newer Intel GPUs) reports act_freq per GT; i915 per card.
+                # Always use actual frequency: the real running frequency, 0 when idle
+                xe_freq_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/freq0/act_freq'
+                if os.path.exists(xe_freq_path):
+                    self._intel_driver = 'xe'
+                    self._intel_freq_path = xe_freq_path
+                elif os.path.exists(f'/sys/class/drm/card{card_num}/gt_cur_freq_mhz'):
+                    self._intel_driver = 'i915'
+                    act_freq_path = f'/sys/class/drm/card{card_num}/gt_act_freq_mhz'
+                    if os.path.exists(act_freq_path):
+                        self._intel_freq_path = act_freq_path
+                    else:
+                        # If act_freq not available, fallback to cur_freq
+                        self._intel_freq_path = f'/sys/class/drm/card{card_num}/gt_cur_freq_mhz'
+            
+            # Xe idle residency, used for utilization and as the Xe memory marker
+            for card_num, _vendor in self._drm_cards:
+                xe_idle_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/gtidle/idle_residency_ms'
+                if os.path.exists(xe_idle_path):
+                    self._intel_xe_card_num = card_num
+                    self._intel_xe_idle_path = xe_idle_path
+                    break
+            
+            # Counters read on every sample stay open
+            self._intel_freq_fd = self._open_sysfs(self._intel_freq_path)
+            self._intel_xe_idle_fd = self._open_sysfs(self._intel_xe_idle_path)
+            
+            # i915 debugfs counters
+            self._i915_engine_path, self._i915_engine_direct = self._find_debugfs_file('i915_engine_info')
+            self._i915_gem_path, self._i915_gem_direct = self._find_debugfs_file('i915_gem_objects')
+            
+            # Only one counter source present: skip the other driver's probes per sample
+            has_i915 = self._i915_engine_path or self._i915_gem_path
+            if self._intel_xe_idle_path and not has_i915:
+                self._collect_intel = self._collect_xe_info
+            elif not self._intel_xe_idle_path:
+                self._collect_intel = self._collect_i915_info
+        except Exception as e:
+            print(f"Error discovering Intel GPU: {e}")
+    
+    def _discover_amd(self):
+        """Locate the amdgpu sysfs counters of the first AMD card, else rocm-smi."""
+        card_num = self._first_card(_AMD_VENDOR)
+        if card_num is not None:
+            device_path = f'{_DRM_DIR}/card{card_num}/device'
+            paths = {}
+            for key in ('gpu_busy_percent', 'mem_info_vram_used', 'mem_info_vram_total'):
+                path = f'{device_path}/{key}'
+                if os.path.exists(path):
+                    paths[key] = path
+            
+            # Temperature (millidegrees C) and average power (microwatts) live in hwmon
+            try:
+                hwmons = sorted(os.listdir(f'{device_path}/hwmon'))
+            except OSError:
+                hwmons = []
+            for hwmon in hwmons:
+                for key, name in (('temperature', 'temp1_input'), ('power', 'power1_average')):
+                    path = f'{device_path}/hwmon/{hwmon}/{name}'
+                    if key not in paths and os.path.exists(path):
+                        paths[key] = path
+            self._amd_sysfs_paths = paths
+        
+        if 'gpu_busy_percent' not in self._amd_sysfs_paths:
+            # rocm-smi fallback, resolved once; without it polls spawn nothing
+            self._rocm_smi = shutil.which('rocm-smi')
+    
+    @staticmethod
+    def _open_sysfs(path: Optional[str]) -> Optional[int]:
+        """Open a sysfs counter for repeated os.pread, or None if unavailable."""
+        if not path:
+            return None
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+    
+    def _read_sysfs_int(self, fd_attr: str, path: str) -> int:
+        """Read an integer through a cached descriptor, reopening it once if stale.
+        
+        Args:
+            fd_attr: Name of the attribute holding the descriptor
+            path: File the descriptor was opened from
+        """
+        try:
+            return int(os.pread(getattr(self, fd_attr), 32, 0))
+        except OSError as e:
+            # Device unbound/rebound (e.g. driver reload) invalidates the open file
+            if e.errno not in (errno.ENODEV, errno.EINVAL, errno.EBADF):
+                raise
+        try:
+            os.close(getattr(self, fd_attr))
+        except OSError:
+            pass
+        setattr(self, fd_attr, None)
+        fd = os.open(path, os.O_RDONLY)
+        setattr(self, fd_attr, fd)
+        return int(os.pread(fd, 32, 0))
+    
+    def _find_debugfs_file(self, name: str) -> Tuple[Optional[str], bool]:
+        """Locate a DRM debugfs file for the Intel GPU.
+        
+        Args:
+            name: File name under /sys/kernel/debug/dri/<variant>/
+            
+        Returns:
+            Tuple of (path or None, True if it can be opened without sudo)
+        """
+        for variant in _DEBUGFS_DRI_VARIANTS:
+            path = f'/sys/kernel/debug/dri/{variant}/{name}'
+            try:
+                with open(path, 'rb'):
+                    return path, True
+            except OSError:
+                pass
+        
+        # Not readable directly: debugfs is root-only unless sudoers allows cat
+        for variant in _DEBUGFS_DRI_VARIANTS:
+            path = f'/sys/kernel/debug/dri/{variant}/{name}'
+            try:
+                result = subprocess.run(['sudo', '-n', 'cat', path],
+                                        capture_output=True, text=True, timeout=1)
+            except (OSError, subprocess.SubprocessError):
+                break
+            if result.returncode == 0:
+                return path, False
+        return None, False
+    
+    def _read_debugfs(self, path: str, direct: bool) -> Optional[str]:
+        """Read a debugfs file found by _find_debugfs_file()."""
+        if direct:
+            with open(path, 'r') as f:
+                return f.read()
+        result = subprocess.run(['sudo', '-n', 'cat', path],
+                                capture_output=True, text=True, timeout=1)
+        return result.stdout if result.returncode == 0 else None
+    
     def _get_intel_gpu_utilization_from_debugfs(self) -> Optional[float]:
         """Calculate Intel GPU utilization from i915_engine_info Runtime.
         
         This reads /sys/kernel/debug/dri/*/i915_engine_info once per sample,
         and calculates utilization based on the delta from the previous sample.
-        Requires sudo access to /sys/kernel/debug.
+        The file is opened directly when running as root or with
+        CAP_DAC_READ_SEARCH; otherwise each read needs passwordless
+        'sudo cat' (scripts/update_sudoers.sh).
         
         Returns:
             GPU utilization percentage (0-100) or None if unavailable
         """
-        import time
-        
-        def parse_engine_runtime(content: str) -> Optional[int]:
-            """Parse runtime from i915_engine_info for rcs0 (Render/3D engine).
-            
-            Looking for line like: "        Runtime: 56749864ms"
-            """
-            for line in content.split('\n'):
-                # Look for rcs0 section first
-                if line.strip() == 'rcs0':
-                    # Found rcs0, now look for Runtime in following lines
-                    lines = content.split('\n')
-                    rcs0_idx = lines.index(line)
-                    # Check next ~20 lines for Runtime
-                    for i in range(rcs0_idx, min(rcs0_idx + 20, len(lines))):
-                        if 'Runtime:' in lines[i]:
-                            # Extract runtime value (e.g., "        Runtime: 56749864ms")
-                            parts = lines[i].split('Runtime:')
-                            if len(parts) == 2:
-                                runtime_str = parts[1].strip().replace('ms', '')
-                                try:
-                                    return int(runtime_str)
-                                except ValueError:
-                                    return None
-            return None
-        
         try:
-            # Find i915_engine_info file by trying to read it with sudo
-            engine_info_path = None
-            for variant in ['0000:00:02.0', '1', '128', '0']:
-                path = f'/sys/kernel/debug/dri/{variant}/i915_engine_info'
-                test_result = subprocess.run(['sudo', '-n', 'cat', path],
-                                           capture_output=True, text=True, timeout=1)
-                if test_result.returncode == 0:
-                    engine_info_path = path
-                    break
-            
-            if not engine_info_path:
+            # i915_engine_info was located by _discover_intel()
+            if not self._i915_engine_path:
                 return None
             
             # Read current sample
-            result = subprocess.run(['sudo', '-n', 'cat', engine_info_path],
-                                   capture_output=True, text=True, timeout=1)
-            if result.returncode != 0:
+            content = self._read_debugfs(self._i915_engine_path, self._i915_engine_direct)
+            if content is None:
                 return None
             
-            current_time = time.time()
-            current_runtime = parse_engine_runtime(result.stdout)
-            
-            if current_runtime is None:
+            current_time = time.monotonic_ns()
+            match = _RCS0_RUNTIME_RE.search(content)
+            if match is None:
                 return None
+            current_runtime = int(match.group(1))
             
             # Need previous sample to calculate delta
             if self._prev_intel_runtime_ms is None or self._prev_intel_timestamp is None:
@@ -194,7 +515,7 @@ class GPUMonitor:
                 return 0.0
             
             # Calculate utilization from delta
-            time_delta = (current_time - self._prev_intel_timestamp) * 1000  # Convert to ms
+            time_delta = (current_time - self._prev_intel_timestamp) // 1_000_000  # Convert to ms
             runtime_delta = current_runtime - self._prev_intel_runtime_ms  # Already in ms
             
             # Save current values for next calculation
@@ -204,10 +525,8 @@ class GPUMonitor:
             if time_delta <= 0:
                 return None
             
-            utilization = (runtime_delta / time_delta) * 100.0
-            
-            # Clamp to 0-100%
-            return max(0.0, min(100.0, utilization))
+            # Integer percent of the interval rcs0 was busy, clamped to 0-100%
+            return _clamp_percent(runtime_delta * 100 // time_delta)
             
         except Exception as e:
             return None
@@ -219,40 +538,24 @@ class GPUMonitor:
             Tuple of (used_bytes, total_bytes) or None if unavailable
         """
         try:
-            # Find i915_gem_objects file
-            gem_objects_path = None
-            for variant in ['0000:00:02.0', '1', '128', '0']:
-                path = f'/sys/kernel/debug/dri/{variant}/i915_gem_objects'
-                test_result = subprocess.run(['sudo', '-n', 'cat', path],
-                                           capture_output=True, text=True, timeout=1)
-                if test_result.returncode == 0:
-                    gem_objects_path = path
-                    content = test_result.stdout
-                    break
+            # i915_gem_objects was located by _discover_intel()
+            if not self._i915_gem_path:
+                return None
+            content = self._read_debugfs(self._i915_gem_path, self._i915_gem_direct)
+            if not content:
+                return None
             
-            if not gem_objects_path or not content:
+            # Bytes in use are on the first line
+            match = _I915_GEM_USED_RE.search(content.split('\n', 1)[0])
+            if match is None:
                 return None
+            used_bytes = int(match.group(1))
             
-            # Parse first line: "3787 shrinkable [0 free] objects, 4150968320 bytes"
-            first_line = content.split('\n')[0]
-            if 'bytes' in first_line:
-                parts = first_line.split(',')
-                if len(parts) >= 2:
-                    bytes_part = parts[-1].strip()  # "4150968320 bytes"
-                    used_bytes = int(bytes_part.split()[0])
-                    
-                    # Parse system memory line: "system: total:0x0000000f9effa000 bytes"
-                    for line in content.split('\n'):
-                        if 'system: total:' in line:
-                            # Extract hex value
-                            hex_part = line.split('total:')[1].split()[0]
-                            total_bytes = int(hex_part, 16)
-                            return (used_bytes, total_bytes)
-                    
-                    # If no system total found, return used with 0 total
-                    return (used_bytes, 0)
-            
-            return None
+            # The system region never resizes; 0 if the file has no such line
+            if self._i915_total_bytes is None:
+                total = _I915_SYSTEM_TOTAL_RE.search(content)
+                self._i915_total_bytes = int(total.group(1), 16) if total else 0
+            return (used_bytes, self._i915_total_bytes)
             
         except Exception as e:
             return None
@@ -272,18 +575,20 @@ class GPUMonitor:
         Returns:
             GPU utilization percentage (0-100) or None if unavailable
         """
-        import time
-        
         try:
-            idle_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/gtidle/idle_residency_ms'
-            
-            if not os.path.exists(idle_path):
-                return None
-            
-            # Read current idle time
-            with open(idle_path, 'r') as f:
-                current_idle_ms = int(f.read().strip())
-            current_time = time.time()
+            if card_num == self._intel_xe_card_num and self._intel_xe_idle_fd is not None:
+                # Read current idle time from the descriptor opened by _discover_intel()
+                current_idle_ms = self._read_sysfs_int('_intel_xe_idle_fd', self._intel_xe_idle_path)
+            else:
+                idle_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/gtidle/idle_residency_ms'
+                
+                if not os.path.exists(idle_path):
+                    return None
+                
+                # Read current idle time
+                with open(idle_path, 'r') as f:
+                    current_idle_ms = int(f.read().strip())
+            current_time = time.monotonic_ns()
             
             # Need previous sample to calculate delta
             if self._prev_xe_idle_ms is None or self._prev_xe_timestamp is None:
@@ -293,7 +598,7 @@ class GPUMonitor:
                 return 0.0
             
             # Calculate deltas
-            time_delta = (current_time - self._prev_xe_timestamp) * 1000  # Convert to ms
+            time_delta = (current_time - self._prev_xe_timestamp) // 1_000_000  # Convert to ms
             idle_delta = current_idle_ms - self._prev_xe_idle_ms  # Already in ms
             
             # Save current values for next calculation
@@ -303,11 +608,8 @@ class GPUMonitor:
             if time_delta <= 0:
                 return None
             
-            # Utilization = 100 - (idle_percentage)
-            idle_percentage = (idle_delta / time_delta) * 100
-            utilization = max(0.0, min(100.0, 100 - idle_percentage))
-            
-            return utilization
+            # Utilization = 100 - (idle_percentage), as an integer percent of the interval
+            return _clamp_percent((time_delta - idle_delta) * 100 // time_delta)
             
         except Exception as e:
             return None
@@ -326,73 +628,117 @@ class GPUMonitor:
         try:
             # Read all process fdinfo for drm memory usage
             total_used = 0
+            clients = 0
             
-            # Scan /proc for all processes
-            for pid_dir in os.listdir('/proc'):
-                if not pid_dir.isdigit():
-                    continue
-                
-                fdinfo_dir = f'/proc/{pid_dir}/fdinfo'
-                if not os.path.exists(fdinfo_dir):
-                    continue
-                
+            # Nothing had the GPU open at the last scan: skip the O(procs x fds)
+            # walk, it would most likely find nothing again
+            now = time.monotonic()
+            if now < self._xe_rescan_after:
+                pids = []
+            else:
+                # Scan /proc for all processes; only DRM device fds have drm-* fdinfo keys
+                with os.scandir(_PROC_DIR) as procs:
+                    pids = [entry.name for entry in procs if entry.name.isdigit()]
+            
+            for pid_dir in pids:
                 try:
-                    for fd_file in os.listdir(fdinfo_dir):
-                        fd_path = os.path.join(fdinfo_dir, fd_file)
-                        try:
-                            with open(fd_path, 'r') as f:
-                                content = f.read()
-                                if 'drm-driver:' in content and 'xe' in content:
-                                    # Parse memory fields
-                                    # Xe GPU uses GTT (Graphics Translation Table) memory
-                                    for line in content.split('\n'):
-                                        if line.startswith('drm-total-gtt:') or line.startswith('drm-total-system:'):
-                                            # Format can be:
-                                            # "drm-total-gtt:     25984 KiB"
-                                            # "drm-total-system:  50060 KiB"
-                                            # "drm-total-stolen:  0"
-                                            try:
-                                                parts = line.split(':')[1].strip().split()
-                                                if len(parts) >= 1:
-                                                    mem_kb = int(parts[0])
-                                                    # If unit is specified, verify it's KiB
-                                                    # Otherwise assume bytes and convert
-                                                    if len(parts) >= 2:
-                                                        if parts[1] == 'KiB':
-                                                            total_used += mem_kb * 1024
-                                                        else:
-                                                            # Unknown unit, skip
-                                                            pass
-                                                    else:
-                                                        # No unit specified, assume already in bytes
-                                                        total_used += mem_kb
-                                            except (ValueError, IndexError):
-                                                pass
-                        except (PermissionError, FileNotFoundError, ValueError):
-                            continue
+                    with os.scandir(f'{_PROC_DIR}/{pid_dir}/fd') as fds:
+                        drm_fds = []
+                        for fd_entry in fds:
+                            try:
+                                if os.readlink(fd_entry.path).startswith('/dev/dri/'):
+                                    drm_fds.append(fd_entry.name)
+                            except OSError:
+                                continue  # fd closed since the listing
                 except (PermissionError, FileNotFoundError):
                     continue
+                
+                for fd_file in drm_fds:
+                    fd_path = f'{_PROC_DIR}/{pid_dir}/fdinfo/{fd_file}'
+                    try:
+                        with open(fd_path, 'rb') as f:
+                            content = f.read()
+                    except (PermissionError, FileNotFoundError):
+                        continue
+                    
+                    # Xe GPU uses GTT (Graphics Translation Table) and system memory
+                    if _FDINFO_XE_DRIVER_RE.search(content):
+                        clients += 1
+                        total_used += sum(int(size) * _FDINFO_UNIT_BYTES[unit]
+                                          for size, unit in _FDINFO_XE_MEM_RE.findall(content))
+            
+            if clients == 0 and now >= self._xe_rescan_after:
+                self._xe_rescan_after = now + _XE_NO_CLIENTS_RESCAN_SEC
             
             # Get total system memory as GPU memory (integrated GPU uses system RAM)
-            try:
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('MemTotal:'):
-                            total_kb = int(line.split()[1])
-                            total_bytes = total_kb * 1024
-                            return (total_used, total_bytes)
-            except Exception:
-                pass
+            if self._mem_total_bytes is None:
+                self._mem_total_bytes = _read_mem_total()
+            if self._mem_total_bytes:
+                return (total_used, self._mem_total_bytes)
             
             return (total_used, 0) if total_used > 0 else None
             
         except Exception as e:
             return None
     
+    def _cached_info(self, key, collect) -> Dict:
+        """Return collect() at most once per poll_interval, else its last result."""
+        if self.background and self.poll_interval > 0:
+            info = self._snapshot.get(key)
+            if info is None:
+                # First request for this GPU: read it here, then keep it refreshed
+                info = collect()
+                with self._publish_lock:
+                    self._snapshot = {**self._snapshot, key: info}
+                    self._collectors = {**self._collectors, key: collect}
+                    self._start_worker()
+            return dict(info)
+        
+        now = time.monotonic()
+        cached = self._info_cache.get(key)
+        if cached is None or now - cached[0] >= self.poll_interval:
+            cached = self._info_cache[key] = (now, collect())
+        return dict(cached[1])  # Callers add 'id'/'type' keys
+    
+    def _start_worker(self):
+        """Start the refresh thread if it is not running."""
+        if self._worker is None:
+            # The thread only holds a weak reference, so an unreferenced
+            # monitor is still collected (and closed by __del__)
+            self._worker = threading.Thread(target=GPUMonitor._refresh_loop,
+                                            args=(weakref.ref(self), self._stop_event, self.poll_interval),
+                                            name='GPUMonitor', daemon=True)
+            self._worker.start()
+    
+    @staticmethod
+    def _refresh_loop(monitor_ref, stop_event: threading.Event, interval: float):
+        """Refresh the monitor every interval until it is closed or collected."""
+        while not stop_event.wait(interval):
+            monitor = monitor_ref()
+            if monitor is None:
+                return
+            monitor._refresh_snapshot()
+            del monitor
+    
+    def _refresh_snapshot(self):
+        """Re-read every requested GPU and publish the results."""
+        for key, collect in self._collectors.items():
+            try:
+                info = collect()
+            except Exception as e:
+                print(f"Error refreshing GPU info: {e}")
+                continue
+            with self._publish_lock:
+                self._snapshot = {**self._snapshot, key: info}
+    
     def get_intel_info(self) -> Dict:
         """Get Intel GPU information using sysfs (supports i915 and Xe drivers)."""
-        info = {
-            'name': 'Intel GPU',
+        return self._cached_info('intel', self._collect_intel)
+    
+    def _new_intel_info(self) -> Dict:
+        """Return an empty Intel info dict with the discovered name."""
+        return {
+            'name': self._intel_name,
             'gpu_util': 0,
             'memory_util': 0,
             'memory_used': 0,
@@ -402,147 +748,83 @@ class GPUMonitor:
             'gpu_clock': 0,
             'memory_clock': 0
         }
+    
+    def _read_intel_clock(self, info: Dict):
+        """Store the current GPU clock from the frequency file found by _discover_intel()."""
+        if self._intel_freq_fd is not None:
+            info['gpu_clock'] = self._read_sysfs_int('_intel_freq_fd', self._intel_freq_path)
+            
+            # NOTE: Intel GPU sysfs does not provide actual utilization
+            # act_freq indicates GPU activity (0 = idle, >0 = active)
+            # but frequency does NOT equal utilization percentage
+    
+    @staticmethod
+    def _set_intel_usage(info: Dict, util: Optional[float], mem_info: Optional[tuple]):
+        """Store utilization and (used_bytes, total_bytes) memory in info."""
+        if util is not None:
+            info['gpu_util'] = int(util)
+        if mem_info is not None:
+            used_bytes, total_bytes = mem_info
+            info['memory_used'] = used_bytes // (1024 * 1024)  # Convert to MB
+            info['memory_total'] = total_bytes // (1024 * 1024)  # Convert to MB
+            if total_bytes > 0:
+                info['memory_util'] = int((used_bytes / total_bytes) * 100)
+    
+    def _collect_xe_info(self) -> Dict:
+        """Read an Xe GPU: idle residency utilization and fdinfo memory."""
+        info = self._new_intel_info()
+        try:
+            self._read_intel_clock(info)
+            self._set_intel_usage(info, self._get_xe_gpu_utilization(self._intel_xe_card_num),
+                                  self._get_xe_gpu_memory(self._intel_xe_card_num))
+        except Exception as e:
+            print(f"Error getting Intel GPU info: {e}")
+        return info
+    
+    def _collect_i915_info(self) -> Dict:
+        """Read an i915 GPU: debugfs rcs0 runtime utilization and GEM memory."""
+        info = self._new_intel_info()
+        try:
+            self._read_intel_clock(info)
+            self._set_intel_usage(info, self._get_intel_gpu_utilization_from_debugfs(),
+                                  self._get_intel_gpu_memory_from_debugfs())
+        except Exception as e:
+            print(f"Error getting Intel GPU info: {e}")
+        return info
+    
+    def _collect_intel_info(self) -> Dict:
+        """Read an Intel GPU whose driver discovery could not pin down.
         
+        Tries the i915 debugfs counters first and falls back to the Xe ones.
+        """
+        info = self._new_intel_info()
         try:
-            # Detect GPU name from lspci
-            for card_num in range(5):
-                vendor_path = f'/sys/class/drm/card{card_num}/device/vendor'
-                if os.path.exists(vendor_path):
-                    with open(vendor_path, 'r') as f:
-                        if f.read().strip() in ['0x8086', '8086']:
-                            # Found Intel GPU, get name from lspci
-                            uevent_path = f'/sys/class/drm/card{card_num}/device/uevent'
-                            if os.path.exists(uevent_path):
-                                with open(uevent_path, 'r') as ue:
-                                    for line in ue:
-                                        if line.startswith('PCI_SLOT_NAME='):
-                                            pci_addr = line.split('=')[1].strip()
-                                            result = subprocess.run(['lspci', '-s', pci_addr],
-                                                                  capture_output=True, text=True)
-                                            if result.returncode == 0:
-                                                # Extract GPU name
-                                                match = re.search(r'VGA.*?:\s+Intel.*?Device\s+(\w+)', result.stdout)
-                                                if match:
-                                                    device_id = match.group(1)
-                                                    info['name'] = f'Intel GPU (Device {device_id})'
-                                                else:
-                                                    info['name'] = 'Intel GPU'
-                            
-                            # Try Xe driver frequency (newer Intel GPUs)
-                            xe_freq_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/freq0/act_freq'
-                            if os.path.exists(xe_freq_path):
-                                # Always use actual frequency (act_freq)
-                                # This is the real running frequency, 0 when idle
-                                with open(xe_freq_path, 'r') as f:
-                                    act_freq = int(f.read().strip())
-                                info['gpu_clock'] = act_freq
-                                
-                                # NOTE: Intel GPU sysfs does not provide actual utilization
-                                # act_freq indicates GPU activity (0 = idle, >0 = active)
-                                # but frequency does NOT equal utilization percentage
-                                # Leave gpu_util as 0 (use intel_gpu_top for real data)
-                                
-                            # Try i915 driver frequency (older Intel GPUs)
-                            elif os.path.exists(f'/sys/class/drm/card{card_num}/gt_cur_freq_mhz'):
-                                # Always use actual frequency (gt_act_freq_mhz) for i915
-                                # This is the real running frequency
-                                act_freq_path = f'/sys/class/drm/card{card_num}/gt_act_freq_mhz'
-                                
-                                if os.path.exists(act_freq_path):
-                                    with open(act_freq_path, 'r') as f:
-                                        act_freq = int(f.read().strip())
-                                    info['gpu_clock'] = act_freq
-                                else:
-                                    # If act_freq not available, fallback to cur_freq
-                                    cur_freq_path = f'/sys/class/drm/card{card_num}/gt_cur_freq_mhz'
-                                    with open(cur_freq_path, 'r') as f:
-                                        info['gpu_clock'] = int(f.read().strip())
-                                
-                                # NOTE: Intel GPU sysfs does not provide actual utilization
-                                # Frequency != Utilization, so we leave gpu_util as 0
-                                # Use intel_gpu_top for real utilization (requires sudo)
-                            
-                            # Found Intel GPU, exit loop
-                            break
-            
-            # Try to get real GPU utilization from debugfs (fast, direct)
+            self._read_intel_clock(info)
+            
             # First try i915 driver (older Intel GPUs)
             util = self._get_intel_gpu_utilization_from_debugfs()
-            if util is not None:
-                info['gpu_util'] = int(util)
-            else:
+            if util is None and self._intel_xe_idle_path:
                 # Try Xe driver (newer Intel GPUs like Arc, Meteor Lake, etc.)
-                for card_num in range(5):
-                    xe_idle_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/gtidle/idle_residency_ms'
-                    if os.path.exists(xe_idle_path):
-                        util = self._get_xe_gpu_utilization(card_num)
-                        if util is not None:
-                            info['gpu_util'] = int(util)
-                            break
-            
-            # Try to get GPU memory usage from debugfs
-            # First try i915
-            mem_info = self._get_intel_gpu_memory_from_debugfs()
-            if mem_info is not None:
-                used_bytes, total_bytes = mem_info
-                info['memory_used'] = used_bytes // (1024 * 1024)  # Convert to MB
-                info['memory_total'] = total_bytes // (1024 * 1024)  # Convert to MB
-                if total_bytes > 0:
-                    info['memory_util'] = int((used_bytes / total_bytes) * 100)
-            else:
-                # Try Xe driver memory
-                for card_num in range(5):
-                    xe_idle_path = f'/sys/class/drm/card{card_num}/device/tile0/gt0/gtidle/idle_residency_ms'
-                    if os.path.exists(xe_idle_path):
-                        mem_info = self._get_xe_gpu_memory(card_num)
-                        if mem_info is not None:
-                            used_bytes, total_bytes = mem_info
-                            info['memory_used'] = used_bytes // (1024 * 1024)  # Convert to MB
-                            info['memory_total'] = total_bytes // (1024 * 1024)  # Convert to MB
-                            if total_bytes > 0:
-                                info['memory_util'] = int((used_bytes / total_bytes) * 100)
-                            break
-            
-            # Legacy code kept for reference (commented out)
-            # Try intel_gpu_top for utilization (if available)
-            result = subprocess.run(['which', 'intel_gpu_top'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                # intel_gpu_top requires sudo and continuous monitoring
-                # We'll try to parse /sys/kernel/debug/dri/0/i915_gem_objects instead
-                gem_path = '/sys/kernel/debug/dri/0/i915_gem_objects'
-                if os.path.exists(gem_path):
-                    try:
-                        with open(gem_path, 'r') as f:
-                            content = f.read()
-                            # Parse memory usage from gem objects
-                            match = re.search(r'Total (\d+) objects, (\d+) bytes', content)
-                            if match:
-                                info['memory_used'] = int(match.group(2)) / (1024**2)  # Convert to MB
-                    except PermissionError:
-                        pass
-            
-            # Try to read from i915 PMU counters
-            i915_path = '/sys/class/drm/card0/device/drm/card0'
-            if os.path.exists(i915_path):
-                # Look for engine utilization
-                engine_path = f'{i915_path}/engine'
-                if os.path.exists(engine_path):
-                    # This would require parsing PMU events which is complex
-                    # For now, we'll set a placeholder
-                    pass
+                util = self._get_xe_gpu_utilization(self._intel_xe_card_num)
             
+            mem_info = self._get_intel_gpu_memory_from_debugfs()
+            if mem_info is None and self._intel_xe_idle_path:
+                mem_info = self._get_xe_gpu_memory(self._intel_xe_card_num)
+            self._set_intel_usage(info, util, mem_info)
         except Exception as e:
             print(f"Error getting Intel GPU info: {e}")
-        
         return info
     
     def get_nvidia_info(self, device_id: int = 0) -> Dict:
         """Get NVIDIA GPU information using pynvml or sysfs fallback."""
+        return self._cached_info(('nvidia', device_id), lambda: self._collect_nvidia_info(device_id))
+    
+    def _collect_nvidia_info(self, device_id: int) -> Dict:
+        """Query one NVIDIA GPU through pynvml, or sysfs if NVML is unavailable."""
         # Try pynvml first
         if self.nvidia_available:
             try:
-                handle = self.pynvml.nvmlDeviceGetHandleByIndex(device_id)
+                handle = self._nv_handles[device_id]
                 
                 # Get utilization
                 utilization = self.pynvml.nvmlDeviceGetUtilizationRates(handle)
@@ -555,28 +837,28 @@ class GPUMonitor:
                     handle, self.pynvml.NVML_TEMPERATURE_GPU)
                 
                 # Get power
-                try:
-                    power = self.pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW to W
-                except:
-                    power = 0
+                power = 0
+                if (device_id, 'power') not in self._nv_unsupported:
+                    try:
+                        power = self.pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW to W
+                    except Exception as e:
+                        self._mark_nv_unsupported(device_id, 'power', e)
                 
                 # Get clock speeds
-                try:
-                    gpu_clock = self.pynvml.nvmlDeviceGetClockInfo(
-                        handle, self.pynvml.NVML_CLOCK_GRAPHICS)
-                    mem_clock = self.pynvml.nvmlDeviceGetClockInfo(
-                        handle, self.pynvml.NVML_CLOCK_MEM)
-                except:
-                    gpu_clock = 0
-                    mem_clock = 0
-                
-                # Get name
-                name = self.pynvml.nvmlDeviceGetName(handle)
-                if isinstance(name, bytes):
-                    name = name.decode('utf-8')
+                gpu_clock = 0
+                mem_clock = 0
+                if (device_id, 'clocks') not in self._nv_unsupported:
+                    try:
+                        gpu_clock = self.pynvml.nvmlDeviceGetClockInfo(
+                            handle, self.pynvml.NVML_CLOCK_GRAPHICS)
+                        mem_clock = self.pynvml.nvmlDeviceGetClockInfo(
+                            handle, self.pynvml.NVML_CLOCK_MEM)
+                    except Exception as e:
+                        gpu_clock = 0
+                        self._mark_nv_unsupported(device_id, 'clocks', e)
                 
                 return {
-                    'name': name,
+                    'name': self._nv_names[device_id],
                     'gpu_util': utilization.gpu,
                     'memory_util': utilization.memory,
                     'memory_used': memory.used / (1024**2),  # MB
@@ -592,10 +874,19 @@ class GPUMonitor:
         # Fallback to sysfs for basic info
         return self._get_nvidia_sysfs_info()
     
+    def _mark_nv_unsupported(self, device_id: int, query: str, error: Exception):
+        """Stop issuing an NVML query the device reported as not supported."""
+        if getattr(error, 'value', None) == self.pynvml.NVML_ERROR_NOT_SUPPORTED:
+            self._nv_unsupported.add((device_id, query))
+    
     def _get_nvidia_sysfs_info(self) -> Dict:
         """Get basic NVIDIA GPU info from sysfs (no driver needed)."""
-        info = {
-            'name': 'NVIDIA GPU',
+        # Note: Without NVIDIA driver, we can't get utilization, memory, etc.
+        # But we can at least show the GPU exists
+        if self._nv_sysfs_name is None:
+            self._nv_sysfs_name = self._read_nvidia_sysfs_name()
+        return {
+            'name': self._nv_sysfs_name,
             'gpu_util': 0,
             'memory_util': 0,
             'memory_used': 0,
@@ -605,57 +896,87 @@ class GPUMonitor:
             'gpu_clock': 0,
             'memory_clock': 0
         }
-        
+    
+    def _read_nvidia_sysfs_name(self) -> str:
+        """Name the NVIDIA card from its PCI device ID or lspci."""
+        name = 'NVIDIA GPU'
         try:
             # Find NVIDIA card in sysfs
-            for card_num in range(10):
-                vendor_path = f'/sys/class/drm/card{card_num}/device/vendor'
-                if os.path.exists(vendor_path):
-                    with open(vendor_path, 'r') as f:
-                        vendor_id = f.read().strip()
-                        if vendor_id in ['0x10de', '10de']:
-                            # Found NVIDIA GPU
-                            device_path = f'/sys/class/drm/card{card_num}/device'
-                            
-                            # Get device name from PCI ID
-                            device_id_path = f'{device_path}/device'
-                            if os.path.exists(device_id_path):
-                                with open(device_id_path, 'r') as f:
-                                    device_id = f.read().strip()
-                                    info['name'] = f'NVIDIA GPU ({device_id})'
-                            
-                            # Try to get GPU name from lspci
-                            try:
-                                pci_addr_path = f'{device_path}/uevent'
-                                if os.path.exists(pci_addr_path):
-                                    with open(pci_addr_path, 'r') as f:
-                                        for line in f:
-                                            if line.startswith('PCI_SLOT_NAME='):
-                                                pci_addr = line.split('=')[1].strip()
-                                                result = subprocess.run(['lspci', '-s', pci_addr],
-                                                                      capture_output=True, text=True)
-                                                if result.returncode == 0:
-                                                    # Extract GPU name from lspci output
-                                                    match = re.search(r'NVIDIA.*?\[(.*?)\]', result.stdout)
-                                                    if match:
-                                                        info['name'] = f'NVIDIA {match.group(1)}'
-                            except:
-                                pass
-                            
-                            # Note: Without NVIDIA driver, we can't get utilization, memory, etc.
-                            # But we can at least show the GPU exists
-                            break
-                            
+            card_num = self._first_card(_NVIDIA_VENDOR)
+            if card_num is not None:
+                # Found NVIDIA GPU
+                device_path = f'/sys/class/drm/card{card_num}/device'
+                
+                # Get device name from PCI ID
+                device_id_path = f'{device_path}/device'
+                if os.path.exists(device_id_path):
+                    with open(device_id_path, 'r') as f:
+                        device_id = f.read().strip()
+                        name = f'NVIDIA GPU ({device_id})'
+                
+                # Try to get GPU name from lspci
+                try:
+                    pci_addr_path = f'{device_path}/uevent'
+                    if os.path.exists(pci_addr_path):
+                        pci_addr = _read_pci_slot_name(pci_addr_path)
+                        lspci_out = _lspci(pci_addr) if pci_addr else None
+                        if lspci_out:
+                            # Extract GPU name from lspci output
+                            match = re.search(r'NVIDIA.*?\[(.*?)\]', lspci_out)
+                            if match:
+                                name = f'NVIDIA {match.group(1)}'
+                except:
+                    pass
+                
         except Exception as e:
             print(f"Error getting NVIDIA sysfs info: {e}")
         
-        return info
+        return name
     
     def get_amd_info(self) -> Dict:
-        """Get AMD GPU information using rocm-smi."""
+        """Get AMD GPU information from amdgpu sysfs, or rocm-smi without it."""
+        return self._cached_info('amd', self._collect_amd_info)
+    
+    def _collect_amd_info(self) -> Dict:
+        """Read the amdgpu sysfs counters found by _discover_amd()."""
+        paths = self._amd_sysfs_paths
+        if 'gpu_busy_percent' not in paths:
+            return self._collect_amd_rocm_smi_info()
+        
+        info = {
+            'name': 'AMD GPU',
+            'gpu_util': 0,
+            'memory_used': 0,
+            'memory_total': 0,
+            'temperature': 0,
+            'power': 0
+        }
+        try:
+            def read_int(key):
+                with open(paths[key], 'r') as f:
+                    return int(f.read())
+            
+            info['gpu_util'] = read_int('gpu_busy_percent')
+            if 'mem_info_vram_used' in paths:
+                info['memory_used'] = read_int('mem_info_vram_used') // (1024 * 1024)  # MB
+            if 'mem_info_vram_total' in paths:
+                info['memory_total'] = read_int('mem_info_vram_total') // (1024 * 1024)  # MB
+            if 'temperature' in paths:
+                info['temperature'] = read_int('temperature') / 1000.0  # mC to C
+            if 'power' in paths:
+                info['power'] = read_int('power') / 1_000_000.0  # uW to W
+        except Exception as e:
+            print(f"Error getting AMD GPU info: {e}")
+        
+        return info
+    
+    def _collect_amd_rocm_smi_info(self) -> Dict:
+        """Parse one rocm-smi report (no amdgpu sysfs counters)."""
+        if self._rocm_smi is None:
+            return {}
         try:
-            result = subprocess.run(['rocm-smi', '--showuse', '--showmeminfo', 'vram',
-                                   '--showtemp', '--showpower'],
+            # Only utilization and temperature are parsed; skip the VRAM query
+            result = subprocess.run([self._rocm_smi, '--showuse', '--showtemp', '--showpower'],
                                   capture_output=True, text=True, timeout=2)
             
             if result.returncode == 0:
@@ -689,36 +1010,39 @@ class GPUMonitor:
     
     def get_all_info(self) -> Dict:
         """Get GPU information for all available GPUs."""
-        gpus = []
+        # (id, type, reader) for every GPU to report
+        tasks = []
         
         if self.intel_available:
-            gpu_info = self.get_intel_info()
-            if gpu_info:
-                gpu_info['id'] = 0
-                gpu_info['type'] = 'intel'
-                gpus.append(gpu_info)
+            tasks.append((0, 'intel', self.get_intel_info))
         
-        # For NVIDIA, try even if nvidia_available is False (will use sysfs fallback)
-        if self.gpu_type == 'nvidia':
-            gpu_info = self.get_nvidia_info(0)
-            if gpu_info:
-                gpu_info['id'] = 0
-                gpu_info['type'] = 'nvidia'
-                gpus.append(gpu_info)
-        elif self.nvidia_available:
+        if self.nvidia_available:
             # If nvidia_available is True, enumerate all devices
             for i in range(self.device_count):
-                gpu_info = self.get_nvidia_info(i)
-                if gpu_info:
-                    gpu_info['id'] = i
-                    gpu_info['type'] = 'nvidia'
-                    gpus.append(gpu_info)
+                tasks.append((i, 'nvidia', functools.partial(self.get_nvidia_info, i)))
+        elif self.gpu_type == 'nvidia':
+            # For NVIDIA, try even if nvidia_available is False (will use sysfs fallback)
+            tasks.append((0, 'nvidia', functools.partial(self.get_nvidia_info, 0)))
         
         if self.amd_available:
-            gpu_info = self.get_amd_info()
+            tasks.append((0, 'amd', self.get_amd_info))
+        
+        if len(tasks) > 1 and not self.background:
+            # NVML and subprocess waits release the GIL: read the GPUs concurrently.
+            # The GPU set is fixed, so one pool sized for it serves every call
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(tasks), thread_name_prefix='GPUMonitor')
+            results = list(self._executor.map(lambda task: task[2](), tasks))
+        else:
+            # Background mode only copies snapshots: no pool needed
+            results = [read() for _id, _type, read in tasks]
+        
+        gpus = []
+        for (gpu_id, gpu_type, _read), gpu_info in zip(tasks, results):
             if gpu_info:
-                gpu_info['id'] = 0
-                gpu_info['type'] = 'amd'
+                gpu_info['id'] = gpu_id
+                gpu_info['type'] = gpu_type
                 gpus.append(gpu_info)
         
         return {
@@ -727,9 +1051,36 @@ class GPUMonitor:
             'gpus': gpus
         }
     
+    def close(self):
+        """Stop the refresh thread and close cached sysfs file descriptors.
+        
+        A background monitor keeps reading the GPUs until this is called or
+        the monitor is garbage collected; owners should call it on shutdown.
+        """
+        worker = getattr(self, '_worker', None)
+        if worker is not None:
+            self._stop_event.set()
+            # __del__ may run on the worker itself when it drops the last reference
+            if worker is not threading.current_thread():
+                worker.join(timeout=2.0)
+            self._worker = None
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait=False)
+        for fd_attr in ('_intel_freq_fd', '_intel_xe_idle_fd'):
+            fd = getattr(self, fd_attr, None)
+            setattr(self, fd_attr, None)
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+    
     def __del__(self):
-        """Cleanup NVML."""
-        if self.nvidia_available:
+        """Close descriptors and cleanup NVML."""
+        self.close()
+        if getattr(self, 'nvidia_available', False):
             try:
                 self.pynvml.nvmlShutdown()
             except:
@@ -2,7 +2,9 @@
 """NPU monitoring module - supports various NPU platforms including Intel."""
 
 import os
+import re
 import subprocess
+import time
 from typing import Dict, Optional
 
 
@@ -125,9 +127,8 @@ class NPUMonitor:
                         # Store busy time for delta calculation
                         if not hasattr(self, '_last_busy_us'):
                             self._last_busy_us = busy_us
-                            self._last_time = __import__('time').time()
+                            self._last_time = time.time()
                         else:
-                            import time
                             current_time = time.time()
                             time_delta = current_time - self._last_time
                             busy_delta = busy_us - self._last_busy_us
@@ -174,7 +175,6 @@ class NPUMonitor:
                     with open(debugfs_path, 'r') as f:
                         content = f.read()
                         # Parse utilization percentage
-                        import re
                         match = re.search(r'utilization:\s*(\d+)', content)
                         if match:
                             info['utilization'] = int(match.group(1))
@@ -6,7 +6,6 @@ to work transparently with remote systems.
 
 import paramiko
 from typing import Optional, List
-import io
 
 
 class RemoteFileSystem:
@@ -6,7 +6,6 @@ Uses linux_monitor_remote.sh script for data collection
 
 import json
 import threading
-import time
 import paramiko
 from typing import Optional, Dict, Any, Callable
 from queue import Queue
@@ -7,10 +7,15 @@ import os
 import subprocess
 import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Optional
 from pathlib import Path
 
 
+# Sort key for interrupt lists; every entry has its rate set before sorting
+_IRQ_RATE_KEY = itemgetter('rate')
+
+
 class DataExporter:
     """Export monitoring data to CSV, JSON, or HTML formats."""
     
@@ -953,7 +958,7 @@ class DataExporter:
                             })
                         
                         # Sort by rate (descending) - most active interrupts first
-                        interrupt_list.sort(key=lambda x: x.get('rate', 0), reverse=True)
+                        interrupt_list.sort(key=_IRQ_RATE_KEY, reverse=True)
                         
                         # Use the same nested structure as local data source
                         interrupt_stats = {'interrupts': interrupt_list}
@@ -1420,7 +1425,7 @@ class DataExporter:
                             })
                         
                         # Sort by rate (descending) - most active interrupts first
-                        interrupt_list.sort(key=lambda x: x.get('rate', 0), reverse=True)
+                        interrupt_list.sort(key=_IRQ_RATE_KEY, reverse=True)
                         
                         # Use the same nested structure as local data source
                         interrupt_stats = {'interrupts': interrupt_list}
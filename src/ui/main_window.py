@@ -144,9 +144,11 @@ class MainWindow(QMainWindow):
         self.start_time = time.time()
         
         # Pre-fetch initial data to determine available features
+        # (GPU/NPU shallow-copied: their 'available' flag is set later, and the
+        # Android source hands out frozen results)
         self._initial_cpu_info = self.data_source.get_cpu_info()
-        self._initial_gpu_info = self.data_source.get_gpu_info()
-        self._initial_npu_info = self.data_source.get_npu_info()
+        self._initial_gpu_info = dict(self.data_source.get_gpu_info())
+        self._initial_npu_info = dict(self.data_source.get_npu_info())
         
         # Initialize UI
         self.init_ui()
@@ -1086,6 +1088,8 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         self.update_timer.stop()
+        # Stops the local GPU refresh thread / closes remote connections
+        self.data_source.disconnect()
         # Only close logger if it exists (None in Android mode)
         if self.data_logger:
             self.data_logger.close()
@@ -0,0 +1,378 @@
+"""Unit tests for ADBMonitorRaw result processing (no device needed)."""
+
+import pytest
+from unittest.mock import patch
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import warnings
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from monitors.adb_monitor_raw import (ADBMonitorRaw, _CPU_FIELDS, _EMPTY_CPU_INFO, _EMPTY_GPU_INFO,
+                                      _EMPTY_NPU_INFO, _EMPTY_NETWORK_INFO, _adb_server_request,
+                                      _stack_cpu_raw)
+from monitoring_snapshot import MonitoringSnapshot
+
+
+def _sample(timestamp_ms, busy, freqs_khz=(1800000, 2400000)):
+    """Raw streaming sample with two cores, fixed memory and temperature."""
+    core = [busy, 0, 0, 1000, 0, 0, 0, 0]
+    return {
+        'timestamp_ms': timestamp_ms,
+        'cpu_raw': dict(zip(_CPU_FIELDS, [2 * busy, 0, 0, 2000, 0, 0, 0, 0])),
+        'per_core_raw': [list(core), list(core)],
+        'per_core_freq_khz': list(freqs_khz),
+        'cpu_temp_millideg': 45000,
+        'mem_total_kb': 8 * 1024 * 1024,
+        'mem_available_kb': 4 * 1024 * 1024,
+        'mem_free_kb': 2 * 1024 * 1024,
+        'gpu_freq_mhz': 0,
+        'net_rx_bytes': 0,
+        'net_tx_bytes': 0,
+        'disk_read_sectors': 0,
+        'disk_write_sectors': 0,
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_device():
+    """Construct monitors without connecting to a device or starting the stream."""
+    with patch.object(ADBMonitorRaw, '_connect'), patch.object(ADBMonitorRaw, 'start_streaming'):
+        yield
+
+
+class TestADBMonitorRawGetters:
+    """Test getters hand out the published, read-only results."""
+    
+    def test_empty_results_are_read_only_templates(self):
+        """Test results before the first sample are the frozen module templates."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        
+        assert monitor.get_cpu_info() is _EMPTY_CPU_INFO
+        assert monitor.get_network_info() is _EMPTY_NETWORK_INFO
+        with pytest.raises(TypeError):
+            monitor.get_cpu_info()['usage']['total'] = 50.0
+        with pytest.raises(AttributeError):
+            monitor.get_network_info()['interfaces'].append('wlan0')
+    
+    def test_no_gpu_or_npu_publishes_templates(self):
+        """Test samples without a GPU or NPU publish the shared templates."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        
+        npu_sample = dict(_sample(1000, 100), npu_info='intel-npu:700:1400:64:25')
+        monitor._process_raw_data(npu_sample)
+        assert monitor.get_npu_info()['utilization'] == 25
+        
+        monitor._process_raw_data(_sample(2000, 200))
+        assert monitor.get_npu_info() is _EMPTY_NPU_INFO
+        assert monitor.get_gpu_info() is _EMPTY_GPU_INFO
+        
+        monitor._process_raw_data(_sample(3000, 300))
+        assert monitor.get_npu_info() is _EMPTY_NPU_INFO
+    
+    def test_results_are_read_only(self):
+        """Test published results cannot be modified through a getter."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        monitor._process_raw_data(_sample(1000, 100))
+        
+        cpu_info = monitor.get_cpu_info()
+        with pytest.raises(TypeError):
+            cpu_info['cpu_count'] = 8
+        with pytest.raises(TypeError):
+            cpu_info['temperature']['Thermal'][0]['current'] = -1.0
+        with pytest.raises(AttributeError):
+            cpu_info['usage']['per_core'].append(50.0)
+        with pytest.raises(TypeError):
+            monitor.get_memory_info()['memory']['used'] = -1.0
+    
+    def test_getters_return_published_snapshot(self):
+        """Test getters hand out the published results without copying."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        monitor._process_raw_data(_sample(1000, 100))
+        
+        assert monitor.get_cpu_info() is monitor.get_cpu_info()
+        assert monitor.get_memory_info() is monitor.get_memory_info()
+        assert monitor.get_network_info() is monitor.get_network_info()
+        
+        first_cpu = monitor.get_cpu_info()
+        monitor._process_raw_data(_sample(2000, 200))
+        
+        # A new sample is published as new objects; earlier results are kept
+        assert monitor.get_cpu_info() is not first_cpu
+        assert first_cpu['usage']['total'] == 0.0
+        assert monitor.get_cpu_info()['usage']['total'] == 100.0  # Idle unchanged
+        assert monitor.get_timestamp_ms() == 2000
+    
+    def test_unchanged_sections_reused(self):
+        """Test temperature and memory are rebuilt only when their inputs change."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        monitor._process_raw_data(_sample(1000, 100))
+        first_temperature = monitor.get_cpu_info()['temperature']
+        first_memory = monitor.get_memory_info()
+        
+        monitor._process_raw_data(_sample(2000, 200))  # Same temperature and memory
+        assert monitor.get_cpu_info()['temperature'] is first_temperature
+        assert monitor.get_memory_info() is first_memory
+        
+        monitor._process_raw_data(dict(_sample(3000, 300), cpu_temp_millideg=50000, mem_free_kb=0))
+        assert monitor.get_cpu_info()['temperature']['Thermal'][0]['current'] == 50.0
+        assert monitor.get_memory_info()['memory']['free'] == 0
+        assert first_temperature['Thermal'][0]['current'] == 45.0
+    
+    def test_snapshot_dict_is_plain(self):
+        """Test frozen results are exported as plain, serializable data."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        monitor._process_raw_data(_sample(1000, 100))
+        
+        snapshot = MonitoringSnapshot()
+        snapshot.cpu = monitor.get_cpu_info()
+        snapshot.memory = monitor.get_memory_info()
+        data = snapshot.to_dict()
+        
+        assert type(data['cpu']['usage']) is dict
+        assert data['cpu']['temperature']['Thermal'][0]['current'] == 45.0
+        assert data['cpu']['frequency']['per_core'] == [1800.0, 2400.0]
+        json.dumps(data)
+
+
+class TestADBMonitorRawProcessing:
+    """Test metrics calculated from raw samples."""
+    
+    def test_average_frequency_without_frequency_rows(self):
+        """Test a sample with cores but no frequency rows averages to 0, not NaN."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')  # numpy's "Mean of empty slice"
+            monitor._process_raw_data(_sample(1000, 100, freqs_khz=()))
+        
+        frequency = monitor.get_cpu_info()['frequency']
+        assert frequency == {'average': 0, 'per_core': ()}
+
+    
+    def test_keyed_per_core_rows_match_flat(self):
+        """Test keyed per-core rows (older scripts) give the same usage as flat rows."""
+        flat = ADBMonitorRaw('192.168.1.68')
+        keyed = ADBMonitorRaw('192.168.1.69')
+        
+        for timestamp_ms, busy in ((1000, 100), (2000, 400)):
+            sample = _sample(timestamp_ms, busy)
+            flat._process_raw_data(sample)
+            keyed_sample = dict(sample, per_core_raw=[dict(zip(_CPU_FIELDS, core))
+                                                      for core in sample['per_core_raw']])
+            keyed._process_raw_data(keyed_sample)
+        
+        assert keyed.get_cpu_info()['usage'] == flat.get_cpu_info()['usage']
+        assert flat.get_cpu_info()['usage']['per_core'] == (100.0, 100.0)  # Idle unchanged
+
+
+class TestStackCpuRaw:
+    """Test stacking of /proc/stat counters into one matrix."""
+    
+    def test_flat_rows(self):
+        """Test flat per-core rows are stacked under the aggregate row."""
+        cpu_raw = dict(zip(_CPU_FIELDS, range(8)))
+        per_core_raw = [list(range(10, 18)), list(range(20, 28))]
+        
+        rows = _stack_cpu_raw(cpu_raw, per_core_raw)
+        
+        assert rows.dtype == np.int64
+        assert rows.tolist() == [list(range(8)), list(range(10, 18)), list(range(20, 28))]
+    
+    def test_keyed_rows(self):
+        """Test keyed per-core rows are read in _CPU_FIELDS order."""
+        cpu_raw = dict(zip(_CPU_FIELDS, range(8)))
+        per_core_raw = [dict(zip(reversed(_CPU_FIELDS), range(17, 9, -1)))]
+        
+        rows = _stack_cpu_raw(cpu_raw, per_core_raw)
+        
+        assert rows.tolist() == [list(range(8)), list(range(10, 18))]
+    
+    def test_no_cores(self):
+        """Test a sample without per-core rows yields only the aggregate row."""
+        rows = _stack_cpu_raw(dict(zip(_CPU_FIELDS, range(8))), [])
+        
+        assert rows.shape == (1, len(_CPU_FIELDS))
+
+
+
+class FakeStreamProcess:
+    """Stands in for the adb shell process; stdout is a real pipe."""
+    
+    def __init__(self, read_fd):
+        self.stdout = os.fdopen(read_fd, 'rb', buffering=0)
+        self.terminated = False
+    
+    def terminate(self):
+        self.terminated = True
+    
+    def wait(self):
+        return 0
+
+
+@pytest.fixture
+def stream():
+    """Monitor whose stream worker reads a pipe the test writes to."""
+    read_fd, write_fd = os.pipe()
+    process = FakeStreamProcess(read_fd)
+    monitor = ADBMonitorRaw('192.168.1.68')
+    monitor._running = True
+    worker = threading.Thread(target=monitor._stream_worker, daemon=True)
+    
+    with patch('monitors.adb_monitor_raw.subprocess.Popen', return_value=process):
+        worker.start()
+        yield monitor, worker, write_fd
+        monitor._running = False
+        worker.join(timeout=2)
+    
+    for close in (lambda: os.close(write_fd), process.stdout.close):
+        try:
+            close()
+        except OSError:
+            pass
+
+
+def _queued(monitor):
+    """Drain the samples the stream worker queued for processing."""
+    samples = []
+    while not monitor._sample_queue.empty():
+        samples.append(monitor._sample_queue.get_nowait())
+    return samples
+
+
+class TestADBMonitorRawStream:
+    """Test splitting the adb output stream into JSON samples."""
+    
+    def test_samples_framed_from_chunks(self, stream):
+        """Test samples are framed across reads, wrapped lines and noise."""
+        monitor, worker, write_fd = stream
+        
+        os.write(write_fd, b'Starting monitor...\n{"a": 1,\n "b": 2}\n{"c"')
+        time.sleep(0.3)  # Let the worker read the partial sample
+        os.write(write_fd, b': 3}\r\n{"d": ')
+        os.close(write_fd)  # End of stream
+        worker.join(timeout=2)
+        
+        assert not worker.is_alive()
+        assert _queued(monitor) == [b'{"a": 1, "b": 2}', b'{"c": 3}']
+    
+    def test_stop_noticed_without_data(self, stream):
+        """Test the worker exits soon after a stop request while idle."""
+        monitor, worker, write_fd = stream
+        time.sleep(0.1)
+        
+        monitor._running = False
+        worker.join(timeout=1)
+        
+        assert not worker.is_alive()
+        assert _queued(monitor) == []
+
+
+class FakeADBServer:
+    """Scripted adb server on a free local port (one connection)."""
+    
+    def __init__(self):
+        self._listener = socket.create_server(('127.0.0.1', 0))
+        self.port = self._listener.getsockname()[1]
+        self.requests = []
+        self.release = threading.Event()
+        self._thread = None
+    
+    def serve(self, *statuses, payload=b'', hold_open=False):
+        """Answer one request per status, then send payload and close."""
+        def run():
+            conn, _ = self._listener.accept()
+            with conn:
+                for status in statuses:
+                    length = int(conn.recv(4), 16)
+                    self.requests.append(conn.recv(length).decode())
+                    conn.sendall(status)
+                    if not status.startswith(b'OKAY'):
+                        return
+                conn.sendall(payload)
+                if hold_open:
+                    self.release.wait(timeout=5)
+        
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+    
+    def close(self):
+        self.release.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._listener.close()
+
+
+@pytest.fixture
+def adb_server(monkeypatch):
+    """Fake adb server that _adb_server_request is pointed at."""
+    server = FakeADBServer()
+    monkeypatch.setenv('ANDROID_ADB_SERVER_PORT', str(server.port))
+    yield server
+    server.close()
+
+
+class TestADBServerRequest:
+    """Test the adb server client used for control commands."""
+    
+    def test_host_service_reply(self, adb_server):
+        """Test a host service is length-prefixed and its reply unframed."""
+        adb_server.serve(b'OKAY', payload=b'001aconnected to 10.0.0.2:5555')
+        
+        reply = _adb_server_request('host:connect:10.0.0.2:5555')
+        
+        assert reply == 'connected to 10.0.0.2:5555'
+        assert adb_server.requests == ['host:connect:10.0.0.2:5555']
+    
+    def test_device_service_routed_to_serial(self, adb_server):
+        """Test a device service switches the transport to the serial first."""
+        adb_server.serve(b'OKAY', b'OKAY', payload=b'done\n')
+        
+        reply = _adb_server_request('shell:echo done', serial='10.0.0.2:5555')
+        
+        assert reply == 'done\n'
+        assert adb_server.requests == ['host:transport:10.0.0.2:5555', 'shell:echo done']
+    
+    def test_rejected_request(self, adb_server):
+        """Test a FAIL status returns None so the caller can fall back."""
+        adb_server.serve(b'FAIL0010device not found')
+        
+        assert _adb_server_request('shell:true', serial='10.0.0.9:5555') is None
+    
+    def test_unreachable_server(self, monkeypatch):
+        """Test a server that is not listening returns None."""
+        with socket.create_server(('127.0.0.1', 0)) as probe:
+            port = probe.getsockname()[1]
+        monkeypatch.setenv('ANDROID_ADB_SERVER_PORT', str(port))
+        
+        assert _adb_server_request('host:version', timeout=1.0) is None
+    
+    def test_timeout_after_accept_is_not_failure(self, adb_server):
+        """Test a timeout once the service runs returns the partial output."""
+        adb_server.serve(b'OKAY', b'OKAY', payload=b'partial', hold_open=True)
+        
+        reply = _adb_server_request('shell:sleep 10', serial='10.0.0.2:5555', timeout=0.3)
+        
+        assert reply == 'partial'
+    
+    def test_shell_falls_back_only_when_not_accepted(self):
+        """Test _adb_shell runs the adb client only if the server did not take it."""
+        monitor = ADBMonitorRaw('192.168.1.68')
+        
+        with patch('monitors.adb_monitor_raw._adb_server_request', return_value=''), \
+                patch('monitors.adb_monitor_raw.subprocess.run') as mock_run:
+            monitor._adb_shell('true', timeout=1)
+        mock_run.assert_not_called()
+        
+        with patch('monitors.adb_monitor_raw._adb_server_request', return_value=None), \
+                patch('monitors.adb_monitor_raw.subprocess.run') as mock_run:
+            monitor._adb_shell('true', timeout=1)
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['adb', '-s', '192.168.1.68:5555', 'shell', 'true']
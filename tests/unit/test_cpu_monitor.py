@@ -3,13 +3,17 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import os
+import struct
 import sys
+from collections import namedtuple
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from monitors.cpu_monitor import CPUMonitor
 
+CPUTimes = namedtuple('CPUTimes', ['user', 'system', 'idle', 'iowait'])
+
 
 class TestCPUMonitorBasic:
     """Test basic CPUMonitor functionality."""
@@ -64,6 +68,68 @@ class TestCPUMonitorMockedData:
         # Just check it returns something reasonable
         assert isinstance(usage, dict)
     
+    @patch('monitors.cpu_monitor.psutil')
+    def test_usage_from_cpu_times_deltas(self, mock_psutil):
+        """Test usage is derived from one cpu_times() sample per call."""
+        mock_psutil.cpu_count.return_value = 2
+        mock_psutil.cpu_times.return_value = [
+            CPUTimes(user=10, system=10, idle=80, iowait=0),
+            CPUTimes(user=50, system=0, idle=40, iowait=10),
+        ]
+        
+        monitor = CPUMonitor()
+        mock_psutil.cpu_times.return_value = [
+            CPUTimes(user=20, system=20, idle=160, iowait=0),   # 20 busy of 100
+            CPUTimes(user=110, system=0, idle=60, iowait=30),   # 60 busy of 100
+        ]
+        mock_psutil.cpu_times.reset_mock()
+        usage = monitor.get_usage()
+        
+        assert usage['per_core'] == [20.0, 60.0]
+        assert usage['total'] == 40.0
+        mock_psutil.cpu_times.assert_called_once_with(percpu=True)
+        mock_psutil.cpu_percent.assert_not_called()
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_loadavg_cached_between_kernel_updates(self, mock_psutil):
+        """Test load averages are re-read only after the 5 s update interval."""
+        mock_psutil.cpu_count.return_value = 4
+        monitor = CPUMonitor()
+        
+        with patch('monitors.cpu_monitor.os.getloadavg', side_effect=[(1.0, 1.0, 1.0), (2.0, 2.0, 2.0)]) as mock_load, \
+                patch('monitors.cpu_monitor.time.monotonic', side_effect=[100.0, 104.9, 105.0]):
+            assert monitor.get_usage()['load_avg'] == (1.0, 1.0, 1.0)
+            assert monitor.get_usage()['load_avg'] == (1.0, 1.0, 1.0)
+            assert monitor.get_usage()['load_avg'] == (2.0, 2.0, 2.0)
+        assert mock_load.call_count == 2
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_per_core_details_fill_missing_fields(self, mock_psutil):
+        """Test per-core times report fields the platform lacks as 0."""
+        mock_psutil.cpu_count.return_value = 1
+        mock_psutil.cpu_times.return_value = [CPUTimes(user=1.5, system=2.5, idle=3.5, iowait=0.5)]
+        
+        monitor = CPUMonitor()
+        details = monitor.get_per_core_details()
+        
+        assert details == [{'core': 0, 'times': {
+            'user': 1.5, 'nice': 0, 'system': 2.5, 'idle': 3.5,
+            'iowait': 0.5, 'irq': 0, 'softirq': 0, 'steal': 0
+        }}]
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_stats_without_syscalls_field(self, mock_psutil):
+        """Test syscalls is reported as 0 when the platform's cpu_stats lacks it."""
+        CPUStats = namedtuple('CPUStats', ['ctx_switches', 'interrupts', 'soft_interrupts'])
+        mock_psutil.cpu_count.return_value = 1
+        mock_psutil.cpu_stats.return_value = CPUStats(10, 20, 30)
+        
+        monitor = CPUMonitor()
+        
+        assert monitor.get_stats() == {
+            'ctx_switches': 10, 'interrupts': 20, 'soft_interrupts': 30, 'syscalls': 0
+        }
+    
     @patch('monitors.cpu_monitor.psutil')
     @pytest.mark.parametrize("cpu_count", [2, 4, 8, 16])
     def test_various_cpu_counts(self, mock_psutil, cpu_count):
@@ -74,6 +140,293 @@ class TestCPUMonitorMockedData:
         assert monitor.cpu_count == cpu_count
 
 
+class TestCPUMonitorSysfsFrequency:
+    """Test the sysfs frequency fallback."""
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_sysfs_files_opened_once(self, mock_psutil, tmp_path):
+        """Test frequency files are opened once and re-read on each call."""
+        mock_psutil.cpu_count.return_value = 2
+        freq_files = {}
+        for cpu_id in range(2):
+            path = tmp_path / f'cpu{cpu_id}'
+            path.write_text('1200000\n')
+            freq_files[f'/sys/devices/system/cpu/cpu{cpu_id}/cpufreq/scaling_cur_freq'] = path
+        
+        real_open = os.open
+        opened = []
+        
+        def fake_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(freq_files[path], *args, **kwargs)
+        
+        monitor = CPUMonitor()
+        with patch('monitors.cpu_monitor.os.open', side_effect=fake_open):
+            first = monitor._get_frequency_from_sysfs()
+            freq_files['/sys/devices/system/cpu/cpu1/cpufreq/scaling_cur_freq'].write_text('2400000\n')
+            second = monitor._get_frequency_from_sysfs()
+        
+        assert opened == list(freq_files)
+        assert first == {'per_core': [1200.0, 1200.0], 'average': 1200.0}
+        assert second == {'per_core': [1200.0, 2400.0], 'average': 1800.0}
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_cpuinfo_used_without_sysfs(self, mock_psutil, tmp_path):
+        """Test /proc/cpuinfo is used when no cpufreq files exist."""
+        mock_psutil.cpu_count.return_value = 2
+        cpuinfo = tmp_path / 'cpuinfo'
+        cpuinfo.write_text('processor\t: 0\ncpu MHz\t\t: 2000.000\n\n'
+                           'processor\t: 1\ncpu MHz\t\t: 3000.500\n')
+        
+        monitor = CPUMonitor()
+        with patch('monitors.cpu_monitor._CPUINFO_PATH', str(cpuinfo)), \
+                patch.object(monitor, '_open_freq_fds', return_value=[]):
+            first = monitor.get_frequency()
+            second = monitor.get_frequency()
+        
+        assert monitor._freq_use_cpuinfo
+        assert first == second == {'per_core': [2000.0, 3000.5], 'average': 2500.25}
+        mock_psutil.cpu_freq.assert_not_called()
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_cpuinfo_used_when_sysfs_slow(self, mock_psutil):
+        """Test several slow sysfs sweeps in a row switch to /proc/cpuinfo."""
+        mock_psutil.cpu_count.return_value = 2
+        sysfs = {'per_core': [1200.0, 1200.0], 'average': 1200.0}
+        cpuinfo = {'per_core': [1190.0, 1210.0], 'average': 1200.0}
+        
+        monitor = CPUMonitor()
+        with patch.object(monitor, '_open_freq_fds', return_value=[3, 4]), \
+                patch.object(monitor, '_get_frequency_from_sysfs', return_value=sysfs), \
+                patch.object(monitor, '_get_frequency_from_cpuinfo', return_value=cpuinfo), \
+                patch('monitors.cpu_monitor.time.perf_counter',
+                      side_effect=[0.0, 0.005, 1.0, 1.005, 2.0, 2.005]):
+            assert monitor.get_frequency() == sysfs
+            assert monitor.get_frequency() == sysfs
+            assert monitor.get_frequency() == cpuinfo
+            assert monitor.get_frequency() == cpuinfo
+        
+        assert monitor._freq_use_cpuinfo
+        monitor._freq_fds = None  # Fake descriptors: nothing to close
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_sysfs_kept_after_slow_first_sweep(self, mock_psutil):
+        """Test one slow sweep (e.g. preemption) does not abandon sysfs."""
+        mock_psutil.cpu_count.return_value = 2
+        sysfs = {'per_core': [1200.0, 1200.0], 'average': 1200.0}
+        
+        monitor = CPUMonitor()
+        with patch.object(monitor, '_open_freq_fds', return_value=[3, 4]), \
+                patch.object(monitor, '_get_frequency_from_sysfs', return_value=sysfs), \
+                patch.object(monitor, '_get_frequency_from_cpuinfo') as mock_cpuinfo, \
+                patch('monitors.cpu_monitor.time.perf_counter',
+                      side_effect=[0.0, 0.005, 1.0, 1.0001, 2.0, 2.005, 3.0, 3.005]):
+            for _ in range(4):
+                assert monitor.get_frequency() == sysfs
+        
+        assert not monitor._freq_use_cpuinfo
+        mock_cpuinfo.assert_not_called()
+        monitor._freq_fds = None  # Fake descriptors: nothing to close
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_slow_sysfs_kept_without_cpuinfo_mhz(self, mock_psutil):
+        """Test slow sysfs stays in use when /proc/cpuinfo has no "cpu MHz" (ARM)."""
+        mock_psutil.cpu_count.return_value = 2
+        sysfs = {'per_core': [1800.0, 1800.0], 'average': 1800.0}
+        
+        monitor = CPUMonitor()
+        with patch.object(monitor, '_open_freq_fds', return_value=[3, 4]), \
+                patch.object(monitor, '_get_frequency_from_sysfs', return_value=sysfs), \
+                patch.object(monitor, '_get_frequency_from_cpuinfo',
+                             return_value={'per_core': [], 'average': 0}) as mock_cpuinfo, \
+                patch('monitors.cpu_monitor.time.perf_counter',
+                      side_effect=[0.0, 0.005, 1.0, 1.005, 2.0, 2.005]):
+            for _ in range(5):
+                assert monitor.get_frequency() == sysfs
+        
+        assert not monitor._freq_use_cpuinfo
+        mock_cpuinfo.assert_called_once()
+        monitor._freq_fds = None  # Fake descriptors: nothing to close
+
+
+class TestCPUMonitorRapl:
+    """Test RAPL package power readings."""
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_power_from_cached_counter(self, mock_psutil, tmp_path):
+        """Test power is read from the kept-open counter, including wrap-around."""
+        mock_psutil.cpu_count.return_value = 4
+        energy = tmp_path / 'energy_uj'
+        energy.write_text('999000000\n')
+        max_range = tmp_path / 'max_energy_range_uj'
+        max_range.write_text('1000000000\n')
+    
+        with patch('monitors.cpu_monitor._RAPL_ENERGY_PATH', str(energy)), \
+                patch('monitors.cpu_monitor._RAPL_MAX_RANGE_PATH', str(max_range)), \
+                patch('monitors.cpu_monitor._open_rapl_perf_counter', return_value=None):
+            monitor = CPUMonitor()
+        assert monitor._rapl_available
+    
+        with patch('time.time', side_effect=[100.0, 102.0]):
+            assert monitor.get_power() is None  # First sample
+            energy.write_text('9000000\n')  # Wrapped: 10 J consumed
+            assert monitor.get_power() == pytest.approx(5.0)
+        monitor.close()
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_power_wrap_with_power_of_two_range(self, mock_psutil, tmp_path):
+        """Test wrap-around is masked when the counter range is a power of two."""
+        mock_psutil.cpu_count.return_value = 4
+        energy = tmp_path / 'energy_uj'
+        energy.write_text(f'{2**32 - 2_000_000}\n')
+        max_range = tmp_path / 'max_energy_range_uj'
+        max_range.write_text(f'{2**32}\n')
+        
+        with patch('monitors.cpu_monitor._RAPL_ENERGY_PATH', str(energy)), \
+                patch('monitors.cpu_monitor._RAPL_MAX_RANGE_PATH', str(max_range)), \
+                patch('monitors.cpu_monitor._open_rapl_perf_counter', return_value=None):
+            monitor = CPUMonitor()
+        assert monitor._rapl_wrap_mask == 2**32 - 1
+        
+        with patch('time.time', side_effect=[100.0, 101.0]):
+            assert monitor.get_power() is None  # First sample
+            energy.write_text('1000000\n')  # Wrapped: 3 J consumed
+            assert monitor.get_power() == pytest.approx(3.0)
+        monitor.close()
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_power_from_perf_counter(self, mock_psutil):
+        """Test power from the perf energy-pkg counter when it can be opened."""
+        mock_psutil.cpu_count.return_value = 4
+        read_fd, write_fd = os.pipe()
+        
+        with patch('monitors.cpu_monitor._open_rapl_perf_counter', return_value=(read_fd, 0.5)):
+            monitor = CPUMonitor()
+        assert monitor._rapl_available
+        
+        # Counts are scaled to uJ: 0.5 uJ per count
+        os.write(write_fd, struct.pack('Q', 10_000_000))
+        os.write(write_fd, struct.pack('Q', 50_000_000))
+        with patch('time.time', side_effect=[100.0, 104.0]):
+            assert monitor.get_power() is None  # First sample
+            assert monitor.get_power() == pytest.approx(5.0)
+        monitor.close()
+        os.close(write_fd)
+
+
+class TestCPUMonitorTemperature:
+    """Test temperature sensor lookup."""
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_sensor_name_cached(self, mock_psutil, tmp_path):
+        """Test the matching sensor name is resolved once and reused."""
+        mock_psutil.cpu_count.return_value = 4
+        entry = MagicMock(label='Package id 0', current=55.0)
+        mock_psutil.sensors_temperatures.return_value = {'acpitz': [], 'coretemp': [entry]}
+    
+        with patch('monitors.cpu_monitor._HWMON_DIR', str(tmp_path)):
+            monitor = CPUMonitor()
+        first = monitor.get_temperature()
+        second = monitor.get_temperature()
+    
+        assert monitor._temp_sensor == 'coretemp'
+        assert first == second == {'coretemp': [{'label': 'Package id 0', 'current': 55.0}]}
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_hwmon_inputs_read_directly(self, mock_psutil, tmp_path):
+        """Test the preferred hwmon device is read without psutil."""
+        mock_psutil.cpu_count.return_value = 4
+        for hwmon, name in (('hwmon0', 'acpitz'), ('hwmon1', 'coretemp')):
+            device = tmp_path / hwmon
+            device.mkdir()
+            (device / 'name').write_text(f'{name}\n')
+            (device / 'temp1_input').write_text('40000\n')
+        (tmp_path / 'hwmon1' / 'temp1_label').write_text('Package id 0\n')
+        (tmp_path / 'hwmon1' / 'temp2_input').write_text('52500\n')
+        
+        with patch('monitors.cpu_monitor._HWMON_DIR', str(tmp_path)):
+            monitor = CPUMonitor()
+        temps = monitor.get_temperature()
+        
+        assert temps == {'coretemp': [
+            {'label': 'Package id 0', 'current': 40.0},
+            {'label': 'Core 1', 'current': 52.5},
+        ]}
+        mock_psutil.sensors_temperatures.assert_not_called()
+        monitor.close()
+
+    @patch('monitors.cpu_monitor.psutil')
+    def test_sensor_rediscovered_after_hwmon_renumbering(self, mock_psutil, tmp_path):
+        """Test a vanished hwmon device is looked up again instead of cached forever."""
+        mock_psutil.cpu_count.return_value = 4
+        old_device = tmp_path / 'hwmon1'
+        old_device.mkdir()
+        (old_device / 'name').write_text('coretemp\n')
+        (old_device / 'temp1_input').write_text('40000\n')
+        
+        with patch('monitors.cpu_monitor._HWMON_DIR', str(tmp_path)):
+            monitor = CPUMonitor()
+            assert monitor.get_temperature()['coretemp'][0]['current'] == 40.0
+            
+            # Driver reload: the device comes back as hwmon7, the old file is gone
+            (old_device / 'temp1_input').unlink()
+            (old_device / 'name').unlink()
+            old_device.rmdir()
+            new_device = tmp_path / 'hwmon7'
+            new_device.mkdir()
+            (new_device / 'name').write_text('coretemp\n')
+            (new_device / 'temp1_input').write_text('48000\n')
+            os.close(monitor._temp_fds[0][1])  # Reads on the stale file now fail
+            
+            mock_psutil.sensors_temperatures.return_value = {
+                'coretemp': [MagicMock(label='', current=48.0)]}
+            assert monitor.get_temperature() == {'coretemp': [{'label': 'Core 0', 'current': 48.0}]}
+            mock_psutil.sensors_temperatures.reset_mock()
+            assert monitor.get_temperature() == {'coretemp': [{'label': 'Core 0', 'current': 48.0}]}
+        
+        mock_psutil.sensors_temperatures.assert_not_called()
+        assert monitor._temp_sensor == 'coretemp'
+        monitor.close()
+    
+    @patch('monitors.cpu_monitor.psutil')
+    def test_hwmon_inputs_of_every_socket(self, mock_psutil, tmp_path):
+        """Test each same-named hwmon device (one per socket) is read."""
+        mock_psutil.cpu_count.return_value = 4
+        for hwmon, package, reading in (('hwmon1', 0, '41000\n'), ('hwmon2', 1, '47000\n')):
+            device = tmp_path / hwmon
+            device.mkdir()
+            (device / 'name').write_text('coretemp\n')
+            (device / 'temp1_input').write_text(reading)
+            (device / 'temp1_label').write_text(f'Package id {package}\n')
+        
+        with patch('monitors.cpu_monitor._HWMON_DIR', str(tmp_path)):
+            monitor = CPUMonitor()
+        
+        assert monitor.get_temperature() == {'coretemp': [
+            {'label': 'Package id 0', 'current': 41.0},
+            {'label': 'Package id 1', 'current': 47.0},
+        ]}
+        mock_psutil.sensors_temperatures.assert_not_called()
+        monitor.close()
+
+
+class TestCPUMonitorModule:
+    """Test the module layout."""
+    
+    def test_single_class_definition(self):
+        """Test cpu_monitor.py defines CPUMonitor exactly once (the RAPL-enabled one)."""
+        import ast
+        import monitors.cpu_monitor as cpu_monitor
+        
+        with open(cpu_monitor.__file__) as f:
+            tree = ast.parse(f.read())
+        
+        definitions = [node for node in ast.walk(tree)
+                       if isinstance(node, ast.ClassDef) and node.name == 'CPUMonitor']
+        assert len(definitions) == 1
+        assert hasattr(CPUMonitor, 'get_power')
+
+
 class TestCPUMonitorThreadSafety:
     """Test thread safety (basic checks)."""
     
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import os
+import select
 import sys
 
 # Add src to path
@@ -92,6 +93,34 @@ class TestDiskMonitorGetDisks:
         
         assert 'loop0' in disks
 
+    
+    @patch('monitors.disk_monitor.psutil.disk_io_counters')
+    def test_get_disks_follows_hotplug(self, mock_counters):
+        """Test the cached disk list is refreshed when the device set changes."""
+        mock_counters.return_value = {'sda': MagicMock(), 'loop0': MagicMock()}
+        monitor = DiskMonitor()
+        
+        assert monitor.get_disks() == ['sda']
+        assert monitor.get_disks() == ['sda']
+        
+        mock_counters.return_value = {'sda': MagicMock(), 'sdb': MagicMock(), 'loop0': MagicMock()}
+        monitor._cur_counters_ts -= 1.0
+        assert monitor.get_disks() == ['sda', 'sdb']
+    
+    @patch('monitors.disk_monitor.psutil.disk_io_counters')
+    def test_perdisk_counters_shared_within_tick(self, mock_counters):
+        """Test get_disks and per-disk get_io_stats share one counters snapshot."""
+        mock_disk = MagicMock(read_bytes=0, write_bytes=0, read_count=0, write_count=0,
+                              read_time=0, write_time=0)
+        mock_counters.return_value = {'sda': mock_disk}
+        monitor = DiskMonitor()
+        calls = mock_counters.call_count
+        
+        monitor.get_disks()
+        monitor.get_io_stats('sda')
+        
+        assert mock_counters.call_count == calls + 1
+
 
 class TestDiskMonitorPartitions:
     """Test partition information."""
@@ -198,6 +227,7 @@ class TestDiskMonitorIOStats:
         mock_init.write_count = 20
         mock_init.read_time = 100
         mock_init.write_time = 200
+        mock_init.busy_time = 100
         
         # Mock current
         mock_current = MagicMock()
@@ -207,6 +237,7 @@ class TestDiskMonitorIOStats:
         mock_current.write_count = 40
         mock_current.read_time = 200
         mock_current.write_time = 400
+        mock_current.busy_time = 350  # 250 ms busy in 1 s
         
         mock_counters.side_effect = [
             {'total': mock_init},
@@ -220,6 +251,9 @@ class TestDiskMonitorIOStats:
         assert 'write_speed' in stats
         assert stats['read_speed'] == 1000.0  # bytes/sec
         assert stats['write_speed'] == 2000.0  # bytes/sec
+        assert stats['utilization'] == pytest.approx(25.0)
+        assert monitor.get_io_utilization() == pytest.approx(25.0)
+        assert mock_counters.call_count == 2  # Utilization reuses the stats above
     
     @patch('monitors.disk_monitor.psutil.disk_io_counters')
     @patch('monitors.disk_monitor.time.time')
@@ -234,6 +268,7 @@ class TestDiskMonitorIOStats:
         mock_sda_init.write_count = 20
         mock_sda_init.read_time = 100
         mock_sda_init.write_time = 200
+        mock_sda_init.busy_time = 1000
         
         mock_sda_current = MagicMock()
         mock_sda_current.read_bytes = 3000
@@ -242,6 +277,7 @@ class TestDiskMonitorIOStats:
         mock_sda_current.write_count = 50
         mock_sda_current.read_time = 300
         mock_sda_current.write_time = 500
+        mock_sda_current.busy_time = 1500
         
         mock_counters.side_effect = [
             {'sda': mock_sda_init},
@@ -255,6 +291,7 @@ class TestDiskMonitorIOStats:
         assert 'write_speed' in stats
         assert stats['read_speed'] == 2000.0
         assert stats['write_speed'] == 3000.0
+        assert stats['utilization'] == pytest.approx(50.0)
 
 
 class TestDiskMonitorGetAllInfo:
@@ -304,6 +341,76 @@ class TestDiskMonitorGetAllInfo:
         assert isinstance(info['disks'], list)
         assert isinstance(info['partitions'], list)
         assert isinstance(info['io_stats'], dict)
+    
+    @patch('monitors.disk_monitor.psutil.disk_io_counters')
+    def test_get_all_info_throttles_partitions(self, mock_counters):
+        """Test partition data is refreshed only every Nth call."""
+        mock_counters.return_value = {}
+        
+        monitor = DiskMonitor()
+        with patch.object(monitor, '_scan_partitions', return_value=([], [])) as mock_scan:
+            for _ in range(10):
+                monitor.get_all_info()
+            assert mock_scan.call_count == 1
+            
+            monitor.get_all_info()  # 11th call refreshes
+            assert mock_scan.call_count == 2
+    
+    @patch('monitors.disk_monitor.os.statvfs')
+    @patch('monitors.disk_monitor.psutil.disk_io_counters')
+    def test_scan_partitions_from_mount_table(self, mock_counters, mock_statvfs, tmp_path):
+        """Test one mount table pass yields partitions and their usage."""
+        mock_counters.return_value = {}
+        filesystems = tmp_path / 'filesystems'
+        filesystems.write_text('nodev\tsysfs\nnodev\ttmpfs\n\text4\n\tvfat\n')
+        mounts = tmp_path / 'mounts'
+        mounts.write_text(
+            '/dev/sda2 / ext4 rw,relatime 0 0\n'
+            'sysfs /sys sysfs rw 0 0\n'
+            'tmpfs /run tmpfs rw 0 0\n'
+            '/dev/sda1 /boot/my\\040efi vfat rw 0 0\n'
+        )
+        # 100 GiB total, 40 GiB used, 50 GiB available to users
+        mock_statvfs.return_value = MagicMock(
+            f_frsize=4096, f_blocks=100 * 262144, f_bfree=60 * 262144, f_bavail=50 * 262144)
+        
+        with patch('monitors.disk_monitor._FILESYSTEMS_PATH', str(filesystems)), \
+                patch('monitors.disk_monitor._MOUNTS_PATH', str(mounts)):
+            monitor = DiskMonitor()
+            partitions, usage_list = monitor._scan_partitions()
+        
+        assert [p['mountpoint'] for p in partitions] == ['/', '/boot/my efi']
+        assert partitions[1] == {'device': '/dev/sda1', 'mountpoint': '/boot/my efi',
+                                 'fstype': 'vfat', 'opts': 'rw'}
+        assert usage_list[0]['total'] == pytest.approx(100.0)
+        assert usage_list[0]['used'] == pytest.approx(40.0)
+        assert usage_list[0]['free'] == pytest.approx(50.0)
+        assert usage_list[0]['percent'] == 44.4
+        assert usage_list[0]['device'] == '/dev/sda2'
+    
+    @patch('monitors.disk_monitor.os.statvfs')
+    @patch('monitors.disk_monitor.psutil.disk_io_counters')
+    def test_mount_table_reread_only_on_change(self, mock_counters, mock_statvfs, tmp_path):
+        """Test the mount table is parsed again only after a mount change is signalled."""
+        mock_counters.return_value = {}
+        mock_statvfs.return_value = MagicMock(f_frsize=4096, f_blocks=10, f_bfree=5, f_bavail=5)
+        filesystems = tmp_path / 'filesystems'
+        filesystems.write_text('\text4\n')
+        mounts = tmp_path / 'mounts'
+        mounts.write_text('/dev/sda2 / ext4 rw 0 0\n')
+        
+        with patch('monitors.disk_monitor._FILESYSTEMS_PATH', str(filesystems)), \
+                patch('monitors.disk_monitor._MOUNTS_PATH', str(mounts)):
+            monitor = DiskMonitor()
+            assert len(monitor._scan_partitions()[0]) == 1
+            
+            mounts.write_text('/dev/sda2 / ext4 rw 0 0\n/dev/sdb1 /data ext4 rw 0 0\n')
+            assert len(monitor._scan_partitions()[0]) == 1  # No mount event yet
+            
+            monitor._mounts_poll = MagicMock()
+            monitor._mounts_poll.poll.return_value = [(monitor._mounts_fd, select.POLLPRI)]
+            assert len(monitor._scan_partitions()[0]) == 2
+            monitor.close()
 
 
 class TestDiskMonitorEdgeCases:
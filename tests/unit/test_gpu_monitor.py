@@ -2,13 +2,47 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock, mock_open
+import gc
 import os
 import sys
+import time
+import weakref
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from monitors.gpu_monitor import GPUMonitor
+from monitors.gpu_monitor import GPUMonitor, _lspci, _read_pci_slot_name, _scan_drm_cards
+
+
+@pytest.fixture(autouse=True)
+def no_gpu_tools_on_path():
+    """Keep detection independent of the GPU tools installed on the test host."""
+    with patch('monitors.gpu_monitor.shutil.which', return_value=None) as mock_which:
+        yield mock_which
+
+
+def _probe_drm_cards():
+    """_scan_drm_cards() through os.path.exists/open, which these tests patch."""
+    cards = []
+    try:
+        for card_num in range(10):
+            vendor_path = f'/sys/class/drm/card{card_num}/device/vendor'
+            if os.path.exists(vendor_path):
+                with open(vendor_path, 'r') as f:
+                    try:
+                        cards.append((card_num, int(f.read().strip(), 16)))
+                    except ValueError:
+                        pass
+    except Exception:
+        pass
+    return cards
+
+
+@pytest.fixture(autouse=True)
+def drm_cards_from_mocks():
+    """Let the per-test os.path.exists/open mocks define the DRM cards."""
+    with patch('monitors.gpu_monitor._scan_drm_cards', side_effect=_probe_drm_cards):
+        yield
 
 
 class TestGPUMonitorDetection:
@@ -98,35 +132,22 @@ class TestGPUMonitorDetection:
     
     @patch('monitors.gpu_monitor.subprocess.run')
     @patch('os.path.exists')
-    def test_detect_nvidia_via_command(self, mock_exists, mock_subprocess):
+    def test_detect_nvidia_via_command(self, mock_exists, mock_subprocess, no_gpu_tools_on_path):
         """Test NVIDIA GPU detection via nvidia-smi command."""
         mock_exists.return_value = False
-        
-        def subprocess_side_effect(cmd, **kwargs):
-            if 'nvidia-smi' in cmd:
-                return MagicMock(returncode=0)
-            return MagicMock(returncode=1)
-        
-        mock_subprocess.side_effect = subprocess_side_effect
+        no_gpu_tools_on_path.side_effect = lambda tool: '/usr/bin/nvidia-smi' if tool == 'nvidia-smi' else None
         
         with patch.dict('sys.modules', {'pynvml': None}):
             monitor = GPUMonitor()
             assert monitor.gpu_type == 'nvidia'
+        mock_subprocess.assert_not_called()  # PATH lookup, no 'which' process
     
     @patch('monitors.gpu_monitor.subprocess.run')
     @patch('os.path.exists')
-    def test_detect_amd_via_command(self, mock_exists, mock_subprocess):
+    def test_detect_amd_via_command(self, mock_exists, mock_subprocess, no_gpu_tools_on_path):
         """Test AMD GPU detection via rocm-smi command."""
         mock_exists.return_value = False
-        
-        def subprocess_side_effect(cmd, **kwargs):
-            if 'rocm-smi' in cmd:
-                return MagicMock(returncode=0)
-            elif 'nvidia-smi' in cmd:
-                return MagicMock(returncode=1)
-            return MagicMock(returncode=1)
-        
-        mock_subprocess.side_effect = subprocess_side_effect
+        no_gpu_tools_on_path.side_effect = lambda tool: '/opt/rocm/bin/rocm-smi' if tool == 'rocm-smi' else None
         
         monitor = GPUMonitor()
         assert monitor.gpu_type == 'amd'
@@ -168,6 +189,222 @@ class TestGPUMonitorIntelMethods:
         
         assert isinstance(info, dict)
     
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open, read_data='0x8086')
+    def test_intel_discovery_cached(self, mock_file, mock_exists, mock_subprocess):
+        """Test card paths are probed in __init__, not on every get_intel_info call."""
+        mock_exists.return_value = True
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        
+        monitor = GPUMonitor()
+        assert monitor._intel_card_num == 0
+        assert monitor._intel_driver == 'xe'
+        assert monitor._intel_freq_path.endswith('card0/device/tile0/gt0/freq0/act_freq')
+        assert monitor._intel_xe_idle_path.endswith('card0/device/tile0/gt0/gtidle/idle_residency_ms')
+        
+        mock_exists.reset_mock()
+        with patch.object(monitor, '_get_intel_gpu_utilization_from_debugfs', return_value=None), \
+                patch.object(monitor, '_get_intel_gpu_memory_from_debugfs', return_value=None), \
+                patch.object(monitor, '_get_xe_gpu_utilization', return_value=None), \
+                patch.object(monitor, '_get_xe_gpu_memory', return_value=None):
+            mock_subprocess.reset_mock()
+            monitor.get_intel_info()
+        
+        mock_exists.assert_not_called()
+        mock_subprocess.assert_not_called()
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open, read_data='0x8086')
+    def test_xe_collector_bound_at_discovery(self, mock_file, mock_exists, mock_subprocess):
+        """Test an Xe GPU without i915 debugfs files is sampled without i915 probes."""
+        mock_exists.return_value = True
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        
+        with patch.object(GPUMonitor, '_find_debugfs_file', return_value=(None, False)):
+            monitor = GPUMonitor(poll_interval=0)
+        assert monitor._collect_intel == monitor._collect_xe_info
+        
+        with patch.object(monitor, '_read_sysfs_int', return_value=1200), \
+                patch.object(monitor, '_get_intel_gpu_utilization_from_debugfs') as mock_i915_util, \
+                patch.object(monitor, '_get_intel_gpu_memory_from_debugfs') as mock_i915_mem, \
+                patch.object(monitor, '_get_xe_gpu_utilization', return_value=40.0), \
+                patch.object(monitor, '_get_xe_gpu_memory', return_value=(512 * 1024 * 1024, 2048 * 1024 * 1024)):
+            info = monitor.get_intel_info()
+        
+        mock_i915_util.assert_not_called()
+        mock_i915_mem.assert_not_called()
+        assert info['gpu_util'] == 40
+        assert info['memory_used'] == 512
+        assert info['memory_util'] == 25
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_sysfs_counters_read_through_cached_fds(self, mock_exists, mock_subprocess, tmp_path):
+        """Test frequency and Xe idle residency are re-read with pread, not reopened."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        
+        freq = tmp_path / 'act_freq'
+        idle = tmp_path / 'idle_residency_ms'
+        freq.write_text('1200\n')
+        idle.write_text('1000\n')
+        monitor._intel_freq_path, monitor._intel_xe_idle_path = str(freq), str(idle)
+        monitor._intel_xe_card_num = 0
+        monitor._intel_freq_fd = monitor._open_sysfs(str(freq))
+        monitor._intel_xe_idle_fd = monitor._open_sysfs(str(idle))
+        
+        with patch('monitors.gpu_monitor.os.open') as mock_os_open, \
+                patch('monitors.gpu_monitor.time.monotonic_ns', side_effect=[10_000_000_000, 11_000_000_000]):
+            assert monitor._read_sysfs_int('_intel_freq_fd', str(freq)) == 1200
+            assert monitor._get_xe_gpu_utilization(0) == 0.0
+            
+            freq.write_text('300\n')
+            idle.write_text('1750\n')  # 750 ms idle in 1 s
+            assert monitor._read_sysfs_int('_intel_freq_fd', str(freq)) == 300
+            assert monitor._get_xe_gpu_utilization(0) == pytest.approx(25.0)
+        
+        mock_os_open.assert_not_called()
+        monitor.close()
+        assert monitor._intel_freq_fd is None
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_debugfs_read_without_sudo_when_permitted(self, mock_exists, mock_subprocess):
+        """Test debugfs files that open directly are read without spawning sudo."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        
+        def open_side_effect(path, *args, **kwargs):
+            if path.startswith('/sys/kernel/debug/dri/1/'):
+                return mock_open(read_data='rcs0\n        Runtime: 1500ms\n')()
+            raise PermissionError(path)
+        
+        with patch('builtins.open', side_effect=open_side_effect):
+            path, direct = monitor._find_debugfs_file('i915_engine_info')
+            assert (path, direct) == ('/sys/kernel/debug/dri/1/i915_engine_info', True)
+            
+            mock_subprocess.reset_mock()
+            assert monitor._read_debugfs(path, direct).startswith('rcs0')
+        mock_subprocess.assert_not_called()
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_i915_utilization_from_rcs0_runtime(self, mock_exists, mock_subprocess):
+        """Test utilization is derived from the rcs0 Runtime delta, not other engines."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        monitor._i915_engine_path = '/sys/kernel/debug/dri/0/i915_engine_info'
+        
+        engine_info = 'vcs0\n\tRuntime: {vcs}ms\nrcs0\n\tAwake? 1\n\tRuntime: {rcs}ms\n'
+        samples = [engine_info.format(vcs=0, rcs=1000), engine_info.format(vcs=900, rcs=1250)]
+        with patch.object(monitor, '_read_debugfs', side_effect=samples), \
+                patch('monitors.gpu_monitor.time.monotonic_ns', side_effect=[10_000_000_000, 11_000_000_000]):
+            assert monitor._get_intel_gpu_utilization_from_debugfs() == 0.0
+            assert monitor._get_intel_gpu_utilization_from_debugfs() == pytest.approx(25.0)
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_i915_memory_total_parsed_once(self, mock_exists, mock_subprocess):
+        """Test used bytes come from the first line and the system total is cached."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        monitor._i915_gem_path = '/sys/kernel/debug/dri/0/i915_gem_objects'
+        
+        gem_objects = ('3787 shrinkable [0 free] objects, 4150968320 bytes\n'
+                       'system: total:0x0000000f9effa000 bytes\n')
+        samples = [gem_objects, '12 shrinkable [0 free] objects, 8192 bytes\n']
+        with patch.object(monitor, '_read_debugfs', side_effect=samples):
+            assert monitor._get_intel_gpu_memory_from_debugfs() == (4150968320, 0xf9effa000)
+            assert monitor._get_intel_gpu_memory_from_debugfs() == (8192, 0xf9effa000)
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_xe_memory_reads_only_drm_fdinfo(self, mock_exists, mock_subprocess, tmp_path):
+        """Test only fdinfo of fds pointing at /dev/dri is opened and summed."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        
+        proc = tmp_path / '1234'
+        (proc / 'fd').mkdir(parents=True)
+        (proc / 'fdinfo').mkdir()
+        (tmp_path / 'self').mkdir()
+        meminfo = tmp_path / 'meminfo'
+        meminfo.write_text('MemTotal:       16384 kB\nMemFree:        8192 kB\n')
+        os.symlink('/dev/dri/renderD128', proc / 'fd' / '5')
+        os.symlink('/tmp/log.txt', proc / 'fd' / '6')
+        os.symlink('/dev/dri/card1', proc / 'fd' / '7')
+        (proc / 'fdinfo' / '5').write_text(
+            'drm-driver:\txe\ndrm-total-gtt:\t100 KiB\ndrm-total-system:\t2 MiB\n'
+            'drm-total-stolen:\t0\ndrm-resident-gtt:\t50 KiB\n')
+        (proc / 'fdinfo' / '7').write_text('drm-driver:\ti915\ndrm-total-system:\t64 KiB\n')
+        (proc / 'fdinfo' / '6').write_text('drm-driver:\txe\ndrm-total-gtt:\t999 KiB\n')
+        
+        real_open = open
+        opened = []
+        
+        def tracking_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+        
+        with patch('monitors.gpu_monitor._PROC_DIR', str(tmp_path)), \
+                patch('monitors.gpu_monitor._MEMINFO_PATH', str(meminfo)), \
+                patch('builtins.open', side_effect=tracking_open):
+            used, total = monitor._get_xe_gpu_memory()
+            meminfo.unlink()
+            assert monitor._get_xe_gpu_memory()[1] == total  # MemTotal read once
+        
+        assert used == 100 * 1024 + 2 * 1024 * 1024
+        assert total == 16384 * 1024
+        assert str(proc / 'fdinfo' / '6') not in opened
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_xe_memory_rescan_skipped_while_idle(self, mock_exists, mock_subprocess, tmp_path):
+        """Test /proc is not rescanned for 30 s after a scan found no Xe clients."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        monitor._mem_total_bytes = 1024
+        
+        with patch('monitors.gpu_monitor._PROC_DIR', str(tmp_path)), \
+                patch('monitors.gpu_monitor.time.monotonic', side_effect=[100.0, 110.0, 131.0]), \
+                patch('monitors.gpu_monitor.os.scandir', wraps=os.scandir) as mock_scandir:
+            assert monitor._get_xe_gpu_memory() == (0, 1024)
+            assert mock_scandir.call_count == 1
+            
+            assert monitor._get_xe_gpu_memory() == (0, 1024)
+            assert mock_scandir.call_count == 1
+            
+            assert monitor._get_xe_gpu_memory() == (0, 1024)
+            assert mock_scandir.call_count == 2
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_debugfs_sudo_fallback(self, mock_exists, mock_subprocess):
+        """Test debugfs files fall back to 'sudo -n cat' when not directly readable."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        
+        def subprocess_side_effect(cmd, **kwargs):
+            if cmd[-1] == '/sys/kernel/debug/dri/128/i915_gem_objects':
+                return MagicMock(returncode=0, stdout='10 objects, 4096 bytes')
+            return MagicMock(returncode=1)
+        
+        mock_subprocess.side_effect = subprocess_side_effect
+        with patch('builtins.open', side_effect=PermissionError):
+            path, direct = monitor._find_debugfs_file('i915_gem_objects')
+        
+        assert (path, direct) == ('/sys/kernel/debug/dri/128/i915_gem_objects', False)
+        assert monitor._read_debugfs(path, direct) == '10 objects, 4096 bytes'
+    
     @patch('monitors.gpu_monitor.subprocess.run')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data='0x8086')
@@ -208,7 +445,8 @@ class TestGPUMonitorIntelMethods:
     @patch('monitors.gpu_monitor.subprocess.run')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data='0x8086')
-    def test_check_intel_gpu_via_intel_gpu_top(self, mock_file, mock_exists, mock_subprocess):
+    def test_check_intel_gpu_via_intel_gpu_top(self, mock_file, mock_exists, mock_subprocess,
+                                               no_gpu_tools_on_path):
         """Test Intel GPU detection via intel_gpu_top command."""
         def exists_side_effect(path):
             if 'vendor' in path:
@@ -217,18 +455,13 @@ class TestGPUMonitorIntelMethods:
         
         mock_exists.side_effect = exists_side_effect
         
-        # Mock 'which intel_gpu_top' returns success
-        def subprocess_side_effect(cmd, **kwargs):
-            if 'intel_gpu_top' in cmd:
-                return MagicMock(returncode=0)
-            return MagicMock(returncode=1)
-        
-        mock_subprocess.side_effect = subprocess_side_effect
+        # intel_gpu_top is on PATH
+        no_gpu_tools_on_path.side_effect = lambda tool: '/usr/bin/intel_gpu_top' if tool == 'intel_gpu_top' else None
         
         monitor = GPUMonitor()
         result = monitor._check_intel_gpu()
         
-        assert isinstance(result, bool)
+        assert result is True
 
 
 class TestGPUMonitorNVIDIAMethods:
@@ -250,6 +483,23 @@ class TestGPUMonitorNVIDIAMethods:
             # Should return empty dict or handle gracefully
             assert isinstance(info, dict)
     
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open, read_data='0x10de')
+    def test_nvidia_sysfs_name_read_once(self, mock_file, mock_exists, mock_subprocess):
+        """Test the driverless NVIDIA card is named once, not on every poll."""
+        mock_exists.return_value = True
+        
+        with patch.dict('sys.modules', {'pynvml': None}):
+            monitor = GPUMonitor(poll_interval=0)
+        
+        first = monitor.get_nvidia_info()
+        mock_file.reset_mock()
+        mock_exists.reset_mock()
+        assert monitor.get_nvidia_info()['name'] == first['name'] == 'NVIDIA GPU (0x10de)'
+        mock_file.assert_not_called()
+        mock_exists.assert_not_called()
+    
     @patch('monitors.gpu_monitor.subprocess.run')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data='0x10de')
@@ -284,12 +534,66 @@ class TestGPUMonitorNVIDIAMethods:
         mock_pynvml.nvmlDeviceGetTemperature.return_value = 65
         mock_pynvml.NVML_TEMPERATURE_GPU = 0
         
-        with patch.dict('sys.modules', {'pynvml': mock_pynvml}):
+        with patch.dict('sys.modules', {'pynvml': mock_pynvml}), \
+                patch('monitors.gpu_monitor._nvml_loadable', return_value=True):
             monitor = GPUMonitor()
             
             if monitor.nvidia_available:
                 info = monitor.get_nvidia_info()
                 assert isinstance(info, dict)
+            
+            if monitor.nvidia_available:
+                monitor.get_nvidia_info()
+                assert mock_pynvml.nvmlDeviceGetHandleByIndex.call_count == 1
+                assert mock_pynvml.nvmlDeviceGetName.call_count == 1
+                assert info['name'] == 'NVIDIA GeForce RTX 3080'
+
+
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open, read_data='0x10de')
+    def test_unsupported_nvml_query_not_retried(self, mock_file, mock_exists, mock_subprocess):
+        """Test a query failing with NVML_ERROR_NOT_SUPPORTED is skipped on later polls."""
+        mock_exists.return_value = True
+        
+        class NVMLError(Exception):
+            def __init__(self, value):
+                self.value = value
+        
+        mock_pynvml = MagicMock()
+        mock_pynvml.nvmlDeviceGetCount.return_value = 1
+        mock_pynvml.nvmlDeviceGetName.return_value = 'Tesla T4'
+        mock_pynvml.NVML_ERROR_NOT_SUPPORTED = 3
+        mock_pynvml.nvmlDeviceGetPowerUsage.side_effect = NVMLError(3)
+        mock_pynvml.nvmlDeviceGetClockInfo.side_effect = NVMLError(999)  # Transient error
+        
+        with patch.dict('sys.modules', {'pynvml': mock_pynvml}), \
+                patch('monitors.gpu_monitor._nvml_loadable', return_value=True):
+            monitor = GPUMonitor(poll_interval=0)
+            monitor.get_nvidia_info()
+            info = monitor.get_nvidia_info()
+        
+        assert info['power'] == 0
+        assert info['gpu_clock'] == 0
+        assert mock_pynvml.nvmlDeviceGetPowerUsage.call_count == 1
+        assert mock_pynvml.nvmlDeviceGetClockInfo.call_count == 2
+
+
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open, read_data='0x10de')
+    def test_pynvml_not_imported_without_driver_library(self, mock_file, mock_exists, mock_subprocess):
+        """Test pynvml is not imported when libnvidia-ml cannot be loaded."""
+        mock_exists.return_value = True
+        mock_pynvml = MagicMock()
+        
+        with patch.dict('sys.modules', {'pynvml': mock_pynvml}), \
+                patch('monitors.gpu_monitor._nvml_loadable', return_value=False):
+            monitor = GPUMonitor()
+        
+        assert monitor.gpu_type == 'nvidia'
+        assert not monitor.nvidia_available
+        mock_pynvml.nvmlInit.assert_not_called()
 
 
 class TestGPUMonitorAMDMethods:
@@ -298,9 +602,11 @@ class TestGPUMonitorAMDMethods:
     @patch('monitors.gpu_monitor.subprocess.run')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data='0x1002')
-    def test_get_amd_info_basic(self, mock_file, mock_exists, mock_subprocess):
+    def test_get_amd_info_basic(self, mock_file, mock_exists, mock_subprocess, no_gpu_tools_on_path):
         """Test basic AMD GPU info retrieval."""
-        mock_exists.return_value = True
+        # No amdgpu counters: rocm-smi fallback
+        mock_exists.side_effect = lambda path: not path.endswith('gpu_busy_percent')
+        no_gpu_tools_on_path.side_effect = lambda tool: '/opt/rocm/bin/rocm-smi' if tool == 'rocm-smi' else None
         
         # Mock rocm-smi output
         rocm_output = """
@@ -318,6 +624,122 @@ GPU[0]		: Memory Activity (%): 15
         
         info = monitor.get_amd_info()
         assert isinstance(info, dict)
+        assert mock_subprocess.call_args[0][0][0] == '/opt/rocm/bin/rocm-smi'
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_amd_without_rocm_smi_spawns_nothing(self, mock_exists, mock_subprocess, no_gpu_tools_on_path):
+        """Test a missing rocm-smi is looked up once and never spawned per poll."""
+        mock_exists.return_value = False
+        with patch('monitors.gpu_monitor._scan_drm_cards', return_value=[(0, 0x1002)]):
+            monitor = GPUMonitor(poll_interval=0)
+        assert monitor.amd_available
+        
+        mock_subprocess.reset_mock()
+        assert monitor.get_amd_info() == {}
+        assert monitor.get_amd_info() == {}
+        mock_subprocess.assert_not_called()
+        assert no_gpu_tools_on_path.call_args_list.count((('rocm-smi',),)) == 1
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    def test_get_amd_info_from_sysfs(self, mock_subprocess, tmp_path):
+        """Test amdgpu sysfs and hwmon counters are read without running rocm-smi."""
+        device = tmp_path / 'card0' / 'device'
+        (device / 'hwmon' / 'hwmon3').mkdir(parents=True)
+        (device / 'vendor').write_text('0x1002\n')
+        (device / 'gpu_busy_percent').write_text('37\n')
+        (device / 'mem_info_vram_used').write_text(f'{512 * 1024 * 1024}\n')
+        (device / 'mem_info_vram_total').write_text(f'{8192 * 1024 * 1024}\n')
+        (device / 'hwmon' / 'hwmon3' / 'temp1_input').write_text('52000\n')
+        (device / 'hwmon' / 'hwmon3' / 'power1_average').write_text('45000000\n')
+        
+        with patch('monitors.gpu_monitor._DRM_DIR', str(tmp_path)), \
+                patch('monitors.gpu_monitor._scan_drm_cards', return_value=[(0, 0x1002)]):
+            monitor = GPUMonitor()
+        
+        assert monitor.gpu_type == 'amd'
+        mock_subprocess.reset_mock()
+        assert monitor.get_amd_info() == {
+            'name': 'AMD GPU',
+            'gpu_util': 37,
+            'memory_used': 512,
+            'memory_total': 8192,
+            'temperature': 52.0,
+            'power': 45.0
+        }
+        mock_subprocess.assert_not_called()
+
+
+class TestGPUMonitorPollInterval:
+    """Test results are reused within the poll interval."""
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_info_reused_within_poll_interval(self, mock_exists, mock_subprocess):
+        """Test get_intel_info reads the GPU at most once per poll interval."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor(poll_interval=2.0)
+        
+        with patch.object(monitor, '_collect_intel', side_effect=[{'gpu_util': 10}, {'gpu_util': 20}]), \
+                patch('monitors.gpu_monitor.time.monotonic', side_effect=[100.0, 101.5, 102.0]):
+            first = monitor.get_intel_info()
+            first['id'] = 0  # Callers' additions must not leak into the cache
+            assert monitor.get_intel_info() == {'gpu_util': 10}
+            assert monitor.get_intel_info() == {'gpu_util': 20}
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_poll_interval_from_environment(self, mock_exists, mock_subprocess):
+        """Test GPU_POLL_INTERVAL_SECONDS sets the default poll interval."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        
+        with patch.dict(os.environ, {'GPU_POLL_INTERVAL_SECONDS': '5'}):
+            assert GPUMonitor().poll_interval == 5.0
+        with patch.dict(os.environ, {'GPU_POLL_INTERVAL_SECONDS': 'fast'}):
+            assert GPUMonitor().poll_interval == 0.5
+
+
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_background_refresh_publishes_snapshot(self, mock_exists, mock_subprocess):
+        """Test the refresh thread re-reads the GPU and callers get its snapshot."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor(poll_interval=0.01, background=True)
+        
+        readings = iter(range(1000))
+        with patch.object(monitor, '_collect_intel', side_effect=lambda: {'gpu_util': next(readings)}):
+            assert monitor.get_intel_info() == {'gpu_util': 0}  # First call reads inline
+            
+            deadline = time.monotonic() + 5.0
+            while monitor.get_intel_info()['gpu_util'] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert monitor.get_intel_info()['gpu_util'] > 0
+            
+            monitor.close()
+        assert monitor._worker is None
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_background_thread_ends_with_unreferenced_monitor(self, mock_exists, mock_subprocess):
+        """Test the refresh thread does not keep a dropped monitor alive."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor(poll_interval=0.01, background=True)
+        monitor._collect_intel = lambda: {'gpu_util': 1}
+        monitor.get_intel_info()
+        worker = monitor._worker
+        monitor_ref = weakref.ref(monitor)
+        
+        del monitor
+        deadline = time.monotonic() + 5.0
+        while worker.is_alive() and time.monotonic() < deadline:
+            gc.collect()  # The monitor holds bound methods of itself
+            worker.join(timeout=0.05)
+        assert not worker.is_alive()
+        assert monitor_ref() is None
 
 
 class TestGPUMonitorGetAllInfo:
@@ -364,6 +786,49 @@ class TestGPUMonitorGetAllInfo:
         
         assert isinstance(info, dict)
 
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_get_all_info_lists_every_nvidia_device(self, mock_exists, mock_subprocess):
+        """Test each NVML device is reported, in device order."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor()
+        monitor.gpu_type = 'nvidia'
+        monitor.nvidia_available = True
+        monitor.device_count = 3
+        
+        with patch.object(monitor, 'get_nvidia_info', side_effect=lambda i: {'gpu_util': i * 10}):
+            info = monitor.get_all_info()
+            executor = monitor._executor
+            monitor.get_all_info()
+        
+        assert info['available']
+        assert [(gpu['id'], gpu['type'], gpu['gpu_util']) for gpu in info['gpus']] == [
+            (0, 'nvidia', 0), (1, 'nvidia', 10), (2, 'nvidia', 20)]
+        assert executor is not None and monitor._executor is executor  # One pool, reused
+        monitor.close()
+        assert monitor._executor is None
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    @patch('os.path.exists')
+    def test_get_all_info_background_publishes_every_gpu(self, mock_exists, mock_subprocess):
+        """Test a background monitor records each GPU once, without a thread pool."""
+        mock_exists.return_value = False
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        monitor = GPUMonitor(poll_interval=60, background=True)
+        monitor.gpu_type = 'nvidia'
+        monitor.nvidia_available = True
+        monitor.device_count = 3
+        monitor._collect_nvidia_info = lambda i: {'gpu_util': i * 10}
+        
+        info = monitor.get_all_info()
+        
+        assert [gpu['gpu_util'] for gpu in info['gpus']] == [0, 10, 20]
+        assert set(monitor._snapshot) == set(monitor._collectors) == {('nvidia', i) for i in range(3)}
+        assert monitor._executor is None
+        monitor.close()
+
 
 class TestGPUMonitorHelperMethods:
     """Test helper methods."""
@@ -406,6 +871,52 @@ class TestGPUMonitorHelperMethods:
         assert monitor.gpu_type is None or isinstance(monitor.gpu_type, str)
 
 
+class TestGPUMonitorPciName:
+    """Test PCI address lookup and lspci caching."""
+    
+    def test_read_pci_slot_name(self, tmp_path):
+        """Test PCI_SLOT_NAME is taken from the uevent file."""
+        uevent = tmp_path / 'uevent'
+        uevent.write_text('DRIVER=xe\nPCI_CLASS=30000\nPCI_SLOT_NAME=0000:00:02.0\nMODALIAS=pci:v8086\n')
+        assert _read_pci_slot_name(str(uevent)) == '0000:00:02.0'
+        
+        uevent.write_text('DRIVER=xe\n')
+        assert _read_pci_slot_name(str(uevent)) is None
+    
+    @patch('monitors.gpu_monitor.subprocess.run')
+    def test_lspci_run_once_per_address(self, mock_subprocess):
+        """Test lspci output is cached per PCI address."""
+        _lspci.cache_clear()
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout='01:00.0 VGA: NVIDIA [GeForce]')
+        
+        assert _lspci('0000:01:00.0') == '01:00.0 VGA: NVIDIA [GeForce]'
+        assert _lspci('0000:01:00.0') == '01:00.0 VGA: NVIDIA [GeForce]'
+        
+        assert mock_subprocess.call_count == 1
+        _lspci.cache_clear()
+
+
+class TestGPUMonitorDrmScan:
+    """Test the /sys/class/drm card scan."""
+    
+    def test_scan_drm_cards(self, tmp_path):
+        """Test cards are listed with vendor IDs and connector nodes are skipped."""
+        for card, vendor in (('card1', '0x8086\n'), ('card0', '10de\n')):
+            (tmp_path / card / 'device').mkdir(parents=True)
+            (tmp_path / card / 'device' / 'vendor').write_text(vendor)
+        (tmp_path / 'card1-eDP-1').mkdir()
+        (tmp_path / 'renderD128').mkdir()
+        (tmp_path / 'card2').mkdir()  # No vendor file
+        
+        with patch('monitors.gpu_monitor._DRM_DIR', str(tmp_path)):
+            assert _scan_drm_cards() == [(0, 0x10de), (1, 0x8086)]
+    
+    def test_scan_without_drm_dir(self, tmp_path):
+        """Test a missing /sys/class/drm yields no cards."""
+        with patch('monitors.gpu_monitor._DRM_DIR', str(tmp_path / 'missing')):
+            assert _scan_drm_cards() == []
+
+
 class TestGPUMonitorEdgeCases:
     """Test edge cases and error handling."""
     